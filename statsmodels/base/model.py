@@ -156,6 +156,84 @@ class Model(object):
         raise NotImplementedError
 
 
+class _LoglikeDerivatives(object):
+    """
+    One entry cache for the loglikelihood and its derivatives
+
+    Models that can compute the loglikelihood, score and Hessian with shared
+    intermediate results, for example the linear predictor, define
+    ``_loglike_derivs(params, order)``. It returns the list
+    ``[loglike, score, hessian][:order + 1]``.
+
+    The values at the most recently requested params are kept, so the
+    optimizers can call loglike, score and hessian at the same params without
+    recomputing. `min_order` is the smallest order that is computed on a
+    cache miss. It is 2 for Newton, where the Hessian and the score are
+    always needed at the same point, and 1 for the gradient based
+    optimizers.
+    """
+
+    def __init__(self, model, min_order=0):
+        self.model = model
+        self.min_order = min_order
+        self.params = None
+        self.order = -1
+        self.values = None
+
+    def __call__(self, params, order):
+        params = np.asarray(params)
+        if (self.params is None or order > self.order or
+                params.shape != self.params.shape or
+                not np.array_equal(params, self.params)):
+            order = max(order, self.min_order)
+            self.values = self.model._loglike_derivs(params, order)
+            self.params = params.copy()
+            self.order = order
+        return self.values
+
+    def loglike(self, params):
+        return self(params, 0)[0]
+
+    def score(self, params):
+        return self(params, 1)[1]
+
+    def hessian(self, params):
+        return self(params, 2)[2]
+
+
+def _defining_class(klass, name):
+    """
+    The class in the MRO of `klass` that defines the attribute `name`
+    """
+    for base in klass.__mro__:
+        if name in base.__dict__:
+            return base
+    return None
+
+
+def _uses_loglike_derivs(model):
+    """
+    Whether the joint evaluation `_loglike_derivs` can replace the loglike,
+    score and hessian methods of `model`
+
+    This requires that all three methods are bound methods of the model
+    defined in the same class as `_loglike_derivs`. Subclasses that
+    override any of them, for example to add a penalty, are evaluated with
+    their own methods.
+    """
+    owner = _defining_class(type(model), '_loglike_derivs')
+    if owner is None:
+        return False
+    for name in ('loglike', 'score', 'hessian'):
+        meth = getattr(model, name, None)
+        func = getattr(meth, '__func__', None)
+        if func is None or getattr(meth, '__self__', None) is not model:
+            return False
+        if _defining_class(type(model), func.__name__) is not owner:
+            return False
+    return True
+
+
 class LikelihoodModel(Model):
     """
     Likelihood model is a subclass of Model.
@@ -378,17 +456,33 @@ class LikelihoodModel(Model):
         # user-supplied and numerically evaluated estimate frprime doesn't take
         # args in most (any?) of the optimize function
 
+        # Models with a joint evaluation of the loglikelihood and its
+        # derivatives share the computations between the calls at the same
+        # params
+        if not fargs and _uses_loglike_derivs(self):
+            if method == 'newton':
+                min_order = 2
+            elif method in ('bfgs', 'lbfgs', 'cg', 'ncg'):
+                min_order = 1
+            else:
+                min_order = 0
+            derivs = _LoglikeDerivatives(self, min_order=min_order)
+            loglike, score_, hessian = (derivs.loglike, derivs.score,
+                                        derivs.hessian)
+        else:
+            loglike, score_, hessian = self.loglike, self.score, self.hessian
+
         nobs = self.endog.shape[0]
-        f = lambda params, *args: -self.loglike(params, *args) / nobs
-        score = lambda params: -self.score(params) / nobs
+        f = lambda params, *args: -loglike(params, *args) / nobs
+        score = lambda params: -score_(params) / nobs
         try:
-            hess = lambda params: -self.hessian(params) / nobs
+            hess = lambda params: -hessian(params) / nobs
         except:
             hess = None
 
         if method == 'newton':
-            score = lambda params: self.score(params) / nobs
-            hess = lambda params: self.hessian(params) / nobs
+            score = lambda params: score_(params) / nobs
+            hess = lambda params: hessian(params) / nobs
             #TODO: why are score and hess positive?
 
         warn_convergence = kwargs.pop('warn_convergence', True)
@@ -413,7 +507,7 @@ class LikelihoodModel(Model):
             Hinv = np.linalg.inv(-retvals['Hessian']) / nobs
         elif not skip_hessian:
             try:
-                Hinv = np.linalg.inv(-1 * self.hessian(xopt))
+                Hinv = np.linalg.inv(-1 * hessian(xopt))
             except:
                 #might want custom warning ResultsWarning? NumericalWarning?
                 from warnings import warn
@@ -459,6 +459,9 @@ def _fit_ncg(f, score, start_params, fargs, kwargs, disp=True,
     fhess_p = kwargs.setdefault('fhess_p', None)
     avextol = kwargs.setdefault('avextol', 1.0000000000000001e-05)
     epsilon = kwargs.setdefault('epsilon', 1.4901161193847656e-08)
+    if fhess_p is not None:
+        # fmin_ncg ignores fhess_p if fhess is given
+        hess = None
     retvals = optimize.fmin_ncg(f, start_params, score, fhess_p=fhess_p,
                                 fhess=hess, args=fargs, avextol=avextol,
                                 epsilon=epsilon, maxiter=maxiter,
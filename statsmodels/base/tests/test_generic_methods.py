@@ -314,5 +314,43 @@ class TestGenericGEEPoissonBC(CheckGenericMixin):
                                cov_type='bias_reduced')
 
 
+def test_wrapper_cache():
+    import pandas as pd
+    from statsmodels.compat.python import cPickle
+    np.random.seed(987689)
+    exog = pd.DataFrame(sm.add_constant(np.random.randn(50, 2)),
+                        columns=['const', 'x1', 'x2'])
+    endog = pd.Series(exog.sum(1) + np.random.randn(50))
+    res = sm.OLS(endog, exog).fit()
+
+    bse = res.bse
+    assert_(isinstance(bse, pd.Series))
+    assert_(res._wrapped_cache['bse'][2] is not bse)
+    assert_allclose(res.bse, bse, rtol=1e-13)
+
+    # changes to the returned object do not carry over to later accesses
+    params = res.params
+    params.name = 'changed'
+    params.index = ['a', 'b', 'c']
+    assert_(res.params.name is None)
+    assert_(list(res.params.index) == ['const', 'x1', 'x2'])
+
+    # resetting the results cache or reassigning rebuilds the wrapped output
+    wrapped = res._wrapped_cache['bse'][2]
+    res._results._cache['bse'] = None
+    bse2 = res.bse
+    assert_(res._wrapped_cache['bse'][2] is not wrapped)
+    assert_allclose(bse2, res._results.bse, rtol=1e-13)
+
+    params = res.params
+    res._results.params = 2 * res._results.params
+    assert_allclose(res.params, 2 * params, rtol=1e-13)
+
+    # wrapped outputs are not pickled
+    res2 = cPickle.loads(cPickle.dumps(res))
+    assert_('_wrapped_cache' not in res2.__getstate__())
+    assert_allclose(res2.bse, bse, rtol=1e-13)
+
+
 if __name__ == '__main__':
     pass
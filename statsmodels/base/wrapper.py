@@ -3,6 +3,7 @@ import functools
 
 import numpy as np
 from statsmodels.compat.python import get_function_name, iteritems
+from statsmodels.tools.data import _is_using_pandas
 
 class ResultsWrapper(object):
     """
@@ -14,6 +15,7 @@ class ResultsWrapper(object):
 
     def __init__(self, results):
         self._results = results
+        self._wrapped_cache = {}
         self.__doc__ = results.__doc__
 
     def __dir__(self):
@@ -33,22 +35,46 @@ class ResultsWrapper(object):
             pass
 
         obj = getattr(results, attr)
-        data = results.model.data
         how = self._wrap_attrs.get(attr)
-        if how and isinstance(how, tuple):
-            obj = data.wrap_output(obj, how[0], *how[1:])
-        elif how:
-            obj = data.wrap_output(obj, how=how)
-
-        return obj
+        if not how:
+            return obj
+
+        # Reuse the wrapped output as long as the results instance returns
+        # the same object, i.e. until the entry in its _cache is reset or
+        # the attribute is reassigned.  Callers get a shallow copy, so that
+        # changing the name, index or order of the returned pandas object
+        # does not carry over to later accesses.  The values are shared
+        # with the results instance, as without the cache.
+        try:
+            wrapped_cache = get('_wrapped_cache')
+        except AttributeError:
+            wrapped_cache = self._wrapped_cache = {}
+        data = results.model.data
+        cached = wrapped_cache.get(attr)
+        if cached is not None and cached[0] is obj and cached[1] is data:
+            wrapped = cached[2]
+        else:
+            if isinstance(how, tuple):
+                wrapped = data.wrap_output(obj, how[0], *how[1:])
+            else:
+                wrapped = data.wrap_output(obj, how=how)
+            wrapped_cache[attr] = (obj, data, wrapped)
+
+        if _is_using_pandas(wrapped, None):
+            wrapped = wrapped.copy(deep=False)
+        return wrapped
 
     def __getstate__(self):
         #print 'pickling wrapper', self.__dict__
-        return self.__dict__
+        # the wrapped outputs are rebuilt on demand, don't pickle them
+        state = self.__dict__.copy()
+        state.pop('_wrapped_cache', None)
+        return state
 
     def __setstate__(self, dict_):
         #print 'unpickling wrapper', dict_
         self.__dict__.update(dict_)
+        self._wrapped_cache = {}
 
     def save(self, fname, remove_data=False):
         '''save a pickle of this instance
@@ -68,6 +94,7 @@ class ResultsWrapper(object):
 
         if remove_data:
             self.remove_data()
+            self._wrapped_cache = {}
 
         save_pickle(self, fname)
 
@@ -104,6 +104,15 @@ _l1_results_attr = """    nnz_params : Integer
     trimmed : Boolean array
         trimmed[i] == True if the ith parameter was trimmed from the model."""
 
+def _score_hessian(exog, resid, weights):
+    """
+    Returns exog' resid and -exog' diag(weights) exog
+
+    Both are computed from a single product with exog'.
+    """
+    m = np.dot(exog.T, np.column_stack((resid, weights[:, None] * exog)))
+    return m[:, 0], -m[:, 1:]
+
 #### Private Model Classes ####
 
 
@@ -524,10 +533,24 @@ class MultinomialModel(BinaryModel):
         else:
             start_params = np.asarray(start_params)
         callback = lambda x : None # placeholder until check_perfect_pred
+        use_hessian_vector = (method == 'ncg' and
+                              hasattr(self, 'hessian_vector') and
+                              kwargs.get('fhess_p') is None)
+        if use_hessian_vector:
+            # Newton-CG only needs Hessian-vector products, this avoids
+            # the (J*K, J*K) Hessian in the optimization
+            nobs = self.endog.shape[0]
+            kwargs['fhess_p'] = (lambda params, vec:
+                                 -self.hessian_vector(params, vec) / nobs)
         # skip calling super to handle results from LikelihoodModel
         mnfit = base.LikelihoodModel.fit(self, start_params = start_params,
                 method=method, maxiter=maxiter, full_output=full_output,
                 disp=disp, callback=callback, **kwargs)
+        # the placeholder callback and the Hessian-vector closure cannot be
+        # pickled with the results
+        mnfit.mle_settings['callback'] = None
+        if use_hessian_vector:
+            mnfit.mle_settings['fhess_p'] = None
         mnfit.params = mnfit.params.reshape(self.K, -1, order='F')
         mnfit = MultinomialResults(self, mnfit)
         return MultinomialResultsWrapper(mnfit)
@@ -1121,6 +1144,26 @@ class Poisson(CountModel):
         L = np.exp(np.dot(X,params) + exposure + offset)
         return -np.dot(L*X.T, X)
 
+    def _loglike_derivs(self, params, order=2):
+        """
+        Loglikelihood, score and, if order is 2, Hessian of the Poisson model
+
+        The linear predictor and its exponential are computed once for all
+        of them.
+        """
+        offset = getattr(self, "offset", 0)
+        exposure = getattr(self, "exposure", 0)
+        X = self.exog
+        endog = self.endog
+        XB = np.dot(X, params) + offset + exposure
+        L = np.exp(XB)
+        out = [np.sum(-L + endog*XB - gammaln(endog+1))]
+        if order == 1:
+            out.append(np.dot(endog - L, X))
+        elif order > 1:
+            out.extend(_score_hessian(X, endog - L, L))
+        return out
+
 class Logit(BinaryModel):
     __doc__ = """
     Binary choice logit model
@@ -1316,6 +1359,25 @@ class Logit(BinaryModel):
         L = self.cdf(np.dot(X,params))
         return -np.dot(L*(1-L)*X.T,X)
 
+    def _loglike_derivs(self, params, order=2):
+        """
+        Loglikelihood, score and, if order is 2, Hessian of the logit model
+
+        The linear predictor is computed once for all of them.
+        """
+        X = self.exog
+        y = self.endog
+        XB = np.dot(X, params)
+        q = 2*y - 1
+        out = [np.sum(np.log(self.cdf(q*XB)))]
+        if order > 0:
+            L = self.cdf(XB)
+            if order == 1:
+                out.append(np.dot(y - L, X))
+            else:
+                out.extend(_score_hessian(X, y - L, L*(1-L)))
+        return out
+
     def fit(self, start_params=None, method='newton', maxiter=35,
             full_output=1, disp=1, callback=None, **kwargs):
         bnryfit = super(Logit, self).fit(start_params=start_params,
@@ -1539,6 +1601,28 @@ class Probit(BinaryModel):
         L = q*self.pdf(q*XB)/self.cdf(q*XB)
         return np.dot(-L*(L+XB)*X.T,X)
 
+    def _loglike_derivs(self, params, order=2):
+        """
+        Loglikelihood, score and, if order is 2, Hessian of the probit model
+
+        The linear predictor, cdf and pdf are computed once for all of them.
+        """
+        X = self.exog
+        XB = np.dot(X, params)
+        q = 2*self.endog - 1
+        cdf = self.cdf(q*XB)
+        out = [np.sum(np.log(np.clip(cdf, FLOAT_EPS, 1)))]
+        if order > 0:
+            pdf = q*self.pdf(q*XB)
+            # clip to get rid of invalid divide complaint
+            L = pdf/np.clip(cdf, FLOAT_EPS, 1 - FLOAT_EPS)
+            if order == 1:
+                out.append(np.dot(L, X))
+            else:
+                Lh = pdf/cdf
+                out.extend(_score_hessian(X, L, Lh*(Lh+XB)))
+        return out
+
     def fit(self, start_params=None, method='newton', maxiter=35,
             full_output=1, disp=1, callback=None, **kwargs):
         bnryfit = super(Probit, self).fit(start_params=start_params,
@@ -1781,26 +1865,66 @@ class MNLogit(MultinomialModel):
         The actual Hessian matrix has J**2 * K x K elements. Our Hessian
         is reshaped to be square (J*K, J*K) so that the solvers can use it.
 
-        This implementation does not take advantage of the symmetry of
-        the Hessian and could probably be refactored for speed.
+        Only the blocks with j <= l are computed, the others follow from
+        symmetry. The observations are processed in chunks, and for each j
+        the weighted cross products of all blocks l >= j are formed in a
+        single matrix product.
         """
         params = params.reshape(self.K, -1, order='F')
         X = self.exog
-        pr = self.cdf(np.dot(X,params))
-        partials = []
         J = self.wendog.shape[1] - 1
         K = self.exog.shape[1]
-        for i in range(J):
-            for j in range(J): # this loop assumes we drop the first col.
-                if i == j:
-                    partials.append(\
-                        -np.dot(((pr[:,i+1]*(1-pr[:,j+1]))[:,None]*X).T,X))
-                else:
-                    partials.append(-np.dot(((pr[:,i+1]*-pr[:,j+1])[:,None]*X).T,X))
-        H = np.array(partials)
         # the developer's notes on multinomial should clear this math up
-        H = np.transpose(H.reshape(J,J,K,K), (0,2,1,3)).reshape(J*K,J*K)
-        return H
+        H = np.zeros((J, K, J, K))
+        chunksize = max(1, 2**20 // (J * K))
+        for start in range(0, X.shape[0], chunksize):
+            Xc = X[start:start + chunksize]
+            # this assumes we drop the first col.
+            pr = self.cdf(np.dot(Xc, params))[:, 1:]
+            for i in range(J):
+                # X' diag(pr_i * pr_l) X for l >= i
+                w = (pr[:, i:i+1] * pr[:, i:])[:, :, None] * Xc[:, None, :]
+                H[i, :, i:, :] += np.dot(Xc.T, w.reshape(len(Xc), -1)
+                                         ).reshape(K, J - i, K)
+                H[i, :, i, :] -= np.dot((pr[:, i, None] * Xc).T, Xc)
+        for i in range(J):
+            for j in range(i):
+                H[i, :, j, :] = H[j, :, i, :].T
+        return H.reshape(J*K, J*K)
+
+    def hessian_vector(self, params, vec):
+        """
+        Product of the Hessian of the log-likelihood with a vector
+
+        Parameters
+        -----------
+        params : array-like
+            The parameters of the model
+        vec : array-like
+            A vector with the same shape as the flattened params
+
+        Returns
+        -------
+        hessvec : ndarray, (J*K,)
+            The product dot(hessian(params), vec), computed without forming
+            the Hessian.
+
+        Notes
+        -----
+        With :math:`V` the (K, J) reshaped `vec`, column `j` of the
+        product is
+
+        .. math:: -\\sum_{i}p_{ij}\\left(x_{i}^{\\prime}V_{j}-\\sum_{l}p_{il}x_{i}^{\\prime}V_{l}\\right)x_{i}
+
+        which requires two passes over `exog`.
+        """
+        params = params.reshape(self.K, -1, order='F')
+        vec = np.asarray(vec).reshape(self.K, -1, order='F')
+        X = self.exog
+        pr = self.cdf(np.dot(X, params))[:, 1:]
+        XV = np.dot(X, vec)
+        u = pr * (XV - (pr * XV).sum(1)[:, None])
+        return -np.dot(X.T, u).flatten(order='F')
 
 
 #TODO: Weibull can replaced by a survival analsysis function
@@ -2193,6 +2317,74 @@ class NegativeBinomial(CountModel):
 
         return hess_arr
 
+    def _loglike_derivs(self, params, order=2):
+        """
+        Loglikelihood, score and, if order is 2, Hessian
+
+        For NB2 the expected value and the terms shared by the derivatives
+        are computed once. The other loglike_methods evaluate loglike, score
+        and hessian separately.
+        """
+        if self.loglike_method != 'nb2':
+            out = [self.loglike(params)]
+            if order > 0:
+                out.append(self.score(params))
+            if order > 1:
+                out.append(self.hessian(params))
+            return out
+
+        if self._transparams: # lnalpha came in during fit
+            alpha = np.exp(params[-1])
+        else:
+            alpha = params[-1]
+        a1 = 1/alpha
+        exog = self.exog
+        y = self.endog
+        mu = self.predict(params[:-1])
+
+        prob = a1/(a1+mu)
+        llf = np.sum(gammaln(a1+y) - gammaln(y+1) - gammaln(a1) +
+                     a1*np.log(prob) + y*np.log(1-prob))
+        out = [llf]
+        if order == 0:
+            return out
+
+        # for dl/dalpha
+        da1 = -alpha**-2
+        dalpha_i = da1 * (special.digamma(a1+y) - special.digamma(a1) +
+                          np.log(a1) - np.log(a1+mu) - (a1+y)/(a1+mu) + 1)
+        dalpha = dalpha_i.sum()
+        resid = a1 * (y-mu)/(mu+a1)
+
+        if order == 1:
+            dparams = np.dot(resid, exog)
+        else:
+            # dl/dparams, dl/dparams dalpha and dl/dparams dparams
+            dim = exog.shape[1]
+            w = np.column_stack((resid, mu*(y-mu)*da1/(mu+a1)**2,
+                                 (-a1*mu*(a1+y)/(mu+a1)**2)[:,None] * exog))
+            m = np.dot(exog.T, w)
+            dparams = m[:,0]
+
+            hess_arr = np.empty((dim+1,dim+1))
+            hess_arr[:-1,:-1] = m[:,2:]
+            hess_arr[-1,:-1] = m[:,1]
+            hess_arr[:-1,-1] = m[:,1]
+            #NOTE: polygamma(1,x) is the trigamma function
+            da2 = 2*alpha**-3
+            hess_arr[-1,-1] = (da2 * dalpha_i/da1 + da1**2 *
+                               (special.polygamma(1, a1+y) -
+                                special.polygamma(1, a1) + 1/a1 -
+                                1/(a1 + mu) + (y - mu)/(mu + a1)**2)).sum()
+
+        if self._transparams:
+            out.append(np.r_[dparams, dalpha*alpha])
+        else:
+            out.append(np.r_[dparams, dalpha])
+        if order > 1:
+            out.append(hess_arr)
+        return out
+
     #TODO: replace this with analytic where is it used?
     def score_obs(self, params):
         sc = approx_fprime_cs(params, self.loglikeobs)
@@ -8,7 +8,7 @@ in the Stata *.dta -> *.csv output, NOT the estimator for the Poisson
 tests.
 """
 # pylint: disable-msg=E1101
-from statsmodels.compat.python import range
+from statsmodels.compat.python import range, cPickle, BytesIO
 import os
 import numpy as np
 from numpy.testing import (assert_, assert_raises, assert_almost_equal,
@@ -18,6 +18,7 @@ from numpy.testing import (assert_, assert_raises, assert_almost_equal,
 from statsmodels.discrete.discrete_model import (Logit, Probit, MNLogit,
                                                  Poisson, NegativeBinomial)
 from statsmodels.discrete.discrete_margins import _iscount, _isdummy
+from statsmodels.base.model import _uses_loglike_derivs
 import statsmodels.api as sm
 from nose import SkipTest
 from .results.results_discrete import Spector, DiscreteL1, RandHIE, Anes
@@ -500,12 +501,12 @@ class TestCVXOPT(object):
     def test_cvxopt_versus_slsqp(self):
         #Compares resutls from cvxopt to the standard slsqp
         if has_cvxopt:
-            self.alpha = 3. * np.array([0, 1, 1, 1.]) #/ self.data.endog.shape[0]
+            self.pen_weight = 3. * np.array([0, 1, 1, 1.]) #/ self.data.endog.shape[0]
             res_slsqp = Logit(self.data.endog, self.data.exog).fit_regularized(
-                method="l1", alpha=self.alpha, disp=0, acc=1e-10, maxiter=1000,
+                method="l1", alpha=self.pen_weight, disp=0, acc=1e-10, maxiter=1000,
                 trim_mode='auto')
             res_cvxopt = Logit(self.data.endog, self.data.exog).fit_regularized(
-                method="l1_cvxopt_cp", alpha=self.alpha, disp=0, abstol=1e-10,
+                method="l1_cvxopt_cp", alpha=self.pen_weight, disp=0, abstol=1e-10,
                 trim_mode='auto', auto_trim_tol=0.01, maxiter=1000)
             assert_almost_equal(res_slsqp.params, res_cvxopt.params, DECIMAL_4)
         else:
@@ -527,7 +528,7 @@ class TestSweepAlphaL1(object):
 
     def test_sweep_alpha(self):
         for i in range(3):
-            alpha = self.alphas[i, :]
+            alpha = self.pen_weights[i, :]
             res2 = self.model.fit_regularized(
                     method="l1", alpha=alpha, disp=0, acc=1e-10,
                     trim_mode='off', maxiter=1000)
@@ -1267,6 +1268,112 @@ class TestMNLogitLBFGSBaseZero(CheckMNLogitBaseZero):
         cls.res2 = res2
 
 
+def test_loglike_derivs():
+    # the joint evaluation agrees with loglike, score and hessian
+    np.random.seed(71234)
+    nobs = 200
+    exog = sm.add_constant(np.random.randn(nobs, 2), prepend=False)
+    xb = np.dot(exog, [0.5, -0.5, 0.2])
+    y_bin = (xb + np.random.logistic(size=nobs) > 0).astype(float)
+    y_count = np.random.poisson(np.exp(xb))
+    params = np.array([0.3, -0.2, 0.1])
+
+    models = [(Logit(y_bin, exog), params),
+              (Probit(y_bin, exog), params),
+              (Poisson(y_count, exog, offset=0.1*exog[:, 0]), params),
+              (NegativeBinomial(y_count, exog), np.r_[params, 0.5])]
+    for mod, p in models:
+        for order in range(3):
+            res = mod._loglike_derivs(p, order)
+            assert_equal(len(res), order + 1)
+            assert_allclose(res[0], mod.loglike(p), rtol=1e-12)
+            if order > 0:
+                assert_allclose(res[1], mod.score(p), rtol=1e-10)
+            if order > 1:
+                assert_allclose(res[2], mod.hessian(p), rtol=1e-10)
+
+    # Newton evaluates all derivatives once per iteration and once at the
+    # optimum
+    mod = Logit(y_bin, exog)
+    calls = []
+    def derivs(params, order):
+        calls.append(order)
+        return Logit._loglike_derivs(mod, params, order)
+    mod._loglike_derivs = derivs
+    res_newton = mod.fit(method='newton', disp=0)
+    assert_equal(len(calls), res_newton.mle_retvals['iterations'] + 1)
+
+    for method in ['bfgs', 'ncg']:
+        res = Logit(y_bin, exog).fit(method=method, disp=0)
+        assert_allclose(res.params, res_newton.params, rtol=1e-4)
+
+def test_loglike_derivs_override():
+    # subclasses that override loglike, score or hessian are fit with their
+    # own methods and not with the joint evaluation of the parent class
+    class PenalizedPoisson(Poisson):
+        pen_weight = 5.
+
+        def loglike(self, params):
+            return (super(PenalizedPoisson, self).loglike(params) -
+                    0.5 * self.pen_weight * np.dot(params, params))
+
+        def score(self, params):
+            return (super(PenalizedPoisson, self).score(params) -
+                    self.pen_weight * params)
+
+        def hessian(self, params):
+            return (super(PenalizedPoisson, self).hessian(params) -
+                    self.pen_weight * np.eye(len(params)))
+
+    np.random.seed(71234)
+    nobs = 200
+    exog = sm.add_constant(np.random.randn(nobs, 2), prepend=False)
+    endog = np.random.poisson(np.exp(np.dot(exog, [0.5, -0.5, 0.2])))
+
+    assert_(_uses_loglike_derivs(Poisson(endog, exog)))
+    assert_(_uses_loglike_derivs(NegativeBinomial(endog, exog)))
+    mod = PenalizedPoisson(endog, exog)
+    assert_(not _uses_loglike_derivs(mod))
+    res_unpen = Poisson(endog, exog).fit(method='newton', disp=0)
+    for method in ['newton', 'bfgs', 'ncg']:
+        res = mod.fit(method=method, disp=0)
+        assert_allclose(mod.score(res.params), 0, atol=1e-4)
+        assert_(np.abs(res.params - res_unpen.params).max() > 1e-3)
+
+def test_mnlogit_hessian():
+    np.random.seed(9876)
+    nobs, K, J = 300, 3, 4
+    exog = sm.add_constant(np.random.randn(nobs, K - 1), prepend=False)
+    endog = np.random.randint(0, J + 1, size=nobs)
+    mod = MNLogit(endog, exog)
+    params = np.random.randn(K * J) / 4
+
+    # reference with all J**2 blocks
+    pr = mod.cdf(np.dot(exog, params.reshape(K, -1, order='F')))
+    H = np.zeros((J, J, K, K))
+    for i in range(J):
+        for j in range(J):
+            w = pr[:, i+1] * ((i == j) - pr[:, j+1])
+            H[i, j] = -np.dot((w[:, None] * exog).T, exog)
+    H = np.transpose(H, (0, 2, 1, 3)).reshape(J*K, J*K)
+    assert_allclose(mod.hessian(params), H, rtol=1e-12, atol=1e-12)
+
+    vec = np.random.randn(K * J)
+    assert_allclose(mod.hessian_vector(params, vec), np.dot(H, vec),
+                    rtol=1e-12, atol=1e-12)
+
+    res1 = mod.fit(method='newton', disp=0)
+    res2 = mod.fit(method='ncg', disp=0, maxiter=100, avextol=1e-10)
+    assert_allclose(res2.params, res1.params, rtol=1e-5, atol=1e-7)
+
+    # the optimizer closures are not kept in the results
+    fh = BytesIO()
+    cPickle.dump(res2, fh, protocol=cPickle.HIGHEST_PROTOCOL)
+    fh.seek(0, 0)
+    res3 = cPickle.load(fh)
+    assert_allclose(res3.params, res2.params, rtol=1e-13)
+    assert_allclose(res3.bse, res2.bse, rtol=1e-13)
+
 def test_perfect_prediction():
     cur_dir = os.path.dirname(os.path.abspath(__file__))
     iris_dir = os.path.join(cur_dir, '..', '..', 'genmod', 'tests', 'results')
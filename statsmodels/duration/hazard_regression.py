@@ -167,6 +167,33 @@ class PHSurvivalTime(object):
         self.ufailt_ix, self.risk_enter, self.risk_exit, self.ufailt =\
             [], [], [], []
 
+        # The same information in array form, used to compute sums
+        # over the risk sets at all failure times with cumulative sums.
+        #
+        # enter_uft[stx] and exit_uft[stx] are the positions of the
+        # time and the entry time of each subject among the unique
+        # failure times.  A subject is in the risk set at the failure
+        # times exit_uft <= k <= enter_uft.
+        #
+        # risk_enter_pos[stx][k] is the first subject (in time order)
+        # that is in the risk set at or before the k^th unique failure
+        # time, risk_exit_pos[stx][k] is the first subject, in the
+        # order risk_exit_order[stx] of exit_uft, that enters the
+        # risk set after the k^th unique failure time.
+        # risk_exit_order[stx] is None if there is no left truncation.
+        #
+        # fail_ix[stx] are the indices of the subjects who fail, in
+        # time order, fail_uft[stx] the positions of their failure
+        # times, fail_start[stx][k] the position of the first failure
+        # at the k^th unique failure time in fail_ix[stx], and
+        # fail_tie[stx] is j / m for the j^th of the m failures tied
+        # at the same time.
+        self.enter_uft, self.exit_uft = [], []
+        self.risk_enter_pos, self.risk_exit_pos, self.risk_exit_order =\
+            [], [], []
+        self.fail_ix, self.fail_uft, self.fail_start, self.fail_tie =\
+            [], [], [], []
+
         for stx in range(self.nstrat):
 
             # All failure times
@@ -176,34 +203,49 @@ class PHSurvivalTime(object):
             # Unique failure times
             uft = np.unique(ft)
             nuft = len(uft)
+            nobs = len(self.time_s[stx])
+            uft_range = np.arange(nuft)
 
             # Indices of cases that fail at each unique failure time
-            #uft_map = {x:i for i,x in enumerate(uft)} # requires >=2.7
-            uft_map = dict([(x, i) for i,x in enumerate(uft)]) # 2.6
-            uft_ix = [[] for k in range(nuft)]
-            for ix,ti in zip(ift,ft):
-                uft_ix[uft_map[ti]].append(ix)
+            fail_uft = np.searchsorted(uft, ft)
+            fail_start = np.searchsorted(fail_uft, uft_range)
+            uft_ix = np.split(ift, fail_start[1:])
+            fail_count = np.diff(np.r_[fail_start, len(ift)])
+            fail_tie = ((np.arange(len(ift)) - fail_start[fail_uft]) /
+                        fail_count[fail_uft].astype(np.float64))
 
             # Indices of cases (failed or censored) that enter the
-            # risk set at each unique failure time.
-            risk_enter1 = [[] for k in range(nuft)]
-            for i,t in enumerate(self.time_s[stx]):
-                ix = np.searchsorted(uft, t, "right") - 1
-                if ix >= 0:
-                    risk_enter1[ix].append(i)
+            # risk set at each unique failure time.  The cases are
+            # sorted by time.
+            enter_uft = np.searchsorted(uft, self.time_s[stx], "right") - 1
+            risk_enter_pos = np.searchsorted(enter_uft, uft_range)
+            risk_enter1 = np.split(np.arange(nobs), risk_enter_pos)[1:]
 
             # Indices of cases (failed or censored) that exit the
             # risk set at each unique failure time.
-            risk_exit1 = [[] for k in range(nuft)]
-            for i,t in enumerate(self.entry_s[stx]):
-                ix = np.searchsorted(uft, t)
-                risk_exit1[ix].append(i)
+            exit_uft = np.searchsorted(uft, self.entry_s[stx])
+            exit_order = np.argsort(exit_uft, kind="mergesort")
+            risk_exit_pos = np.searchsorted(exit_uft[exit_order],
+                                            uft_range + 1)
+            risk_exit1 = np.split(exit_order, risk_exit_pos[:-1])
+            if risk_exit_pos[0] == nobs:
+                exit_order = None
 
             self.ufailt.append(uft)
             self.ufailt_ix.append([np.asarray(x, dtype=np.int32) for x in uft_ix])
             self.risk_enter.append([np.asarray(x, dtype=np.int32) for x in risk_enter1])
             self.risk_exit.append([np.asarray(x, dtype=np.int32) for x in risk_exit1])
 
+            self.enter_uft.append(enter_uft)
+            self.exit_uft.append(exit_uft)
+            self.risk_enter_pos.append(risk_enter_pos)
+            self.risk_exit_pos.append(risk_exit_pos)
+            self.risk_exit_order.append(exit_order)
+            self.fail_ix.append(ift)
+            self.fail_uft.append(fail_uft)
+            self.fail_start.append(fail_start)
+            self.fail_tie.append(fail_tie)
+
 
 
 class PHReg(model.LikelihoodModel):
@@ -575,6 +617,60 @@ class PHReg(model.LikelihoodModel):
         else:
             return self.efron_hessian(params)
 
+    def _stratum_linpred(self, stx, params):
+        """
+        Returns the linear predictor of stratum `stx`, shifted so
+        that its maximum is zero, and its exponential.
+        """
+
+        surv = self.surv
+
+        linpred = np.dot(surv.exog_s[stx], params)
+        if surv.offset_s is not None:
+            linpred += surv.offset_s[stx]
+        linpred -= linpred.max()
+        e_linpred = np.exp(linpred)
+
+        return linpred, e_linpred
+
+    def _risk_set_sums(self, stx, w):
+        """
+        Returns the sums of the rows of `w` over the risk set at each
+        unique failure time of stratum `stx`.
+
+        The rows of `w` correspond to the subjects in the stratum.
+        The sums are reverse cumulative sums over the subjects sorted
+        by time, minus the reverse cumulative sums over the subjects
+        sorted by entry time for the subjects that enter the risk set
+        later.
+        """
+
+        surv = self.surv
+
+        zero = np.zeros((1,) + w.shape[1:])
+        csum = np.concatenate((np.cumsum(w[::-1], 0)[::-1], zero))
+        sums = csum[surv.risk_enter_pos[stx]]
+
+        exit_order = surv.risk_exit_order[stx]
+        if exit_order is not None:
+            w = w[exit_order]
+            csum = np.concatenate((np.cumsum(w[::-1], 0)[::-1], zero))
+            sums -= csum[surv.risk_exit_pos[stx]]
+
+        return sums
+
+    def _risk_set_weights(self, stx, wt):
+        """
+        Returns for each subject in stratum `stx` the sum of `wt`
+        over the unique failure times at which the subject is in the
+        risk set.
+        """
+
+        surv = self.surv
+
+        csum = np.concatenate(([0.], np.cumsum(wt)))
+        return csum[surv.enter_uft[stx] + 1] - csum[surv.exit_uft[stx]]
+
     def breslow_loglike(self, params):
         """
         Returns the value of the log partial likelihood function
@@ -589,32 +685,15 @@ class PHReg(model.LikelihoodModel):
         # Loop over strata
         for stx in range(surv.nstrat):
 
-            uft_ix = surv.ufailt_ix[stx]
-            exog_s = surv.exog_s[stx]
-            nuft = len(uft_ix)
+            linpred, e_linpred = self._stratum_linpred(stx, params)
 
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
+            # Sums over the risk set at each unique failure time.
+            xp0 = self._risk_set_sums(stx, e_linpred)
 
-            xp0 = 0.
-
-            # Iterate backward through the unique failure times.
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                xp0 += e_linpred[ix].sum()
-
-                # Account for all cases that fail at this point.
-                ix = uft_ix[i]
-                like += (linpred[ix] - np.log(xp0)).sum()
-
-                # Update for cases leaving the risk set.
-                ix = surv.risk_exit[stx][i]
-                xp0 -= e_linpred[ix].sum()
+            # Account for all cases that fail.
+            ixf = surv.fail_ix[stx]
+            like += linpred[ixf].sum()
+            like -= np.log(xp0)[surv.fail_uft[stx]].sum()
 
         return like
 
@@ -632,37 +711,18 @@ class PHReg(model.LikelihoodModel):
         # Loop over strata
         for stx in range(surv.nstrat):
 
-            # exog and linear predictor for this stratum
-            exog_s = surv.exog_s[stx]
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
-
-            xp0 = 0.
+            linpred, e_linpred = self._stratum_linpred(stx, params)
 
-            # Iterate backward through the unique failure times.
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-            for i in range(nuft)[::-1]:
+            # Sums over the risk set and over the failing cases at
+            # each unique failure time.
+            ixf = surv.fail_ix[stx]
+            xp0 = self._risk_set_sums(stx, e_linpred)
+            xp0f = np.add.reduceat(e_linpred[ixf], surv.fail_start[stx])
 
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                xp0 += e_linpred[ix].sum()
-                xp0f = e_linpred[uft_ix[i]].sum()
-
-                # Account for all cases that fail at this point.
-                ix = uft_ix[i]
-                like += linpred[ix].sum()
-
-                m = len(ix)
-                J = np.arange(m, dtype=np.float64) / m
-                like -= np.log(xp0 - J*xp0f).sum()
-
-                # Update for cases leaving the risk set.
-                ix = surv.risk_exit[stx][i]
-                xp0 -= e_linpred[ix].sum()
+            # Account for all cases that fail.
+            uft = surv.fail_uft[stx]
+            like += linpred[ixf].sum()
+            like -= np.log(xp0[uft] - surv.fail_tie[stx] * xp0f[uft]).sum()
 
         return like
 
@@ -679,43 +739,18 @@ class PHReg(model.LikelihoodModel):
         # Loop over strata
         for stx in range(surv.nstrat):
 
-            # Indices of subjects in the stratum
-            strat_ix = surv.stratum_rows[stx]
-
-            # Unique failure times in the stratum
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-
-            # exog and linear predictor for the stratum
             exog_s = surv.exog_s[stx]
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
+            linpred, e_linpred = self._stratum_linpred(stx, params)
 
-            xp0, xp1 = 0., 0.
+            # Sums over the risk set at each unique failure time.
+            xp0 = self._risk_set_sums(stx, e_linpred)
+            xp1 = self._risk_set_sums(stx, e_linpred[:, None] * exog_s)
 
-            # Iterate backward through the unique failure times.
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                if len(ix) > 0:
-                    v = exog_s[ix,:]
-                    xp0 += e_linpred[ix].sum()
-                    xp1 += (e_linpred[ix][:,None] * v).sum(0)
-
-                # Account for all cases that fail at this point.
-                ix = uft_ix[i]
-                grad += (exog_s[ix,:] - xp1 / xp0).sum(0)
-
-                # Update for cases leaving the risk set.
-                ix = surv.risk_exit[stx][i]
-                if len(ix) > 0:
-                    v = exog_s[ix,:]
-                    xp0 -= e_linpred[ix].sum()
-                    xp1 -= (e_linpred[ix][:,None] * v).sum(0)
+            # Account for all cases that fail.
+            ixf = surv.fail_ix[stx]
+            uft = surv.fail_uft[stx]
+            grad += exog_s[ixf, :].sum(0)
+            grad -= (xp1[uft] / xp0[uft, None]).sum(0)
 
         return grad
 
@@ -732,53 +767,26 @@ class PHReg(model.LikelihoodModel):
         # Loop over strata
         for stx in range(surv.nstrat):
 
-            # Indices of cases in the stratum
-            strat_ix = surv.stratum_rows[stx]
-
-            # exog and linear predictor of the stratum
             exog_s = surv.exog_s[stx]
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
-
-            xp0, xp1 = 0., 0.
-
-            # Iterate backward through the unique failure times.
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                if len(ix) > 0:
-                    v = exog_s[ix,:]
-                    xp0 += e_linpred[ix].sum()
-                    xp1 += (e_linpred[ix][:,None] * v).sum(0)
-                ixf = uft_ix[i]
-                if len(ixf) > 0:
-                    v = exog_s[ixf,:]
-                    xp0f = e_linpred[ixf].sum()
-                    xp1f = (e_linpred[ixf][:,None] * v).sum(0)
-
-                    # Consider all cases that fail at this point.
-                    grad += v.sum(0)
-
-                    m = len(ixf)
-                    J = np.arange(m, dtype=np.float64) / m
-                    numer = xp1 - np.outer(J, xp1f)
-                    denom = xp0 - np.outer(J, xp0f)
-                    ratio = numer / denom
-                    rsum = ratio.sum(0)
-                    grad -= rsum
-
-                # Update for cases leaving the risk set.
-                ix = surv.risk_exit[stx][i]
-                if len(ix) > 0:
-                    v = exog_s[ix,:]
-                    xp0 -= e_linpred[ix].sum()
-                    xp1 -= (e_linpred[ix][:,None] * v).sum(0)
+            linpred, e_linpred = self._stratum_linpred(stx, params)
+
+            # Sums over the risk set and over the failing cases at
+            # each unique failure time.
+            ixf = surv.fail_ix[stx]
+            start = surv.fail_start[stx]
+            v = e_linpred[:, None] * exog_s
+            xp0 = self._risk_set_sums(stx, e_linpred)
+            xp1 = self._risk_set_sums(stx, v)
+            xp0f = np.add.reduceat(e_linpred[ixf], start)
+            xp1f = np.add.reduceat(v[ixf, :], start)
+
+            # Account for all cases that fail.
+            uft = surv.fail_uft[stx]
+            J = surv.fail_tie[stx]
+            numer = xp1[uft] - J[:, None] * xp1f[uft]
+            denom = xp0[uft] - J * xp0f[uft]
+            grad += exog_s[ixf, :].sum(0)
+            grad -= (numer / denom[:, None]).sum(0)
 
         return grad
 
@@ -795,45 +803,21 @@ class PHReg(model.LikelihoodModel):
         # Loop over strata
         for stx in range(surv.nstrat):
 
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-
             exog_s = surv.exog_s[stx]
+            linpred, e_linpred = self._stratum_linpred(stx, params)
 
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
+            # Sums over the risk set at each unique failure time.
+            xp0 = self._risk_set_sums(stx, e_linpred)
+            xp1 = self._risk_set_sums(stx, e_linpred[:, None] * exog_s)
 
-            xp0, xp1, xp2 = 0., 0., 0.
+            # The risk set sums of the outer products, weighted by
+            # m / xp0 for m failures, are accumulated per subject.
+            m = np.diff(np.r_[surv.fail_start[stx], len(surv.fail_ix[stx])])
+            wt = e_linpred * self._risk_set_weights(stx, m / xp0)
+            hess += np.dot(exog_s.T * wt, exog_s)
 
-            # Iterate backward through the unique failure times.
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                if len(ix) > 0:
-                    xp0 += e_linpred[ix].sum()
-                    v = exog_s[ix,:]
-                    xp1 += (e_linpred[ix][:,None] * v).sum(0)
-                    mat = v[None,:,:]
-                    elx = e_linpred[ix]
-                    xp2 += (mat.T * mat * elx[None,:,None]).sum(1)
-
-                # Account for all cases that fail at this point.
-                m = len(uft_ix[i])
-                hess += m*(xp2 / xp0  - np.outer(xp1, xp1) / xp0**2)
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_exit[stx][i]
-                if len(ix) > 0:
-                    xp0 -= e_linpred[ix].sum()
-                    v = exog_s[ix,:]
-                    xp1 -= (e_linpred[ix][:,None] * v).sum(0)
-                    mat = v[None,:,:]
-                    elx = e_linpred[ix]
-                    xp2 -= (mat.T * mat * elx[None,:,None]).sum(1)
+            xp1 /= xp0[:, None]
+            hess -= np.dot(xp1.T * m, xp1)
 
         return -hess
 
@@ -852,58 +836,35 @@ class PHReg(model.LikelihoodModel):
         for stx in range(surv.nstrat):
 
             exog_s = surv.exog_s[stx]
-
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
-
-            xp0, xp1, xp2 = 0., 0., 0.
-
-            # Iterate backward through the unique failure times.
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                if len(ix) > 0:
-                    xp0 += e_linpred[ix].sum()
-                    v = exog_s[ix,:]
-                    xp1 += (e_linpred[ix][:,None] * v).sum(0)
-                    mat = v[None,:,:]
-                    elx = e_linpred[ix]
-                    xp2 += (mat.T * mat * elx[None,:,None]).sum(1)
-
-                ixf = uft_ix[i]
-                if len(ixf) > 0:
-                    v = exog_s[ixf,:]
-                    xp0f = e_linpred[ixf].sum()
-                    xp1f = (e_linpred[ixf][:,None] * v).sum(0)
-                    mat = v[None,:,:]
-                    elx = e_linpred[ixf]
-                    xp2f = (mat.T * mat * elx[None,:,None]).sum(1)
-
-                # Account for all cases that fail at this point.
-                m = len(uft_ix[i])
-                J = np.arange(m, dtype=np.float64) / m
-                c0 = xp0 - J*xp0f
-                mat = (xp2[None,:,:] - J[:,None,None]*xp2f) / c0[:,None,None]
-                hess += mat.sum(0)
-                mat = (xp1[None, :] - np.outer(J, xp1f)) / c0[:, None]
-                mat = mat[:, :, None] * mat[:, None, :]
-                hess -= mat.sum(0)
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_exit[stx][i]
-                if len(ix) > 0:
-                    xp0 -= e_linpred[ix].sum()
-                    v = exog_s[ix,:]
-                    xp1 -= (e_linpred[ix][:,None] * v).sum(0)
-                    mat = v[None,:,:]
-                    elx = e_linpred[ix]
-                    xp2 -= (mat.T * mat * elx[None,:,None]).sum(1)
+            linpred, e_linpred = self._stratum_linpred(stx, params)
+
+            # Sums over the risk set and over the failing cases at
+            # each unique failure time.
+            ixf = surv.fail_ix[stx]
+            start = surv.fail_start[stx]
+            v = e_linpred[:, None] * exog_s
+            xp0 = self._risk_set_sums(stx, e_linpred)
+            xp1 = self._risk_set_sums(stx, v)
+            xp0f = np.add.reduceat(e_linpred[ixf], start)
+            xp1f = np.add.reduceat(v[ixf, :], start)
+
+            uft = surv.fail_uft[stx]
+            J = surv.fail_tie[stx]
+            c0 = xp0[uft] - J * xp0f[uft]
+
+            # The outer products enter through the risk set sums,
+            # weighted by sum 1 / c0, and the sums over the failing
+            # cases, weighted by sum J / c0, at each failure time.
+            nuft = len(start)
+            wt = np.bincount(uft, weights=1 / c0, minlength=nuft)
+            wt = e_linpred * self._risk_set_weights(stx, wt)
+            hess += np.dot(exog_s.T * wt, exog_s)
+            wt = np.bincount(uft, weights=J / c0, minlength=nuft)
+            wt = e_linpred[ixf] * wt[uft]
+            hess -= np.dot(exog_s[ixf, :].T * wt, exog_s[ixf, :])
+
+            mat = (xp1[uft] - J[:, None] * xp1f[uft]) / c0[:, None]
+            hess -= np.dot(mat.T, mat)
 
         return -hess
 
@@ -184,6 +184,30 @@ class TestPHReg(object):
 
         assert_allclose(rslt2.params, rslt1.params[1:])
 
+    def test_derivatives(self):
+        # Score and Hessian agree with numerical derivatives, with tied
+        # times, entry times, strata and offsets.
+        from statsmodels.tools.numdiff import approx_fprime
+
+        np.random.seed(34234)
+        n = 300
+        exog = np.random.normal(size=(n, 3))
+        time = np.round(10 * np.random.uniform(size=n)) + 1
+        status = np.random.randint(0, 2, n).astype(np.float64)
+        entry = np.where(np.random.uniform(size=n) < 0.5,
+                         time * np.random.uniform(size=n), 0)
+        strata = np.random.randint(0, 3, n)
+        offset = 0.1 * np.random.normal(size=n)
+        params = np.r_[0.5, -0.2, 0.1]
+
+        for ties in "breslow", "efron":
+            mod = PHReg(time, exog, status, entry=entry, strata=strata,
+                        offset=offset, ties=ties)
+            score = approx_fprime(params, mod.loglike, centered=True)
+            assert_allclose(mod.score(params), score, rtol=1e-6)
+            hess = approx_fprime(params, mod.score, centered=True)
+            assert_allclose(mod.hessian(params), hess, rtol=1e-6)
+
     def test_post_estimation(self):
         # All regression tests
         np.random.seed(34234)
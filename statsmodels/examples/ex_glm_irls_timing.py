@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Timing of the IRLS solvers in GLM.fit
+
+Compares the lightweight weighted least squares solvers that work in
+preallocated arrays with the original loop that creates and fits a full
+WLS model in each iteration, ``wls_method='wls'``.
+
+"""
+
+from __future__ import print_function
+import time
+import numpy as np
+import statsmodels.api as sm
+
+
+def time_fit(mod, n_rep=3, **kwds):
+    res = None
+    t_min = np.inf
+    for _ in range(n_rep):
+        t0 = time.time()
+        res = mod.fit(**kwds)
+        t_min = min(t_min, time.time() - t0)
+    return t_min, res
+
+
+np.random.seed(98765)
+k_vars = 10
+for nobs in [10000, 100000, 1000000]:
+    exog = sm.add_constant(np.random.randn(nobs, k_vars - 1))
+    beta = np.linspace(-0.2, 0.2, k_vars)
+    linpred = exog.dot(beta)
+    endog_pois = np.random.poisson(np.exp(linpred))
+    endog_bin = np.random.binomial(1, 1 / (1 + np.exp(-linpred)))
+
+    for name, endog, family in [('Poisson', endog_pois, sm.families.Poisson()),
+                                ('Binomial', endog_bin, sm.families.Binomial())]:
+        mod = sm.GLM(endog, exog, family=family)
+        t_wls, res_wls = time_fit(mod, wls_method='wls')
+        print('\n%s nobs=%d, k_vars=%d' % (name, nobs, k_vars))
+        print('%-10s %8.4f sec' % ('wls', t_wls))
+        for wls_method in ['cholesky', 'qr', 'pinv']:
+            t, res = time_fit(mod, wls_method=wls_method)
+            print('%-10s %8.4f sec  speedup %5.1f  max abs diff params %g' %
+                  (wls_method, t, t_wls / t,
+                   np.max(np.abs(res.params - res_wls.params))))
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Timing of attribute access and summary on pandas-backed results
+
+The results wrapper caches the pandas objects that it builds from the
+underlying arrays. This compares repeated attribute access, ``summary`` and
+``summary2`` with a warm cache against clearing the cache before each
+access, which is what every access cost before the cache was added.
+
+``summary`` and ``summary2`` are bound to the unwrapped results instance,
+so their timings are mainly a baseline for regressions in summary building.
+
+"""
+
+from __future__ import print_function
+import time
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+
+
+def time_call(func, n_rep=5):
+    t_min = np.inf
+    for _ in range(n_rep):
+        t0 = time.time()
+        func()
+        t_min = min(t_min, time.time() - t0)
+    return t_min
+
+
+def access(res, clear, n_loop=1000):
+    for _ in range(n_loop):
+        if clear:
+            res._wrapped_cache.clear()
+        res.params, res.bse, res.tvalues, res.pvalues
+
+
+def summary(res, clear):
+    if clear:
+        res._wrapped_cache.clear()
+    res.summary()
+
+
+def summary2(res, clear):
+    if clear:
+        res._wrapped_cache.clear()
+    res.summary2()
+
+
+np.random.seed(98765)
+nobs, k_vars = 5000, 20
+exog = sm.add_constant(np.random.randn(nobs, k_vars - 1))
+columns = ['const'] + ['x%d' % i for i in range(1, k_vars)]
+exog = pd.DataFrame(exog, columns=columns)
+linpred = exog.values.dot(np.linspace(-0.2, 0.2, k_vars))
+endog_ols = pd.Series(linpred + np.random.randn(nobs), name='y')
+endog_bin = pd.Series(np.random.binomial(1, 1 / (1 + np.exp(-linpred))),
+                      name='y')
+
+results = [('OLS', sm.OLS(endog_ols, exog).fit()),
+           ('Logit', sm.Logit(endog_bin, exog).fit(disp=0))]
+
+for name, res in results:
+    print('\n%s nobs=%d, k_vars=%d' % (name, nobs, k_vars))
+    for func in [access, summary, summary2]:
+        t_clear = time_call(lambda: func(res, clear=True))
+        t_cache = time_call(lambda: func(res, clear=False))
+        print('%-10s uncached %8.4f sec  cached %8.4f sec  speedup %5.1f' %
+              (func.__name__, t_clear, t_cache, t_clear / t_cache))
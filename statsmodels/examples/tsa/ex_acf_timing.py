@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Timing of acovf and acf for long time series
+
+Compares the computation of only the required lags, ``nlag``, with the
+autocovariances for all lags, for the direct method and for the FFT.
+
+"""
+
+from __future__ import print_function
+import time
+import numpy as np
+from statsmodels.tsa.stattools import acovf, acf, ccf
+
+
+def time_func(func, n_rep=3):
+    res = None
+    t_min = np.inf
+    for _ in range(n_rep):
+        t0 = time.time()
+        res = func()
+        t_min = min(t_min, time.time() - t0)
+    return t_min, res
+
+
+np.random.seed(98765)
+nlags = 40
+for nobs in [10000, 100000, 1000000]:
+    x = np.random.randn(nobs).cumsum()
+    y = x + np.random.randn(nobs)
+    print('\nnobs=%d, nlags=%d' % (nobs, nlags))
+
+    t_fft, res_fft = time_func(lambda: acovf(x, fft=True))
+    print('%-28s %8.4f sec' % ('acovf fft, all lags', t_fft))
+    if nobs <= 100000:
+        # np.correlate for all lags is O(nobs**2)
+        t, res = time_func(lambda: acovf(x), n_rep=1)
+        print('%-28s %8.4f sec' % ('acovf direct, all lags', t))
+    for fft in [False, True]:
+        t, res = time_func(lambda: acovf(x, fft=fft, nlag=nlags))
+        print('%-28s %8.4f sec  max abs diff %g' %
+              ('acovf %s, nlag' % ('fft' if fft else 'direct'), t,
+               np.max(np.abs(res - res_fft[:nlags + 1]))))
+
+    for fft in [False, True]:
+        t, res = time_func(lambda: acf(x, nlags=nlags, fft=fft, qstat=True))
+        print('%-28s %8.4f sec' % ('acf %s, qstat' %
+                                   ('fft' if fft else 'direct'), t))
+        t, res = time_func(lambda: ccf(x, y, fft=fft, nlag=nlags))
+        print('%-28s %8.4f sec' % ('ccf %s, nlag' %
+                                   ('fft' if fft else 'direct'), t))
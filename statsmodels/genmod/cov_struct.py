@@ -164,6 +164,49 @@ class CovStruct(object):
         soln = [spl.cho_solve(vco, x) for x in rhs]
         return soln
 
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+        """
+        Solves the matrix equations of `covariance_matrix_solve` for
+        several groups of the same size at once.
+
+        Parameters
+        ----------
+        expval: array-like
+           n_groups x group_size array of expected values of endog.
+        index: array-like
+           The indices of the `n_groups` groups.
+        stdev : array-like
+            n_groups x group_size array of standard deviations of
+            endog.
+        rhs : list/tuple of array-like
+            A set of right-hand sides, each has shape n_groups x
+            group_size or n_groups x group_size x k.
+
+        Returns
+        -------
+        soln : list/tuple of array-like
+            The solutions to the matrix equations, with the same shapes
+            as the right-hand sides.
+
+        Notes
+        -----
+        Returns None if the solver fails for any of the groups.
+
+        This default implementation calls `covariance_matrix_solve`
+        for each group.  Subclasses can reimplement it to operate on
+        all groups at once.
+        """
+
+        soln = [np.empty(x.shape, dtype=np.float64) for x in rhs]
+        for j, i in enumerate(index):
+            rslt = self.covariance_matrix_solve(expval[j], i, stdev[j],
+                                                [x[j] for x in rhs])
+            if rslt is None:
+                return None
+            for y, z in zip(soln, rslt):
+                y[j] = z
+        return soln
+
     def summary(self):
         """
         Returns a text summary of the current estimate of the
@@ -195,9 +238,21 @@ class Independence(CovStruct):
                 rslt.append(x / v[:, None])
         return rslt
 
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+        v = stdev**2
+        rslt = []
+        for x in rhs:
+            if x.ndim == 2:
+                rslt.append(x / v)
+            else:
+                rslt.append(x / v[:, :, None])
+        return rslt
+
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
     covariance_matrix_solve.__doc__ = CovStruct.covariance_matrix_solve.__doc__
+    covariance_matrix_solve_batch.__doc__ = \
+        CovStruct.covariance_matrix_solve_batch.__doc__
 
     def summary(self):
         return "Observations within a cluster are modeled as being independent."
@@ -217,28 +272,27 @@ class Exchangeable(CovStruct):
 
     def update(self, params):
 
-        endog = self.model.endog_li
-
         nobs = self.model.nobs
         dim = len(params)
 
         varfunc = self.model.family.variance
 
-        cached_means = self.model.cached_means
+        batches = self.model._cluster_batches()
+        cached_means = self.model._cached_means_batch
 
+        # The sum of the cross products r_i * r_j, i < j, within a
+        # group is ((sum r)**2 - sum r**2) / 2.
         residsq_sum, scale, nterm = 0, 0, 0
-        for i in range(self.model.num_group):
+        for (_, endog, _, _), (expval, _) in zip(batches, cached_means):
 
-            expval, _ = cached_means[i]
             stdev = np.sqrt(varfunc(expval))
-            resid = (endog[i] - expval) / stdev
+            resid = (endog - expval) / stdev
 
-            ngrp = len(resid)
-            residsq = np.outer(resid, resid)
-            scale += np.trace(residsq)
-            residsq = np.tril(residsq, -1)
-            residsq_sum += residsq.sum()
-            nterm += 0.5 * ngrp * (ngrp - 1)
+            ngrp = resid.shape[1]
+            ssq = np.sum(resid**2)
+            scale += ssq
+            residsq_sum += 0.5 * (np.sum(resid.sum(1)**2) - ssq)
+            nterm += 0.5 * ngrp * (ngrp - 1) * resid.shape[0]
 
         scale /= (nobs - dim)
         self.dep_params = residsq_sum / (scale * (nterm - dim))
@@ -270,9 +324,31 @@ class Exchangeable(CovStruct):
 
         return rslt
 
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+
+        k = expval.shape[1]
+        c = self.dep_params / (1. - self.dep_params)
+        c /= 1. + self.dep_params * (k - 1)
+
+        rslt = []
+        for x in rhs:
+            if x.ndim == 2:
+                sd = stdev
+            else:
+                sd = stdev[:, :, None]
+            x1 = x / sd
+            y = x1 / (1. - self.dep_params)
+            y -= c * x1.sum(1)[:, None]
+            y /= sd
+            rslt.append(y)
+
+        return rslt
+
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
     covariance_matrix_solve.__doc__ = CovStruct.covariance_matrix_solve.__doc__
+    covariance_matrix_solve_batch.__doc__ = \
+        CovStruct.covariance_matrix_solve_batch.__doc__
 
     def summary(self):
         return ("The correlation between two observations in the " +
@@ -508,6 +584,7 @@ class Autoregressive(CovStruct):
             self.dist_func = lambda x, y: np.abs(x - y).sum()
         else:
             self.dist_func = dist_func
+        self._default_dist = dist_func is None
 
         self.designx = None
 
@@ -516,32 +593,31 @@ class Autoregressive(CovStruct):
 
     def update(self, params):
 
-        endog = self.model.endog_li
-        time = self.model.time_li
+        model = self.model
+        batches = model._cluster_batches()
 
         # Only need to compute this once
         if self.designx is not None:
             designx = self.designx
         else:
+            # Distances for all pairs of observations within a
+            # cluster, ordered like the residual pairs below.
             designx = []
-            for i in range(self.model.num_group):
-
-                ngrp = len(endog[i])
-                if ngrp == 0:
-                    continue
-
-                # Loop over pairs of observations within a cluster
-                for j1 in range(ngrp):
-                    for j2 in range(j1):
-                        designx.append(self.dist_func(time[i][j1, :],
-                                                      time[i][j2, :]))
+            time = model._stack_clusters(model.time_li)
+            for tm in time:
+                ix1, ix2 = np.tril_indices(tm.shape[1], -1)
+                if self._default_dist:
+                    dist = np.abs(tm[:, ix1, :] - tm[:, ix2, :]).sum(2)
+                else:
+                    dist = [[self.dist_func(t[j1, :], t[j2, :])
+                             for j1, j2 in zip(ix1, ix2)] for t in tm]
+                designx.append(np.asarray(dist, dtype=np.float64).ravel())
 
-            designx = np.array(designx)
+            designx = np.concatenate(designx)
             self.designx = designx
 
-        scale = self.model.estimate_scale()
-        varfunc = self.model.family.variance
-        cached_means = self.model.cached_means
+        scale = model.estimate_scale()
+        varfunc = model.family.variance
 
         # Weights
         var = 1. - self.dep_params**(2*designx)
@@ -550,18 +626,17 @@ class Autoregressive(CovStruct):
         wts /= wts.sum()
 
         residmat = []
-        for i in range(self.model.num_group):
+        for (_, endog, _, _), (expval, _) in \
+                zip(batches, model._cached_means_batch):
 
-            expval, _ = cached_means[i]
             stdev = np.sqrt(scale * varfunc(expval))
-            resid = (endog[i] - expval) / stdev
+            resid = (endog - expval) / stdev
 
-            ngrp = len(resid)
-            for j1 in range(ngrp):
-                for j2 in range(j1):
-                    residmat.append([resid[j1], resid[j2]])
+            ix1, ix2 = np.tril_indices(resid.shape[1], -1)
+            residmat.append(np.column_stack((resid[:, ix1].ravel(),
+                                             resid[:, ix2].ravel())))
 
-        residmat = np.array(residmat)
+        residmat = np.concatenate(residmat)
 
         # Need to minimize this
         def fitfunc(a):
@@ -601,60 +676,45 @@ class Autoregressive(CovStruct):
         return cmat, True
 
     def covariance_matrix_solve(self, expval, index, stdev, rhs):
-        # The inverse of an AR(1) covariance matrix is tri-diagonal.
 
-        k = len(expval)
-        soln = []
+        rslt = self.covariance_matrix_solve_batch(expval[None, :], [index],
+                                                  stdev[None, :],
+                                                  [x[None, ...] for x in rhs])
+        return [x[0] for x in rslt]
+
+    def covariance_matrix_solve_batch(self, expval, index, stdev, rhs):
+        # The inverse of an AR(1) correlation matrix is tri-diagonal.
+
+        k = expval.shape[1]
 
         # LHS has 1 column
         if k == 1:
-            return [x / stdev**2 for x in rhs]
-
-        # LHS has 2 columns
-        if k == 2:
-            mat = np.array([[1, -self.dep_params], [-self.dep_params, 1]])
-            mat /= (1. - self.dep_params**2)
-            for x in rhs:
-                if x.ndim == 1:
-                    x1 = x / stdev
-                else:
-                    x1 = x / stdev[:, None]
-                x1 = np.dot(mat, x1)
-                if x.ndim == 1:
-                    x1 /= stdev
-                else:
-                    x1 /= stdev[:, None]
-                soln.append(x1)
-            return soln
-
-        # LHS has >= 3 columns: values c0, c1, c2 defined below give
-        # the inverse.  c0 is on the diagonal, except for the first
-        # and last position.  c1 is on the first and last position of
-        # the diagonal.  c2 is on the sub/super diagonal.
+            v = stdev**2
+            return [x / v if x.ndim == 2 else x / v[:, :, None]
+                    for x in rhs]
+
+        # The values c0, c1, c2 defined below give the inverse.  c0 is
+        # on the diagonal, except for the first and last position.  c1
+        # is on the first and last position of the diagonal.  c2 is on
+        # the sub/super diagonal.
         c0 = (1. + self.dep_params**2) / (1. - self.dep_params**2)
         c1 = 1. / (1. - self.dep_params**2)
         c2 = -self.dep_params / (1. - self.dep_params**2)
         soln = []
         for x in rhs:
-            flatten = False
-            if x.ndim == 1:
-                x = x[:, None]
-                flatten = True
-            x1 = x / stdev[:, None]
-
-            z0 = np.zeros((1, x.shape[1]))
-            rhs1 = np.concatenate((x[1:,:], z0), axis=0)
-            rhs2 = np.concatenate((z0, x[0:-1,:]), axis=0)
-
-            y = c0*x + c2*rhs1 + c2*rhs2
-            y[0, :] = c1*x[0, :] + c2*x[1, :]
-            y[-1, :] = c1*x[-1, :] + c2*x[-2, :]
-
-            y /= stdev[:, None]
+            if x.ndim == 2:
+                sd = stdev
+            else:
+                sd = stdev[:, :, None]
+            x1 = x / sd
 
-            if flatten:
-                y = np.squeeze(y)
+            y = c0 * x1
+            y[:, 0] = c1 * x1[:, 0]
+            y[:, -1] = c1 * x1[:, -1]
+            y[:, 1:] += c2 * x1[:, :-1]
+            y[:, :-1] += c2 * x1[:, 1:]
 
+            y /= sd
             soln.append(y)
 
         return soln
@@ -662,6 +722,8 @@ class Autoregressive(CovStruct):
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
     covariance_matrix_solve.__doc__ = CovStruct.covariance_matrix_solve.__doc__
+    covariance_matrix_solve_batch.__doc__ = \
+        CovStruct.covariance_matrix_solve_batch.__doc__
 
     def summary(self):
 
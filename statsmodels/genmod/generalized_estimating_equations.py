@@ -524,6 +524,7 @@ class GEE(base.Model):
             # This custom mean_deriv is currently only used for the
             # multinomial logit model
             self.mean_deriv = self.family.link.mean_deriv
+            self._mean_deriv_lpr = None
         except AttributeError:
             # Otherwise it can be obtained easily from inverse_deriv
             mean_deriv_lpr = self.family.link.inverse_deriv
@@ -533,6 +534,7 @@ class GEE(base.Model):
                 return dmat
 
             self.mean_deriv = mean_deriv
+            self._mean_deriv_lpr = mean_deriv_lpr
 
         # mean_deriv_exog is the derivative of E[endog|exog] with
         # respect to exog
@@ -557,6 +559,20 @@ class GEE(base.Model):
         if maxgroup == 1:
             self.update_dep = False
 
+        # Clusters of equal size are stacked into arrays, so that the
+        # estimating equations can be accumulated in batches.  A
+        # custom mean_deriv may depend on the cluster structure, the
+        # clusters are then processed one at a time.
+        if self._mean_deriv_lpr is None:
+            self._batch_index = [np.r_[i] for i in range(self.num_group)]
+        else:
+            group_ns = np.asarray(group_ns)
+            self._batch_index = [np.flatnonzero(group_ns == m)
+                                 for m in np.unique(group_ns)]
+        self._batch_endog = self._stack_clusters(self.endog_li)
+        self._batch_offset = self._stack_clusters(self.offset_li)
+        self._batch_exog = (None, None)
+
     # Override to allow groups and time to be passed as variable
     # names.
     @classmethod
@@ -650,33 +666,60 @@ class GEE(base.Model):
             return [np.array(array[self.group_indices[k], :])
                     for k in self.group_labels]
 
+    def _stack_clusters(self, array_li):
+        """
+        Returns the arrays in `array_li` stacked along a new first
+        axis, one stacked array for each batch of equal sized groups.
+        """
+
+        return [np.array([array_li[i] for i in ix])
+                for ix in self._batch_index]
+
+    def _cluster_batches(self):
+        """
+        Returns a list of tuples `(index, endog, exog, offset)`, one
+        for each batch of equal sized clusters.  `index` contains the
+        group indices, the data arrays are stacked along the first
+        axis.
+        """
+
+        # exog_li is temporarily replaced when handling constraints
+        exog_li, batch_exog = self._batch_exog
+        if exog_li is not self.exog_li:
+            batch_exog = self._stack_clusters(self.exog_li)
+            self._batch_exog = (self.exog_li, batch_exog)
+
+        return list(zip(self._batch_index, self._batch_endog, batch_exog,
+                        self._batch_offset))
+
+    def _mean_deriv_batch(self, exog, lpr):
+        """
+        `mean_deriv` for a batch of clusters, `exog` and `lpr` are
+        stacked along the first axis.
+        """
+
+        if self._mean_deriv_lpr is None:
+            return np.array([self.mean_deriv(x, lp)
+                             for x, lp in zip(exog, lpr)])
+        return exog * self._mean_deriv_lpr(lpr)[:, :, None]
+
     def estimate_scale(self):
         """
         Returns an estimate of the scale parameter `phi` at the
         current parameter value.
         """
 
-        endog = self.endog_li
-        exog = self.exog_li
-        offset = self.offset_li
-
-        cached_means = self.cached_means
-
         nobs = self.nobs
-        exog_dim = exog[0].shape[1]
+        exog_dim = self.exog_li[0].shape[1]
 
         varfunc = self.family.variance
 
         scale = 0.
-        for i in range(self.num_group):
-
-            if len(endog[i]) == 0:
-                continue
-
-            expval, _ = cached_means[i]
+        for (_, endog, _, offset), (expval, _) in \
+                zip(self._cluster_batches(), self._cached_means_batch):
 
             sdev = np.sqrt(varfunc(expval))
-            resid = (endog[i] - offset[i] - expval) / sdev
+            resid = (endog - offset - expval) / sdev
 
             scale += np.sum(resid**2)
 
@@ -698,29 +741,26 @@ class GEE(base.Model):
             incorporate the scale.
         """
 
-        endog = self.endog_li
-        exog = self.exog_li
-
-        cached_means = self.cached_means
+        batches = self._cluster_batches()
 
         varfunc = self.family.variance
 
         bmat, score = 0, 0
-        for i in range(self.num_group):
+        for (index, endog, exog, _), (expval, lpr) in \
+                zip(batches, self._cached_means_batch):
 
-            expval, lpr = cached_means[i]
-            resid = endog[i] - expval
-            dmat = self.mean_deriv(exog[i], lpr)
+            resid = endog - expval
+            dmat = self._mean_deriv_batch(exog, lpr)
             sdev = np.sqrt(varfunc(expval))
 
-            rslt = self.cov_struct.covariance_matrix_solve(expval, i,
-                                                sdev, (dmat, resid))
+            rslt = self.cov_struct.covariance_matrix_solve_batch(
+                expval, index, sdev, (dmat, resid))
             if rslt is None:
                 return None, None
             vinv_d, vinv_resid = tuple(rslt)
 
-            bmat += np.dot(dmat.T, vinv_d)
-            score += np.dot(dmat.T, vinv_resid)
+            bmat += np.tensordot(dmat, vinv_d, axes=([0, 1], [0, 1]))
+            score += np.tensordot(dmat, vinv_resid, axes=([0, 1], [0, 1]))
 
         update = np.linalg.solve(bmat, score)
 
@@ -737,23 +777,21 @@ class GEE(base.Model):
         keep the cached means up to date.
         """
 
-        endog = self.endog_li
-        exog = self.exog_li
-        offset = self.offset_li
-
         linkinv = self.family.link.inverse
 
-        self.cached_means = []
+        # The means are computed for batches of equal sized clusters,
+        # cached_means contains views into the batch arrays.
+        self.cached_means = [None] * self.num_group
+        self._cached_means_batch = []
 
-        for i in range(self.num_group):
+        for index, _, exog, offset in self._cluster_batches():
 
-            if len(endog[i]) == 0:
-                continue
+            lpr = offset + np.dot(exog, mean_params)
+            expval = linkinv(lpr.ravel()).reshape(lpr.shape)
 
-            lpr = offset[i] + np.dot(exog[i], mean_params)
-            expval = linkinv(lpr)
-
-            self.cached_means.append((expval, lpr))
+            self._cached_means_batch.append((expval, lpr))
+            for j, i in enumerate(index):
+                self.cached_means[i] = (expval[j], lpr[j])
 
     def _covmat(self):
         """
@@ -778,31 +816,31 @@ class GEE(base.Model):
            obtaining score test results.
         """
 
-        endog = self.endog_li
-        exog = self.exog_li
+        batches = self._cluster_batches()
 
         varfunc = self.family.variance
-        cached_means = self.cached_means
 
         # Calculate the naive (model-based) and robust (sandwich)
         # covariances.
         bmat, cmat = 0, 0
-        for i in range(self.num_group):
+        terms = []
+        for (index, endog, exog, _), (expval, lpr) in \
+                zip(batches, self._cached_means_batch):
 
-            expval, lpr = cached_means[i]
-            resid = endog[i] - expval
-            dmat = self.mean_deriv(exog[i], lpr)
+            resid = endog - expval
+            dmat = self._mean_deriv_batch(exog, lpr)
             sdev = np.sqrt(varfunc(expval))
 
-            rslt = self.cov_struct.covariance_matrix_solve(expval, i,
-                                                sdev, (dmat, resid))
+            rslt = self.cov_struct.covariance_matrix_solve_batch(
+                expval, index, sdev, (dmat, resid))
             if rslt is None:
                 return None, None, None, None
             vinv_d, vinv_resid = tuple(rslt)
+            terms.append((index, expval, resid, dmat, sdev, vinv_d))
 
-            bmat += np.dot(dmat.T, vinv_d)
-            dvinv_resid = np.dot(dmat.T, vinv_resid)
-            cmat += np.outer(dvinv_resid, dvinv_resid)
+            bmat += np.tensordot(dmat, vinv_d, axes=([0, 1], [0, 1]))
+            dvinv_resid = np.einsum('gjk,gj->gk', dmat, vinv_resid)
+            cmat += np.dot(dvinv_resid.T, dvinv_resid)
 
         scale = self.estimate_scale()
 
@@ -812,33 +850,28 @@ class GEE(base.Model):
 
         # Calculate the bias-corrected sandwich estimate of Mancl and
         # DeRouen (requires cov_naive so cannot be calculated
-        # in the previous loop).
+        # in the previous loop).  For each group, the adjusted
+        # residuals solve (I - H) aresid = resid, with
+        # H = D * cov_naive * D' * V^{-1} / scale.  Using the
+        # Woodbury identity this only requires a k x k solve,
+        # where k is the number of mean parameters.
+        k = bmat.shape[0]
         bcm = 0
-        for i in range(self.num_group):
+        for index, expval, resid, dmat, sdev, vinv_d in terms:
 
-            expval, lpr = cached_means[i]
-            resid = endog[i] - expval
-            dmat = self.mean_deriv(exog[i], lpr)
-            sdev = np.sqrt(varfunc(expval))
+            dvd = np.einsum('gjk,gjl->gkl', vinv_d, dmat)
+            amat = np.eye(k) - np.dot(dvd, bmati)
+            dvr = np.einsum('gjk,gj->gk', vinv_d, resid)
+            zvec = np.linalg.solve(amat, dvr[:, :, None])[:, :, 0]
+            aresid = resid + np.einsum('gjk,gk->gj', dmat,
+                                       np.dot(zvec, bmati))
 
-            rslt = self.cov_struct.covariance_matrix_solve(expval,
-                                                  i, sdev, (dmat,))
+            rslt = self.cov_struct.covariance_matrix_solve_batch(
+                expval, index, sdev, (aresid,))
             if rslt is None:
                 return None, None, None, None
-            vinv_d = rslt[0]
-            vinv_d /= scale
-
-            hmat = np.dot(vinv_d, cov_naive)
-            hmat = np.dot(hmat, dmat.T).T
-
-            aresid = np.linalg.solve(np.eye(len(resid)) - hmat, resid)
-            rslt = self.cov_struct.covariance_matrix_solve(expval, i,
-                                                     sdev, (aresid,))
-            if rslt is None:
-                return None, None, None, None
-            srt = rslt[0]
-            srt = np.dot(dmat.T, srt) / scale
-            bcm += np.outer(srt, srt)
+            srt = np.einsum('gjk,gj->gk', dmat, rslt[0]) / scale
+            bcm += np.dot(srt.T, srt)
 
         cov_robust_bc = np.dot(cov_naive, np.dot(bcm, cov_naive))
 
@@ -1090,8 +1123,8 @@ class GEE(base.Model):
         # Get the score vector under the full model.
         save_exog_li = self.exog_li
         self.exog_li = self.constraint.exog_fulltrans_li
-        import copy
-        save_cached_means = copy.deepcopy(self.cached_means)
+        save_cached_means = self.cached_means
+        save_cached_means_batch = self._cached_means_batch
         self.update_cached_means(mean_params0)
         _, score = self._update_mean_params()
 
@@ -1135,6 +1168,7 @@ class GEE(base.Model):
 
         self.exog_li = save_exog_li
         self.cached_means = save_cached_means
+        self._cached_means_batch = save_cached_means_batch
         self.exog = self.constraint.restore_exog()
 
         return mean_params, bcov
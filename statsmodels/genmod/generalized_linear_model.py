@@ -18,16 +18,19 @@ McCullagh, P. and Nelder, J.A.  1989.  "Generalized Linear Models." 2nd ed.
     Chapman & Hall, Boca Rotan.
 """
 
+import warnings
 import numpy as np
 from . import families
 from statsmodels.tools.decorators import cache_readonly, resettable_cache
 
 import statsmodels.base.model as base
 import statsmodels.regression.linear_model as lm
+from statsmodels.regression._tools import _MinimalWLS, _elastic_net_cd
 import statsmodels.base.wrapper as wrap
 from statsmodels.compat.numpy import np_matrix_rank
 
-from statsmodels.tools.sm_exceptions import PerfectSeparationError
+from statsmodels.tools.sm_exceptions import (PerfectSeparationError,
+                                             ConvergenceWarning)
 
 __all__ = ['GLM']
 
@@ -504,11 +507,11 @@ class GLM(base.LikelihoodModel):
         return chi2stat, pval, k_constraints
 
 
-    def _update_history(self, tmp_result, mu, history):
+    def _update_history(self, params, mu, history):
         """
         Helper method to update history during iterative fit.
         """
-        history['params'].append(tmp_result.params)
+        history['params'].append(params)
         history['deviance'].append(self.family.deviance(self.endog, mu))
         return history
 
@@ -625,9 +628,40 @@ class GLM(base.LikelihoodModel):
         else:
             return self.family.fitted(linpred)
 
+    def _setup_irls(self):
+        """
+        Helper method to set the data weights and the combined offset.
+
+        Binomial endog given as (success, failure) is converted to
+        proportions.
+        """
+        endog = self.endog
+        if endog.ndim > 1 and endog.shape[1] == 2:
+            data_weights = endog.sum(1)  # weights are total trials
+        else:
+            data_weights = np.ones((endog.shape[0]))
+        self.data_weights = data_weights
+        if np.shape(self.data_weights) == () and self.data_weights > 1:
+            self.data_weights = self.data_weights * np.ones((endog.shape[0]))
+        if isinstance(self.family, families.Binomial):
+        # this checks what kind of data is given for Binomial.
+        # family will need a reference to endog if this is to be removed from
+        # preprocessing
+            self.endog = self.family.initialize(self.endog)
+
+        # Construct a combined offset/exposure term.  Note that
+        # exposure has already been logged if present.
+        offset_exposure = 0.
+        if hasattr(self, 'offset'):
+            offset_exposure = self.offset
+        if hasattr(self, 'exposure'):
+            offset_exposure = offset_exposure + self.exposure
+        self._offset_exposure = offset_exposure
+        return data_weights, offset_exposure
+
     def fit(self, start_params=None, maxiter=100, method='IRLS', tol=1e-8,
             scale=None, cov_type='nonrobust', cov_kwds=None, use_t=None,
-            **kwargs):
+            wls_method='cholesky', **kwargs):
         """
         Fits a generalized linear model for a given family.
 
@@ -652,34 +686,25 @@ class GLM(base.LikelihoodModel):
             The default is family-specific and is given by the
             ``family.starting_mu(endog)``. If start_params is given then the
             initial mean will be calculated as ``np.dot(exog, start_params)``.
+        wls_method : {'cholesky', 'qr', 'pinv', 'wls'}
+            Method used to solve the weighted least squares problem in each
+            IRLS iteration. 'cholesky' (default) and 'qr' solve the weighted
+            normal equations directly in preallocated work arrays and fall
+            back to the pseudoinverse if the weighted design is (nearly)
+            singular. 'pinv' always uses the pseudoinverse. 'wls' creates
+            and fits a full `WLS` model in each iteration.
 
         Notes
         -----
         This method does not take any extra undocumented ``kwargs``.
+
+        Except for ``wls_method='wls'``, no intermediate model or results
+        instances are created during the iterations, and the covariance of
+        the parameters is only computed once at convergence.
         """
         endog = self.endog
-        if endog.ndim > 1 and endog.shape[1] == 2:
-            data_weights = endog.sum(1)  # weights are total trials
-        else:
-            data_weights = np.ones((endog.shape[0]))
-        self.data_weights = data_weights
-        if np.shape(self.data_weights) == () and self.data_weights > 1:
-            self.data_weights = self.data_weights * np.ones((endog.shape[0]))
         self.scaletype = scale
-        if isinstance(self.family, families.Binomial):
-        # this checks what kind of data is given for Binomial.
-        # family will need a reference to endog if this is to be removed from
-        # preprocessing
-            self.endog = self.family.initialize(self.endog)
-
-        # Construct a combined offset/exposure term.  Note that
-        # exposure has already been logged if present.
-        offset_exposure = 0.
-        if hasattr(self, 'offset'):
-            offset_exposure = self.offset
-        if hasattr(self, 'exposure'):
-            offset_exposure = offset_exposure + self.exposure
-        self._offset_exposure = offset_exposure
+        data_weights, offset_exposure = self._setup_irls()
 
         wlsexog = self.exog
         if start_params is None:
@@ -704,16 +729,23 @@ class GLM(base.LikelihoodModel):
         if maxiter == 0:
             mu = self.family.fitted(lin_pred)
             self.scale = self.estimate_scale(mu)
-            wls_results = lm.RegressionResults(self, start_params, None)
+            params = start_params
+            normalized_cov_params = None
             iteration = 0
+        if wls_method != 'wls':
+            wls_solver = _MinimalWLS(wlsexog, method=wls_method)
         for iteration in range(maxiter):
             self.weights = data_weights*self.family.weights(mu)
             wlsendog = (lin_pred + self.family.link.deriv(mu) * (self.endog-mu)
                         - offset_exposure)
-            wls_results = lm.WLS(wlsendog, wlsexog, self.weights).fit()
-            lin_pred = np.dot(self.exog, wls_results.params) + offset_exposure
+            if wls_method == 'wls':
+                wls_results = lm.WLS(wlsendog, wlsexog, self.weights).fit()
+                params = wls_results.params
+            else:
+                params = wls_solver.fit(wlsendog, self.weights)
+            lin_pred = np.dot(self.exog, params) + offset_exposure
             mu = self.family.fitted(lin_pred)
-            history = self._update_history(wls_results, mu, history)
+            history = self._update_history(params, mu, history)
             self.scale = self.estimate_scale(mu)
             if endog.squeeze().ndim == 1 and np.allclose(mu - endog, 0):
                 msg = "Perfect separation detected, results not available"
@@ -722,9 +754,14 @@ class GLM(base.LikelihoodModel):
             if converged:
                 break
         self.mu = mu
+        if maxiter > 0:
+            if wls_method == 'wls':
+                normalized_cov_params = wls_results.normalized_cov_params
+            else:
+                normalized_cov_params = wls_solver.normalized_cov_params()
 
-        glm_results = GLMResults(self, wls_results.params,
-                                 wls_results.normalized_cov_params,
+        glm_results = GLMResults(self, params,
+                                 normalized_cov_params,
                                  self.scale,
                                  cov_type=cov_type, cov_kwds=cov_kwds,
                                  use_t=use_t)
@@ -734,6 +771,155 @@ class GLM(base.LikelihoodModel):
         return GLMResultsWrapper(glm_results)
 
 
+    def fit_regularized_path(self, alphas, L1_wt=1., start_params=None,
+                             maxiter=100, tol=1e-8, cd_maxiter=1000,
+                             cnvrg_tol=1e-8, zero_tol=1e-8):
+        """
+        Return the elastic net coefficients for a sequence of penalties.
+
+        Parameters
+        ----------
+        alphas : array-like
+            The penalty weights. If 1d, each element is a penalty weight
+            that applies to all variables. If 2d, each row contains the
+            penalty weights for the individual coefficients.
+        L1_wt : scalar
+            The fraction of the penalty given to the L1 penalty term.
+            Must be between 0 and 1 (inclusive).  If 0, the fit is
+            ridge regression.  If 1, the fit is the lasso.
+        start_params : array-like, optional
+            Starting values for the largest penalty. The default starts
+            IRLS at ``family.starting_mu(endog)``.
+        maxiter : int
+            Maximum number of IRLS iterations for each penalty.
+        tol : float
+            Convergence tolerance for the sup-norm of the change in
+            ``params`` in an IRLS iteration.
+        cd_maxiter : int
+            Maximum number of coordinate descent cycles for each weighted
+            least squares problem.
+        cnvrg_tol : float
+            Convergence tolerance of the coordinate descent.
+        zero_tol : float
+            Any estimated coefficient smaller than this value is replaced
+            with zero.
+
+        Returns
+        -------
+        params : ndarray
+            Array with shape (n_alphas, k_exog). Row i contains the
+            coefficients for penalty ``alphas[i]``.
+
+        Notes
+        -----
+        The function that is minimized is: ..math::
+
+            -loglike/n + alpha*((1-L1_wt)*|params|_2^2/2 + L1_wt*|params|_1)
+
+        where the loglikelihood is evaluated with scale equal to 1. Each
+        penalty is solved by IRLS, where the weighted least squares
+        problem is replaced by an elastic net problem that is solved by
+        coordinate descent. The penalties are solved in decreasing order
+        and each one starts at the solution of the previous one. Variables
+        are screened with the sequential strong rule, and the optimality
+        conditions for the discarded variables are checked after each
+        fit.
+
+        No results instances are created.
+
+        References
+        ----------
+        Friedman, Hastie, Tibshirani (2008).  Regularization paths for
+        generalized linear models via coordinate descent.  Journal of
+        Statistical Software 33(1), 1-22 Feb 2010.
+        """
+        data_weights, offset_exposure = self._setup_irls()
+        family = self.family
+        endog = self.endog
+        exog = self.exog
+        nobs, k_exog = exog.shape
+
+        alphas = np.asarray(alphas, dtype=np.float64)
+        if alphas.ndim == 1:
+            alphas = alphas[:, None] * np.ones(k_exog, dtype=np.float64)
+        n_alphas = alphas.shape[0]
+        # solve from the largest to the smallest penalty
+        order = np.argsort(-alphas.sum(1), kind='mergesort')
+        # Below we work with -2 * loglike + penalty, so we need to rescale.
+        pen = 2 * nobs * alphas[order]
+
+        if start_params is None:
+            params = np.zeros(k_exog, dtype=np.float64)
+            mu = family.starting_mu(endog)
+            lin_pred = family.predict(mu)
+        else:
+            params = np.array(start_params, dtype=np.float64)
+            lin_pred = np.dot(exog, params) + offset_exposure
+            mu = family.fitted(lin_pred)
+
+        def gradient(mu):
+            # gradient of 2 * loglike with scale 1
+            score_factor = ((endog - mu) /
+                            (family.link.deriv(mu) * family.variance(mu)))
+            return 2 * np.dot(exog.T, data_weights * score_factor)
+
+        params_path = np.zeros((n_alphas, k_exog), dtype=np.float64)
+        converged = np.zeros(n_alphas, dtype=bool)
+        l1_pen_prev = None
+        for i in range(n_alphas):
+            l1_pen = pen[i] * L1_wt
+            if l1_pen_prev is None:
+                keep = np.ones(k_exog, dtype=bool)
+            else:
+                keep = ((np.abs(gradient(mu)) >= 2 * l1_pen - l1_pen_prev) |
+                        (params != 0))
+
+            while True:
+                ii = np.flatnonzero(keep)
+                exog_ii = exog[:, ii]
+                for iteration in range(maxiter):
+                    weights = data_weights * family.weights(mu)
+                    wlsendog = (lin_pred + family.link.deriv(mu) * (endog-mu)
+                                - offset_exposure)
+                    sqrt_w = np.sqrt(weights)
+                    params_ii, _, _ = _elastic_net_cd(
+                        exog_ii * sqrt_w[:, None], wlsendog * sqrt_w,
+                        pen[i, ii], L1_wt, start_params=params[ii],
+                        maxiter=cd_maxiter, cnvrg_tol=cnvrg_tol)
+                    if len(ii) > 0:
+                        pchange = np.max(np.abs(params_ii - params[ii]))
+                    else:
+                        pchange = 0.
+                    params = np.zeros(k_exog, dtype=np.float64)
+                    params[ii] = params_ii
+                    lin_pred = np.dot(exog_ii, params_ii) + offset_exposure
+                    mu = family.fitted(lin_pred)
+                    converged[i] = pchange < tol
+                    if converged[i]:
+                        break
+                if keep.all():
+                    break
+
+                # KKT check for the discarded variables
+                violators = ~keep & (np.abs(gradient(mu)) > l1_pen)
+                if not violators.any():
+                    break
+                keep |= violators
+
+            params_path[i] = params
+            l1_pen_prev = l1_pen
+
+        if not converged.all():
+            warnings.warn("IRLS did not converge for %d of %d penalties" %
+                          ((~converged).sum(), n_alphas), ConvergenceWarning)
+
+        # Set approximate zero coefficients to be exactly zero
+        params_path *= np.abs(params_path) >= zero_tol
+
+        params = np.empty_like(params_path)
+        params[order] = params_path
+        return params
+
     def fit_constrained(self, constraints, start_params=None, **fit_kwds):
         """fit the model subject to linear equality constraints
 
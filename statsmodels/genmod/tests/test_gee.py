@@ -967,6 +967,62 @@ class TestGEE(object):
         assert_almost_equal([x.params[0] for x in ps],
                             np.r_[-0.1256575, -0.126747036])
 
+    def test_batch_update(self):
+        # Batched estimating equations against dense per-group solves,
+        # with unequal group sizes and unsorted groups.
+        np.random.seed(4387)
+        sizes = np.random.randint(1, 6, size=60)
+        groups = np.random.permutation(np.repeat(np.arange(60), sizes))
+        n = len(groups)
+        exog = np.column_stack((np.ones(n), np.random.normal(size=(n, 2))))
+        lpr = np.dot(exog, [0.2, 0.5, -0.3])
+        endog = np.random.poisson(np.exp(lpr))
+
+        for v in Independence(), Exchangeable(), Autoregressive():
+            family = Poisson()
+            md = GEE(endog, exog, groups, family=family, cov_struct=v)
+            md._fit_history = {"cov_adjust": []}
+            v.dep_params = 0.3
+            md.update_cached_means(np.r_[0.1, 0.4, -0.2])
+            update, score = md._update_mean_params()
+
+            bmat, score1 = 0, 0
+            for i in range(md.num_group):
+                expval, lpr = md.cached_means[i]
+                dmat = md.mean_deriv(md.exog_li[i], lpr)
+                sdev = np.sqrt(family.variance(expval))
+                vmat = v.covariance_matrix(expval, i)[0]
+                vmat *= np.outer(sdev, sdev)
+                bmat += np.dot(dmat.T, np.linalg.solve(vmat, dmat))
+                score1 += np.dot(dmat.T, np.linalg.solve(
+                    vmat, md.endog_li[i] - expval))
+
+            assert_allclose(score, score1, rtol=1e-10)
+            assert_allclose(update, np.linalg.solve(bmat, score1),
+                            rtol=1e-10)
+
+            # bias-corrected sandwich with dense hat matrices
+            cov_robust, cov_naive, cov_robust_bc, _ = md._covmat()
+            scale = md.estimate_scale()
+            assert_allclose(cov_naive, np.linalg.inv(bmat) * scale,
+                            rtol=1e-10)
+            bcm = 0
+            for i in range(md.num_group):
+                expval, lpr = md.cached_means[i]
+                dmat = md.mean_deriv(md.exog_li[i], lpr)
+                sdev = np.sqrt(family.variance(expval))
+                vmat = v.covariance_matrix(expval, i)[0]
+                vmat *= np.outer(sdev, sdev)
+                hmat = np.dot(dmat, np.dot(cov_naive, np.linalg.solve(
+                    vmat, dmat).T)) / scale
+                aresid = np.linalg.solve(np.eye(len(expval)) - hmat,
+                                         md.endog_li[i] - expval)
+                srt = np.dot(dmat.T, np.linalg.solve(vmat, aresid)) / scale
+                bcm += np.outer(srt, srt)
+            assert_allclose(cov_robust_bc,
+                            np.dot(cov_naive, np.dot(bcm, cov_naive)),
+                            rtol=1e-10)
+
 
 class CheckConsistency(object):
 
@@ -762,6 +762,67 @@ def test_loglike_no_opt():
         like = llf(params)
         assert_almost_equal(like, res.llf)
 
+def test_wls_method():
+    # lightweight IRLS solvers versus a full WLS model in each iteration
+    np.random.seed(987125)
+    nobs = 500
+    exog = add_constant(np.random.randn(nobs, 3))
+    linpred = exog.dot([0.5, 0.2, -0.3, 0.1])
+    endog_pois = np.random.poisson(np.exp(linpred))
+    endog_bin = np.random.binomial(1, 1 / (1 + np.exp(-linpred)))
+    for endog, family in [(endog_pois, sm.families.Poisson()),
+                          (endog_bin, sm.families.Binomial())]:
+        mod = GLM(endog, exog, family=family)
+        res_wls = mod.fit(wls_method='wls')
+        for wls_method in ['cholesky', 'qr', 'pinv']:
+            res = mod.fit(wls_method=wls_method)
+            assert_allclose(res.params, res_wls.params, rtol=1e-10)
+            assert_allclose(res.bse, res_wls.bse, rtol=1e-10)
+            assert_allclose(res.llf, res_wls.llf, rtol=1e-12)
+            assert_equal(res.fit_history['iteration'],
+                         res_wls.fit_history['iteration'])
+
+    # singular design falls back to the pseudoinverse
+    exog2 = np.column_stack((exog, exog[:, 1]))
+    mod = GLM(endog_pois, exog2, family=sm.families.Poisson())
+    res_wls = mod.fit(wls_method='wls')
+    res = mod.fit()
+    assert_allclose(res.params, res_wls.params, rtol=1e-8)
+
+    assert_raises(ValueError, mod.fit, wls_method='svd')
+
+
+def test_regularized_path():
+    np.random.seed(2341)
+    nobs, k_exog = 300, 8
+    exog = np.random.normal(size=(nobs, k_exog))
+    linpred = 0.3 * exog[:, :3].sum(1)
+    alphas = np.array([0.2, 0.05, 0.1, 0.01])
+
+    # Gaussian GLM with identity link is the same problem as OLS
+    endog = linpred + np.random.normal(size=nobs)
+    mod = GLM(endog, exog)
+    path = mod.fit_regularized_path(alphas, L1_wt=0.5)
+    path_ols = sm.OLS(endog, exog).fit_regularized_path(alphas, L1_wt=0.5)
+    assert_allclose(path, path_ols, atol=1e-6)
+
+    # Poisson, check the optimality conditions of the lasso
+    endog = np.random.poisson(np.exp(linpred))
+    mod = GLM(endog, exog, family=sm.families.Poisson())
+    path = mod.fit_regularized_path(alphas)
+    assert_equal(path.shape, (len(alphas), k_exog))
+    for alpha, params in zip(alphas, path):
+        score = mod.score(params, scale=1.) / nobs
+        ii = params != 0
+        assert_allclose(score[ii], alpha * np.sign(params[ii]), atol=1e-5)
+        assert_array_less(np.abs(score[~ii]), alpha + 1e-5)
+
+    # no penalty gives the maximum likelihood estimate
+    res = mod.fit()
+    path = mod.fit_regularized_path([0.])
+    assert_allclose(path[0], res.params, rtol=1e-6)
+
+
 if __name__=="__main__":
     #run_module_suite()
     #taken from Fernando Perez:
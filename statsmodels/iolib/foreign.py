@@ -12,7 +12,6 @@ numpy.lib.io
 from statsmodels.compat.python import (zip, lzip, lmap, lrange, string_types, long, lfilter,
                                 asbytes, asstr, range)
 from struct import unpack, calcsize, pack
-from struct import error as struct_error
 import datetime
 import sys
 import numpy as np
@@ -291,6 +290,8 @@ class StataReader(object):
                     [(251, np.int16),(252, np.int32),(253, int),
                         (254, np.float32), (255, np.float64)])
     TYPE_MAP = lrange(251)+list('bhlfd')
+    RECORD_TYPE_MAP = {'b' : 'i1', 'h' : 'i2', 'l' : 'i4', 'f' : 'f4',
+                       'd' : 'f8'}
     #NOTE: technically, some of these are wrong. there are more numbers
     # that can be represented. it's the 27 ABOVE and BELOW the max listed
     # numeric data type in [U] 12.2.2 of the 11.2 manual
@@ -399,6 +400,97 @@ class StataReader(object):
             for i in range(self._header['nobs']):
                 yield self._next()
 
+    def data(self, columns=None, start=0, nrows=None, missing_flt=-999.,
+             memmap=False):
+        """
+        Returns a block of observations as a structured ndarray.
+
+        The records are decoded in bulk with a numpy dtype built from the
+        file's type list, and missing values are replaced column-wise.
+
+        Parameters
+        ----------
+        columns : list, optional
+            Names or integer positions of the variables to return. Defaults
+            to all variables in the order stored in the file.
+        start : int, optional
+            Zero-indexed first observation to read.
+        nrows : int, optional
+            Number of observations to read. Defaults to all observations
+            from `start` to the end of the file.
+        missing_flt : numeric
+            The value to replace missing values with in numeric variables.
+        memmap : bool, optional
+            If True and the underlying file has a file descriptor, the data
+            block is memory-mapped instead of read into memory. Only the
+            requested columns are copied out of the map.
+
+        Returns
+        -------
+        data : ndarray
+            Structured array with the dtypes given by the `dtyplist` header.
+
+        Notes
+        -----
+        Missing values are always replaced by `missing_flt`, the
+        missing_values option only affects `dataset`. String variables are
+        returned as null-terminated bytes, i.e. they are not decoded.
+        """
+        header = self._header
+        varlist = header['varlist']
+        if columns is None:
+            idx = lrange(header['nvar'])
+        else:
+            idx = [c if isinstance(c, (int, long)) else varlist.index(c)
+                   for c in columns]
+
+        records = self._read_records(start, nrows, memmap)
+        dt = np.dtype([(varlist[i], header['dtyplist'][i]) for i in idx])
+        data = np.empty(len(records), dtype=dt)
+        for i in idx:
+            name = varlist[i]
+            typ = header['typlist'][i]
+            col = records[name]
+            if isinstance(typ, int):
+                # numpy strips trailing nulls only, Stata may leave garbage
+                # after the terminating null, so zero all bytes after the
+                # first null
+                raw = np.array(col, dtype='S%d' % typ).view(np.uint8)
+                raw = raw.reshape(len(col), typ)
+                raw[np.logical_or.accumulate(raw == 0, axis=1)] = 0
+                data[name] = raw.view('S%d' % typ)[:, 0]
+            else:
+                nmin, nmax = self.MISSING_VALUES[typ]
+                data[name] = col
+                missing = (col < nmin) | (col > nmax)
+                if missing.any():
+                    data[name][missing] = missing_flt
+        return data
+
+    def data_chunks(self, chunksize, columns=None, missing_flt=-999.,
+                    memmap=False):
+        """
+        Returns a generator over the dataset in blocks of observations.
+
+        Parameters
+        ----------
+        chunksize : int
+            Maximum number of observations in each block.
+        columns, missing_flt, memmap
+            See `data`.
+
+        Returns
+        -------
+        Generator object yielding structured ndarrays of at most `chunksize`
+        observations each.
+        """
+        chunksize = int(chunksize)
+        if chunksize < 1:
+            raise ValueError("chunksize must be a positive integer")
+        for start in range(0, len(self), chunksize):
+            yield self.data(columns=columns, start=start, nrows=chunksize,
+                            missing_flt=missing_flt, memmap=memmap)
+
     ### Python special methods
 
     def __len__(self):
@@ -518,6 +610,42 @@ class StataReader(object):
         else:
             return self._col_sizes[k]
 
+    def _record_dtype(self):
+        """Structured dtype of one observation as stored in the file."""
+        byteorder = self._header['byteorder']
+        formats = []
+        for typ in self._header['typlist']:
+            if isinstance(typ, int):
+                formats.append('S%d' % typ)
+            else:
+                # Stata bytes are signed, so 'b' is stored as int8
+                formats.append(byteorder + self.RECORD_TYPE_MAP[typ])
+        return np.dtype({'names' : self._header['varlist'],
+                         'formats' : formats})
+
+    def _read_records(self, start=0, nrows=None, memmap=False):
+        """Raw records in [start, start + nrows) without any conversion."""
+        nobs = len(self)
+        if start < 0 or start > nobs:
+            raise IndexError(start)
+        if nrows is None:
+            nrows = nobs - start
+        nrows = max(0, min(nrows, nobs - start))
+        dt = self._record_dtype()
+        offset = self._data_location + start * dt.itemsize
+
+        if memmap and nrows > 0:
+            try:
+                self._file.fileno()
+            except Exception:
+                pass
+            else:
+                return np.memmap(self._file, dtype=dt, mode='r',
+                                 offset=offset, shape=(nrows,))
+        self._file.seek(offset)
+        return np.frombuffer(self._file.read(nrows * dt.itemsize), dtype=dt,
+                             count=nrows)
+
     def _unpack(self, fmt, byt):
         d = unpack(self._header['byteorder']+fmt, byt)[0]
         if fmt[-1] in self.MISSING_VALUES:
@@ -666,8 +794,6 @@ def _maybe_convert_to_int_keys(convert_dates, varlist):
             new_dict.update({key : convert_dates[key]})
     return new_dict
 
-_type_converters = {253 : np.long, 252 : int}
-
 class StataWriter(object):
     """
     A class for writing Stata binary dta files from array-like objects
@@ -729,6 +855,8 @@ class StataWriter(object):
                        'l' : 2147483621,
                        'f': 1.7014118346046923e+38,
                        'd': 8.98846567431158e+307}
+    RECORD_TYPE_MAP = {'b' : 'i1', 'h' : 'i2', 'l' : 'i4', 'f' : 'f4',
+                       'd' : 'f8'}
     def __init__(self, fname, data, convert_dates=None, encoding="latin-1",
                  byteorder=None):
 
@@ -767,7 +895,6 @@ class StataWriter(object):
         self.nobs = len(data)
         self.nvar = len(data.dtype)
         self.data = data
-        self.datarows = iter(data)
         dtype = data.dtype
         descr = dtype.descr
         if dtype.names is None:
@@ -804,7 +931,6 @@ class StataWriter(object):
             data = data[:,None]
         self.nobs, self.nvar = data.shape
         self.data = data
-        self.datarows = iter(data)
         #TODO: this should be user settable
         dtype = data.dtype
         self.varlist = _default_names(self.nvar)
@@ -815,16 +941,7 @@ class StataWriter(object):
     def _prepare_pandas(self, data):
         #NOTE: we might need a different API / class for pandas objects so
         # we can set different semantics - handle this with a PR to pandas.io
-        class DataFrameRowIter(object):
-            def __init__(self, data):
-                self.data = data
-
-            def __iter__(self):
-                for i, row in data.iterrows():
-                    yield row
-
         data = data.reset_index()
-        self.datarows = DataFrameRowIter(data)
         self.nobs, self.nvar = data.shape
         self.data = data
         self.varlist = data.columns.tolist()
@@ -844,16 +961,25 @@ class StataWriter(object):
             for key in convert_dates:
                 self.fmtlist[key] = convert_dates[key]
 
-    def write_file(self):
+    def write_file(self, chunksize=100000):
+        """
+        Writes the dta file.
+
+        Parameters
+        ----------
+        chunksize : int
+            The data is encoded and written in blocks of this many
+            observations.
+        """
         self._write_header()
         self._write_descriptors()
         self._write_variable_labels()
         # write 5 zeros for expansion fields
         self._write(_pad_bytes("", 5))
         if self._convert_dates is None:
-            self._write_data_nodates()
+            self._write_data_nodates(chunksize)
         else:
-            self._write_data_dates()
+            self._write_data_dates(chunksize)
         #self._write_value_labels()
 
     def _write_header(self, data_label=None, time_stamp=None):
@@ -919,55 +1045,75 @@ class StataWriter(object):
             for i in range(nvar):
                 self._write(_pad_bytes("", 81))
 
-    def _write_data_nodates(self):
-        data = self.datarows
-        byteorder = self._byteorder
-        TYPE_MAP = self.TYPE_MAP
-        typlist = self.typlist
-        for row in data:
-            #row = row.squeeze().tolist() # needed for structured arrays
-            for i,var in enumerate(row):
-                typ = ord(typlist[i])
-                if typ <= 244: # we've got a string
-                    if len(var) < typ:
-                        var = _pad_bytes(asstr(var), len(var) + 1)
-                    self._write(var)
-                else:
-                    try:
-                        self._write(pack(byteorder+TYPE_MAP[typ], var))
-                    except struct_error:
-                        # have to be strict about type pack won't do any
-                        # kind of casting
-                        self._write(pack(byteorder+TYPE_MAP[typ],
-                                    _type_converters[typ](var)))
-
-    def _write_data_dates(self):
-        convert_dates = self._convert_dates
-        data = self.datarows
+    def _write_data_nodates(self, chunksize=100000):
+        self._write_data(chunksize, dates=False)
+
+    def _write_data_dates(self, chunksize=100000):
+        self._write_data(chunksize, dates=True)
+
+    def _record_dtype(self):
+        """
+        Structured dtype of one observation as written to the file.
+        """
         byteorder = self._byteorder
-        TYPE_MAP = self.TYPE_MAP
-        MISSING_VALUES = self.MISSING_VALUES
-        typlist = self.typlist
-        for row in data:
-            #row = row.squeeze().tolist() # needed for structured arrays
-            for i,var in enumerate(row):
-                typ = ord(typlist[i])
-                #NOTE: If anyone finds this terribly slow, there is
-                # a vectorized way to convert dates, see genfromdta for going
-                # from int to datetime and reverse it. will copy data though
+        formats = []
+        for typ in self.typlist:
+            typ = ord(typ)
+            if typ <= 244: # we've got a string
+                formats.append('S%d' % typ)
+            else:
+                formats.append(byteorder +
+                               self.RECORD_TYPE_MAP[self.TYPE_MAP[typ]])
+        names = ['v%d' % i for i in range(self.nvar)]
+        return np.dtype({'names' : names, 'formats' : formats})
+
+    def _data_columns(self, start, stop):
+        """
+        Returns the columns of the observations in [start, stop).
+        """
+        data = self.data[start:stop]
+        if data_util._is_using_pandas(data, None):
+            # iterating over a Series boxes datetime64 into datetimes
+            return [data[name] for name in self.varlist]
+        elif data.dtype.names is not None:
+            return [data[name] for name in data.dtype.names]
+        else:
+            return [data[:, i] for i in range(self.nvar)]
+
+    def _write_data(self, chunksize, dates=False):
+        """
+        Encodes the data column by column into Stata records and writes
+        them to the file in blocks of at most chunksize observations.
+        """
+        convert_dates = self._convert_dates if dates else {}
+        fmtlist = self.fmtlist
+        dtype = self._record_dtype()
+        names = dtype.names
+        chunksize = max(1, int(chunksize))
+        for start in range(0, self.nobs, chunksize):
+            stop = min(start + chunksize, self.nobs)
+            records = np.empty(stop - start, dtype=dtype)
+            for i, col in enumerate(self._data_columns(start, stop)):
+                typ = ord(self.typlist[i])
                 if i in convert_dates:
-                    var = _datetime_to_stata_elapsed(var, self.fmtlist[i])
+                    col = [x if isnull(x) else
+                           _datetime_to_stata_elapsed(x, fmtlist[i])
+                           for x in col]
+                col = np.asarray(col)
                 if typ <= 244: # we've got a string
-                    if isnull(var):
-                        var = "" # missing string
-                    if len(var) < typ:
-                        var = _pad_bytes(var, len(var) + 1)
-                    self._write(var)
-                else:
-                    if isnull(var): # this only matters for floats
-                        var = MISSING_VALUES[typ]
-                    self._write(pack(byteorder+TYPE_MAP[typ], var))
-
+                    if col.dtype.type != np.string_:
+                        col = np.array([asbytes('') if isnull(x) else
+                                        asbytes(x) for x in col],
+                                       dtype='S%d' % typ)
+                elif dates:
+                    missing = isnull(col) # this only matters for floats
+                    if np.any(missing):
+                        col = np.where(missing,
+                                self.MISSING_VALUES[self.TYPE_MAP[typ]], col)
+                # assigning to the field casts, pads strings with null
+                # bytes and swaps to the file's byteorder
+                records[names[i]] = col
+            self._file.write(records.tostring())
 
     def _null_terminate(self, s, encoding):
         null_byte = '\x00'
@@ -979,7 +1125,7 @@ class StataWriter(object):
             return s
 
 def genfromdta(fname, missing_flt=-999., encoding=None, pandas=False,
-                convert_dates=True):
+                convert_dates=True, columns=None, memmap=False):
     """
     Returns an ndarray or DataFrame from a Stata .dta file.
 
@@ -998,6 +1144,12 @@ def genfromdta(fname, missing_flt=-999., encoding=None, pandas=False,
     convert_dates : bool
         If convert_dates is True, then Stata formatted dates will be converted
         to datetime types according to the variable's format.
+    columns : list, optional
+        Names or integer positions of the variables to read. Defaults to all
+        variables.
+    memmap : bool
+        If True, memory-map the data block of the file instead of reading it
+        into memory before decoding. See `StataReader.data`.
     """
     if isinstance(fname, string_types):
         fhd = StataReader(open(fname, 'rb'), missing_values=False,
@@ -1011,32 +1163,20 @@ def genfromdta(fname, missing_flt=-999., encoding=None, pandas=False,
 #                                    deletechars=deletechars,
 #                                    case_sensitive=case_sensitive)
 
-    #TODO: This needs to handle the byteorder?
     header = fhd.file_headers()
-    types = header['dtyplist']
-    nobs = header['nobs']
-    numvars = header['nvar']
     varnames = header['varlist']
     fmtlist = header['fmtlist']
     dataname = header['data_label']
     labels = header['vlblist'] # labels are thrown away unless DataArray
                                # type is used
-    data = np.zeros((nobs,numvars))
-    stata_dta = fhd.dataset()
-
-    dt = np.dtype(lzip(varnames, types))
-    data = np.zeros((nobs), dtype=dt) # init final array
-
-    for rownum,line in enumerate(stata_dta):
-        # doesn't handle missing value objects, just casts
-        # None will only work without missing value object.
-        if None in line:
-            for i,val in enumerate(line):
-                #NOTE: This will only be scalar types because missing strings
-                # are empty not None in Stata
-                if val is None:
-                    line[i] = missing_flt
-        data[rownum] = tuple(line)
+    if columns is not None:
+        columns = [c if isinstance(c, (int, long)) else varnames.index(c)
+                   for c in columns]
+        fmtlist = [fmtlist[i] for i in columns]
+
+    #NOTE: missing strings are empty not missing in Stata, so missing_flt
+    # only replaces numeric values
+    data = fhd.data(columns=columns, missing_flt=missing_flt, memmap=memmap)
 
     if pandas:
         from pandas import DataFrame
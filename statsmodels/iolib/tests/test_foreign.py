@@ -190,6 +190,74 @@ def test_datetime_roundtrip():
     ptesting.assert_frame_equal(dta, dta2.drop('index', axis=1))
 
 
+def test_stata_reader_data():
+    # bulk decoding against the row-wise reader
+    from statsmodels.iolib.foreign import StataReader
+    fname = os.path.join(curdir, "results/data_missing.dta")
+    reader = StataReader(open(fname, 'rb'))
+    rows = list(reader.dataset())
+    data = reader.data(missing_flt=-999)
+    assert_equal(len(data), len(rows))
+    for row, rec in zip(rows, data):
+        for val, val2 in zip(row, rec):
+            assert_equal(-999 if val is None else val, val2)
+
+    # strings are cut at the first null byte, Stata can leave bytes after it
+    dta = np.array([(1., asbytes("a")), (2., asbytes("bc")),
+                    (3., asbytes("def"))],
+                   dtype=[("x", float), ("s", "a3")])
+    buf = BytesIO()
+    StataWriter(buf, dta).write_file()
+    raw = buf.getvalue()
+    pos = len(raw) - 3 * 11 + 8 + 2 # last byte of the first string
+    buf = BytesIO(raw[:pos] + asbytes("z") + raw[pos + 1:])
+    reader = StataReader(buf)
+    rows = list(reader.dataset())
+    data = reader.data()
+    assert_array_equal(data["s"], dta["s"])
+    assert_array_equal(data["x"], dta["x"])
+    assert_equal([asbytes(row[1]) for row in rows], list(dta["s"]))
+    assert_array_equal(genfromdta(BytesIO(raw))["s"], dta["s"])
+
+    fname = curdir+'/../../datasets/macrodata/macrodata.dta'
+    reader = StataReader(open(fname, 'rb'))
+    data = reader.data()
+    chunks = list(reader.data_chunks(50, memmap=True))
+    assert_equal(len(chunks), (len(reader) + 49) // 50)
+    assert_array_equal(np.concatenate(chunks), data)
+
+    res = reader.data(columns=['realgdp', 0], start=10, nrows=20)
+    assert_equal(res.dtype.names, ('realgdp', 'year'))
+    assert_array_equal(res['realgdp'], data['realgdp'][10:30])
+    assert_array_equal(res['year'], data['year'][10:30])
+
+    dta = genfromdta(fname, columns=['realgdp', 'year'], memmap=True)
+    dta2 = genfromdta(fname)
+    assert_array_equal(dta['realgdp'], dta2['realgdp'])
+    assert_array_equal(dta['year'], dta2['year'])
+
+
+def test_stata_writer_chunked():
+    dta = np.array([(1.5, 2, asbytes("a")),
+                    (np.nan, -3, asbytes("bc")),
+                    (4., 5, asbytes("def"))],
+                   dtype=[("v1", float), ("v2", np.int32), ("v3", "a3")])
+    buf = BytesIO()
+    writer = StataWriter(buf, dta)
+    writer.write_file()
+    buf2 = BytesIO()
+    writer = StataWriter(buf2, dta)
+    writer.write_file(chunksize=2)
+    # same records apart from the time stamp in the header
+    assert_equal(len(buf.getvalue()), len(buf2.getvalue()))
+    assert_equal(buf.getvalue()[-3 * 13:], buf2.getvalue()[-3 * 13:])
+    buf2.seek(0)
+    dta2 = genfromdta(buf2, missing_flt=np.nan)
+    assert_array_equal(dta2["v1"], dta["v1"])
+    assert_array_equal(dta2["v2"], dta["v2"])
+    assert_array_equal(dta2["v3"], dta["v3"])
+
+
 if __name__ == "__main__":
     import nose
     nose.runmodule(argv=[__file__,'-vvs','-x','--pdb'],
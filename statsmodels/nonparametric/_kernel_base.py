@@ -427,6 +427,133 @@ class LeaveOneOut(object):
             yield X[index, :]
 
 
+def _gpke_blocks(bw, data, var_type, data_predict=None,
+                 leave_one_out=False, block_size=None):
+    """
+    Generates row blocks of the generalized product kernel matrix.
+
+    Parameters
+    ----------
+    bw: 1-D ndarray
+        The bandwidth parameters.
+    data: 2-D ndarray
+        The training data, shape (nobs, k_vars).
+    var_type: str
+        The variable type (continuous, ordered, unordered).
+    data_predict: 2-D ndarray, optional
+        The evaluation points, shape (n_predict, k_vars).  If None, `data`
+        is used.
+    leave_one_out: bool
+        If True, the kernel matrix is for the leave-one-out estimates at
+        the training data.  The diagonal is set to zero, and the number of
+        levels of unordered variables is computed without the observation
+        that is left out.  `data_predict` has to be None.
+    block_size: int, optional
+        Number of evaluation points in a block.  The default limits the
+        kernel matrix of a block to about 2**20 elements.
+
+    Yields
+    ------
+    start, stop: int
+        The evaluation points of the block are ``data_predict[start:stop]``.
+    Kval: 2-D ndarray
+        Array of shape (stop - start, nobs), where ``Kval[i]`` is equal to
+        ``gpke(bw, data, data_predict[start + i], var_type, tosum=False)``,
+        or its leave-one-out version.
+
+    Notes
+    -----
+    Only the default kernels of `gpke` are supported.
+    """
+    data = np.asarray(data)
+    bw = np.asarray(bw)
+    nobs = data.shape[0]
+    if data_predict is None:
+        data_predict = data
+    elif leave_one_out:
+        raise ValueError("leave_one_out requires data_predict=None")
+    n_predict = data_predict.shape[0]
+    if block_size is None:
+        block_size = max(1, 2**20 // nobs)
+
+    num_levels = {}
+    for ii, vtype in enumerate(var_type):
+        if vtype == 'u':
+            levels, inverse = np.unique(data[:, ii], return_inverse=True)
+            if leave_one_out:
+                singleton = np.bincount(inverse)[inverse] == 1
+                num_levels[ii] = (levels.size - singleton)[:, None]
+            else:
+                num_levels[ii] = np.ones((n_predict, 1)) * levels.size
+
+    iscontinuous = np.array([c == 'c' for c in var_type])
+    norm = np.prod(bw[iscontinuous])
+    for start in range(0, n_predict, block_size):
+        stop = min(start + block_size, n_predict)
+        Kval = np.ones((stop - start, nobs))
+        for ii, vtype in enumerate(var_type):
+            x = data_predict[start:stop, ii][:, None]
+            Xi = data[:, ii]
+            h = bw[ii]
+            if vtype == 'c':
+                Kval *= kernels.gaussian(h, Xi, x)
+            elif vtype == 'o':
+                Kval *= np.where(Xi == x, 1 - h,
+                                 0.5 * (1 - h) * (h ** np.abs(Xi - x)))
+            else:
+                Kval *= np.where(Xi == x, 1 - h,
+                                 h / (num_levels[ii][start:stop] - 1.))
+
+        if leave_one_out:
+            Kval[np.arange(stop - start), np.arange(start, stop)] = 0
+        Kval /= norm
+        yield start, stop, Kval
+
+
+def _loo_gpke(bw, data, var_type, block_size=None):
+    """
+    Returns the leave-one-out generalized product kernel sums at the data.
+
+    Element ``i`` of the result is equal to ``gpke(bw, data_not_i, data[i],
+    var_type)``, where ``data_not_i`` is `data` without row ``i``, i.e. the
+    sum used by the leave-one-out likelihood.
+
+    Parameters
+    ----------
+    bw: 1-D ndarray
+        The bandwidth parameters.
+    data: 2-D ndarray
+        The training data, shape (nobs, k_vars).
+    var_type: str
+        The variable type (continuous, ordered, unordered).
+    block_size: int, optional
+        Number of observations for which the kernel weights are computed
+        at the same time, see `_gpke_blocks`.
+
+    Returns
+    -------
+    dens: 1-D ndarray
+        The leave-one-out sums for each observation.
+
+    Notes
+    -----
+    The kernel matrix is computed for row blocks of the data and its
+    diagonal, the contribution of the observation itself, is set to zero
+    before summing.  No leave-one-out copies of the data are created.
+
+    Only the default kernels of `gpke` are supported.  As in
+    `LeaveOneOut` with `gpke`, the number of levels of an unordered
+    variable is computed without the observation that is left out.
+    """
+    dens = np.empty(np.shape(data)[0])
+    for start, stop, Kval in _gpke_blocks(bw, data, var_type,
+                                          leave_one_out=True,
+                                          block_size=block_size):
+        dens[start:stop] = Kval.sum(axis=1)
+
+    return dens
+
+
 def _get_type_pos(var_type):
     ix_cont = np.array([c == 'c' for c in var_type])
     ix_ord = np.array([c == 'o' for c in var_type])
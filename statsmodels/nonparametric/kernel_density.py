@@ -30,12 +30,12 @@ References
 
 # TODO: make default behavior efficient=True above a certain n_obs
 
-from statsmodels.compat.python import range, next
+from statsmodels.compat.python import range
 import numpy as np
 
 from . import kernels
 from ._kernel_base import GenericKDE, EstimatorSettings, gpke, \
-    LeaveOneOut, _adjust_shape
+    LeaveOneOut, _adjust_shape, _loo_gpke
 
 
 __all__ = ['KDEMultivariate', 'KDEMultivariateConditional', 'EstimatorSettings']
@@ -152,14 +152,12 @@ class KDEMultivariate(GenericKDE):
 
         .. math:: K_{h}(X_{i},X_{j}) =
             \prod_{s=1}^{q}h_{s}^{-1}k\left(\frac{X_{is}-X_{js}}{h_{s}}\right)
-        """
-        LOO = LeaveOneOut(self.data)
-        L = 0
-        for i, X_not_i in enumerate(LOO):
-            f_i = gpke(bw, data=-X_not_i, data_predict=-self.data[i, :],
-                       var_type=self.var_type)
-            L += func(f_i)
 
+        The kernel sums for all observations are computed in row blocks of
+        the pairwise kernel matrix, see `_loo_gpke`.
+        """
+        f = _loo_gpke(bw, self.data, self.var_type)
+        L = np.sum(func(f))
         return -L
 
     def pdf(self, data_predict=None):
@@ -463,19 +461,9 @@ class KDEMultivariateConditional(GenericKDE):
         Similar to ``KDE.loo_likelihood`, but substitute ``f(y|x)=f(x,y)/f(y)``
         for ``f(x)``.
         """
-        yLOO = LeaveOneOut(self.data)
-        xLOO = LeaveOneOut(self.exog).__iter__()
-        L = 0
-        for i, Y_j in enumerate(yLOO):
-            X_not_i = next(xLOO)
-            f_yx = gpke(bw, data=-Y_j, data_predict=-self.data[i, :],
-                        var_type=(self.dep_type + self.indep_type))
-            f_x = gpke(bw[self.k_dep:], data=-X_not_i,
-                       data_predict=-self.exog[i, :],
-                       var_type=self.indep_type)
-            f_i = f_yx / f_x
-            L += func(f_i)
-
+        f_yx = _loo_gpke(bw, self.data, self.dep_type + self.indep_type)
+        f_x = _loo_gpke(bw[self.k_dep:], self.exog, self.indep_type)
+        L = np.sum(func(f_yx / f_x))
         return -L
 
     def pdf(self, endog_predict=None, exog_predict=None):
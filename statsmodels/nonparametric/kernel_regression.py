@@ -37,8 +37,10 @@ import numpy as np
 from scipy import optimize
 from scipy.stats.mstats import mquantiles
 
+from statsmodels.tools.parallel import parallel_func
 from ._kernel_base import GenericKDE, EstimatorSettings, gpke, \
-    LeaveOneOut, _get_type_pos, _adjust_shape, _compute_min_std_IQR
+    LeaveOneOut, _get_type_pos, _adjust_shape, _compute_min_std_IQR, \
+    _gpke_blocks
 
 
 
@@ -234,6 +236,80 @@ class KernelReg(GenericKDE):
         #B_x = (f_x * d_mx - m_x * d_fx) / (f_x ** 2)
         return G, B_x
 
+    def _est_mean_batch(self, bw, data_predict=None, leave_one_out=False,
+                        reg_type=None):
+        """
+        Conditional mean at all evaluation points, computed blockwise.
+
+        Parameters
+        ----------
+        bw : array_like
+            Vector of bandwidth values.
+        data_predict : 2D array_like, optional
+            The evaluation points.  If None, `exog` is used.
+        leave_one_out : bool
+            If True, the estimate at ``exog[i]`` does not use observation
+            ``i``, as in `cv_loo`.  Requires ``data_predict=None``.
+        reg_type : {'lc', 'll'}, optional
+            Type of the estimator.  The default is the model's `reg_type`.
+
+        Returns
+        -------
+        mean : ndarray
+            The estimated conditional mean, equal to the first return of
+            ``_est_loc_constant`` or ``_est_loc_linear`` at each point.
+
+        Notes
+        -----
+        The kernel weights are computed for row blocks of the evaluation
+        points.  For the local linear estimator the weighted moment
+        matrices of all points in a block are stacked and solved together
+        with a pseudo-inverse, as in ``_est_loc_linear``.
+        """
+        if reg_type is None:
+            reg_type = self.reg_type
+        endog = np.squeeze(self.endog, axis=1)
+        exog = self.exog
+        nobs, k_vars = exog.shape
+        if data_predict is None:
+            data_predict = exog
+        n_predict = data_predict.shape[0]
+        block_size = None
+        if reg_type == 'll':
+            # the block also holds the weighted differences
+            block_size = max(1, 2**20 // (nobs * (k_vars + 1)))
+
+        mean = np.empty(n_predict)
+        blocks = _gpke_blocks(bw, exog, self.var_type,
+                              data_predict=(None if leave_one_out
+                                            else data_predict),
+                              leave_one_out=leave_one_out,
+                              block_size=block_size)
+        for start, stop, ker in blocks:
+            if reg_type == 'lc':
+                mean[start:stop] = np.dot(ker, endog) / ker.sum(axis=1)
+                continue
+
+            # Stacked version of the matrices in `_est_loc_linear`
+            dx = exog[None, :, :] - data_predict[start:stop, None, :]
+            ker_dx = ker[:, :, None] * dx
+            M = np.empty((stop - start, k_vars + 1, k_vars + 1))
+            M[:, 0, 0] = ker.sum(axis=1)
+            M[:, 0, 1:] = M[:, 1:, 0] = ker_dx.sum(axis=1)
+            M[:, 1:, 1:] = np.einsum('ijk,ijl->ikl', ker_dx, dx)
+            V = np.empty((stop - start, k_vars + 1))
+            V[:, 0] = np.dot(ker, endog)
+            V[:, 1:] = np.einsum('ijk,j->ik', ker_dx, endog)
+            # pinv(M) * V for the stacked M, with the cutoff of pinv
+            u, sv, vt = np.linalg.svd(M)
+            cutoff = 1e-15 * sv.max(axis=1)[:, None]
+            sv_inv = np.where(sv > cutoff, 1. / np.where(sv > cutoff, sv, 1.),
+                              0.)
+            utv = np.einsum('ijk,ij->ik', u, V) * sv_inv
+            mean[start:stop] = np.einsum('ij,ij->i', vt[:, :, 0], utv)
+
+        return mean
+
     def aic_hurvich(self, bw, func=None):
         """
         Computes the AIC Hurvich criteria for the estimation of the bandwidth.
@@ -254,22 +330,24 @@ class KernelReg(GenericKDE):
         ----------
         See ch.2 in [1] and p.35 in [2].
 
+        Notes
+        -----
+        Only the diagonal of the normalized kernel matrix is needed for
+        its trace.  It is computed from row blocks of the kernel matrix,
+        so that the full nobs x nobs matrix is never stored.
+
         """
-        H = np.empty((self.nobs, self.nobs))
-        for j in range(self.nobs):
-            H[:, j] = gpke(bw, data=self.exog, data_predict=self.exog[j,:],
-                           var_type=self.var_type, tosum=False)
+        trace_H = 0.
+        for start, stop, H in _gpke_blocks(bw, self.exog, self.var_type):
+            idx = np.arange(stop - start)
+            trace_H += (H[idx, idx + start] / H.sum(axis=1)).sum()
 
-        denom = H.sum(axis=1)
-        H = H / denom
-        gx = KernelReg(endog=self.endog, exog=self.exog, var_type=self.var_type,
-                       reg_type=self.reg_type, bw=bw,
-                       defaults=EstimatorSettings(efficient=False)).fit()[0]
+        gx = self._est_mean_batch(bw)
         gx = np.reshape(gx, (self.nobs, 1))
         sigma = ((self.endog - gx)**2).sum(axis=0) / float(self.nobs)
 
-        frac = (1 + np.trace(H) / float(self.nobs)) / \
-               (1 - (np.trace(H) + 2) / float(self.nobs))
+        frac = (1 + trace_H / float(self.nobs)) / \
+               (1 - (trace_H + 2) / float(self.nobs))
         #siga = np.dot(self.endog.T, (I - H).T)
         #sigb = np.dot((I - H), self.endog)
         #sigma = np.dot(siga, sigb) / float(self.nobs)
@@ -305,17 +383,28 @@ class KernelReg(GenericKDE):
         where :math:`g_{-i}(X_{i})` is the leave-one-out estimator of g(X)
         and :math:`h` is the vector of bandwidths
 
-        """
-        LOO_X = LeaveOneOut(self.exog)
-        LOO_Y = LeaveOneOut(self.endog).__iter__()
-        L = 0
-        for ii, X_not_i in enumerate(LOO_X):
-            Y = next(LOO_Y)
-            G = func(bw, endog=Y, exog=-X_not_i,
-                     data_predict=-self.exog[ii, :])[0]
-            L += (self.endog[ii] - G) ** 2
+        For the local constant and local linear estimators of this class
+        all leave-one-out estimates are computed together from row blocks
+        of the kernel matrix, see `_est_mean_batch`.
 
-        # Note: There might be a way to vectorize this. See p.72 in [1]
+        """
+        if func == self._est_loc_constant:
+            G = self._est_mean_batch(bw, leave_one_out=True, reg_type='lc')
+        elif func == self._est_loc_linear:
+            G = self._est_mean_batch(bw, leave_one_out=True, reg_type='ll')
+        else:
+            LOO_X = LeaveOneOut(self.exog)
+            LOO_Y = LeaveOneOut(self.endog).__iter__()
+            L = 0
+            for ii, X_not_i in enumerate(LOO_X):
+                Y = next(LOO_Y)
+                G = func(bw, endog=Y, exog=-X_not_i,
+                         data_predict=-self.exog[ii, :])[0]
+                L += (self.endog[ii] - G) ** 2
+
+            return L / self.nobs
+
+        L = ((np.squeeze(self.endog, axis=1) - G) ** 2).sum()
         return L / self.nobs
 
     def r_squared(self):
@@ -379,7 +468,8 @@ class KernelReg(GenericKDE):
 
         return mean, mfx
 
-    def sig_test(self, var_pos, nboot=50, nested_res=25, pivot=False):
+    def sig_test(self, var_pos, nboot=50, nested_res=25, pivot=False,
+                 n_jobs=1):
         """
         Significance test for the variables in the regression.
 
@@ -387,6 +477,9 @@ class KernelReg(GenericKDE):
         ----------
         var_pos: sequence
             The position of the variable in exog to be tested.
+        n_jobs: int, optional
+            The number of processes used for the bootstrap replications.
+            -1 uses all CPU cores.  Default is 1.  See `TestRegCoefC`.
 
         Returns
         -------
@@ -405,9 +498,10 @@ class KernelReg(GenericKDE):
             if np.any(ix_ord[var_pos]) or np.any(ix_unord[var_pos]):
                 raise ValueError("Discrete variable in hypothesis. Must be continuous")
 
-            Sig = TestRegCoefC(self, var_pos, nboot, nested_res, pivot)
+            Sig = TestRegCoefC(self, var_pos, nboot, nested_res, pivot,
+                               n_jobs=n_jobs)
         else:
-            Sig = TestRegCoefD(self, var_pos, nboot)
+            Sig = TestRegCoefD(self, var_pos, nboot, n_jobs=n_jobs)
 
         return Sig.sig
 
@@ -697,6 +791,10 @@ class TestRegCoefC(object):
         Significantly increases computational time. But pivot statistics
         have more desirable properties
         (See references)
+    n_jobs: int
+        Number of processes used for the bootstrap replications, -1 uses
+        all CPU cores.  Default is 1.  Requires joblib, the replications
+        are computed serially if it is not available.
 
     Attributes
     ----------
@@ -713,6 +811,13 @@ class TestRegCoefC(object):
     This class allows testing of joint hypothesis as long as all variables
     are continuous.
 
+    With ``n_jobs=1`` the replications draw from the global numpy random
+    state, so results for a given seed are the same as in the serial
+    implementation.  With more than one process each replication draws
+    from its own ``RandomState``, seeded from the global random state
+    before the replications start.  These results do not depend on the
+    number of processes, but they differ from the serial results.
+
     References
     ----------
     Racine, J.: "Consistent Significance Testing for Nonparametric Regression"
@@ -724,33 +829,43 @@ class TestRegCoefC(object):
     # Racine: Consistent Significance Testing for Nonparametric Regression
     # Journal of Business & Economics Statistics
     def __init__(self, model, test_vars, nboot=400, nested_res=400,
-                 pivot=False):
+                 pivot=False, n_jobs=1):
         self.nboot = nboot
         self.nres = nested_res
         self.test_vars = test_vars
         self.model = model
         self.bw = model.bw
         self.var_type = model.var_type
+        self.reg_type = model.reg_type
         self.k_vars = len(self.var_type)
         self.endog = model.endog
         self.exog = model.exog
         self.gx = model.est[model.reg_type]
         self.test_vars = test_vars
         self.pivot = pivot
+        self.n_jobs = n_jobs
         self.run()
 
+    def __getstate__(self):
+        # The model and gx hold bound methods, which cannot be pickled for
+        # the worker processes.  They are not used in the replications.
+        state = self.__dict__.copy()
+        state.pop('model', None)
+        state.pop('gx', None)
+        return state
+
     def run(self):
         self.test_stat = self._compute_test_stat(self.endog, self.exog)
         self.sig = self._compute_sig()
 
-    def _compute_test_stat(self, Y, X):
+    def _compute_test_stat(self, Y, X, random_state=None):
         """
         Computes the test statistic.  See p.371 in [8].
         """
         lam = self._compute_lambda(Y, X)
         t = lam
         if self.pivot:
-            se_lam = self._compute_se_lambda(Y, X)
+            se_lam = self._compute_se_lambda(Y, X, random_state=random_state)
             t = lam / float(se_lam)
 
         return t
@@ -760,7 +875,7 @@ class TestRegCoefC(object):
         n = np.shape(X)[0]
         Y = _adjust_shape(Y, 1)
         X = _adjust_shape(X, self.k_vars)
-        b = KernelReg(Y, X, self.var_type, self.model.reg_type, self.bw,
+        b = KernelReg(Y, X, self.var_type, self.reg_type, self.bw,
                         defaults = EstimatorSettings(efficient=False)).fit()[1]
 
         b = b[:, self.test_vars]
@@ -770,17 +885,19 @@ class TestRegCoefC(object):
         lam = ((b / fct) ** 2).sum() / float(n)
         return lam
 
-    def _compute_se_lambda(self, Y, X):
+    def _compute_se_lambda(self, Y, X, random_state=None):
         """
         Calculates the SE of lambda by nested resampling
         Used to pivot the statistic.
         Bootstrapping works better with estimating pivotal statistics
         but slows down computation significantly.
         """
+        if random_state is None:
+            random_state = np.random
         n = np.shape(Y)[0]
         lam = np.empty(shape=(self.nres, ))
         for i in range(self.nres):
-            ind = np.random.random_integers(0, n-1, size=(n,1))
+            ind = random_state.randint(0, n, size=(n,1))
             Y1 = Y[ind, 0]
             X1 = X[ind, :]
             lam[i] = self._compute_lambda(Y1, X1)
@@ -796,23 +913,18 @@ class TestRegCoefC(object):
         bootstrapping the sample.  The null hypothesis is rejected if the test
         statistic is larger than the 90, 95, 99 percentiles.
         """
-        t_dist = np.empty(shape=(self.nboot, ))
         Y = self.endog
         X = copy.deepcopy(self.exog)
         n = np.shape(Y)[0]
 
         X[:, self.test_vars] = np.mean(X[:, self.test_vars], axis=0)
         # Calculate the restricted mean. See p. 372 in [8]
-        M = KernelReg(Y, X, self.var_type, self.model.reg_type, self.bw,
+        M = KernelReg(Y, X, self.var_type, self.reg_type, self.bw,
                       defaults = EstimatorSettings(efficient=False)).fit()[0]
         M = np.reshape(M, (n, 1))
         e = Y - M
         e = e - np.mean(e)  # recenter residuals
-        for i in range(self.nboot):
-            ind = np.random.random_integers(0, n-1, size=(n,1))
-            e_boot = e[ind, 0]
-            Y_boot = M + e_boot
-            t_dist[i] = self._compute_test_stat(Y_boot, self.exog)
+        t_dist = self._bootstrap(M, e)
 
         self.t_dist = t_dist
         sig = "Not Significant"
@@ -825,6 +937,48 @@ class TestRegCoefC(object):
 
         return sig
 
+    def _boot_replication(self, random_state, M, e):
+        """Test statistic for one bootstrap sample of the residuals."""
+        n = np.shape(e)[0]
+        ind = random_state.randint(0, n, size=(n,1))
+        e_boot = e[ind, 0]
+        Y_boot = M + e_boot
+        return self._compute_test_stat(Y_boot, self.exog,
+                                       random_state=random_state)
+
+    def _bootstrap(self, *args):
+        """
+        Computes the test statistic for `nboot` bootstrap replications.
+
+        The replications are split into `n_jobs` chunks that are run in
+        separate processes if ``n_jobs != 1``.  Serial replications draw
+        from the global random state in the same order as the loop they
+        replace.
+        """
+        n_jobs = self.n_jobs
+        if n_jobs != 1:
+            parallel, p_func, n_jobs = parallel_func(_boot_replications,
+                                                     n_jobs, verbose=0)
+        if n_jobs == 1:
+            return np.asarray([self._boot_replication(np.random, *args)
+                               for i in range(self.nboot)])
+
+        seeds = np.random.randint(0, np.iinfo(np.int32).max,
+                                  size=self.nboot)
+        chunks = np.array_split(seeds, min(n_jobs, self.nboot))
+        res = parallel(p_func(self, chunk, *args) for chunk in chunks)
+        return np.asarray([t for res_chunk in res for t in res_chunk])
+
+
+def _boot_replications(test, seeds, *args):
+    """
+    Runs bootstrap replications of a significance test, one for each seed.
+
+    Module level function, so that it can be pickled for joblib.
+    """
+    return [test._boot_replication(np.random.RandomState(seed), *args)
+            for seed in seeds]
+
 
 class TestRegCoefD(TestRegCoefC):
     """
@@ -843,6 +997,9 @@ class TestRegCoefD(TestRegCoefC):
     nboot: int
         Number of bootstrap samples used to determine the distribution
         of the test statistic in a finite sample. Default is 400
+    n_jobs: int
+        Number of processes used for the bootstrap replications, -1 uses
+        all CPU cores.  Default is 1.
 
     Attributes
     ----------
@@ -864,13 +1021,13 @@ class TestRegCoefD(TestRegCoefC):
     See [9] and chapter 12 in [1].
     """
 
-    def _compute_test_stat(self, Y, X):
+    def _compute_test_stat(self, Y, X, random_state=None):
         """Computes the test statistic"""
 
         dom_x = np.sort(np.unique(self.exog[:, self.test_vars]))
 
         n = np.shape(X)[0]
-        model = KernelReg(Y, X, self.var_type, self.model.reg_type, self.bw,
+        model = KernelReg(Y, X, self.var_type, self.reg_type, self.bw,
                           defaults = EstimatorSettings(efficient=False))
         X1 = copy.deepcopy(X)
         X1[:, self.test_vars] = 0
@@ -892,8 +1049,6 @@ class TestRegCoefD(TestRegCoefC):
 
         m = self._est_cond_mean()
         Y = self.endog
-        X = self.exog
-        n = np.shape(X)[0]
         u = Y - m
         u = u - np.mean(u)  # center
         fct1 = (1 - 5**0.5) / 2.
@@ -901,15 +1056,9 @@ class TestRegCoefD(TestRegCoefC):
         u1 = fct1 * u
         u2 = fct2 * u
         r = fct2 / (5 ** 0.5)
-        I_dist = np.empty((self.nboot,1))
-        for j in range(self.nboot):
-            u_boot = copy.deepcopy(u2)
-
-            prob = np.random.uniform(0,1, size = (n,1))
-            ind = prob < r
-            u_boot[ind] = u1[ind]
-            Y_boot = m + u_boot
-            I_dist[j] = self._compute_test_stat(Y_boot, X)
+        I_dist = self._bootstrap(m, u1, u2, r)
+        self.t_dist = I_dist
+        I_dist = np.reshape(I_dist, (self.nboot, 1))
 
         sig = "Not Significant"
         if self.test_stat > mquantiles(I_dist, 0.9):
@@ -921,6 +1070,16 @@ class TestRegCoefD(TestRegCoefC):
 
         return sig
 
+    def _boot_replication(self, random_state, m, u1, u2, r):
+        """Test statistic for one wild bootstrap sample."""
+        n = np.shape(m)[0]
+        u_boot = copy.deepcopy(u2)
+        prob = random_state.uniform(0,1, size = (n,1))
+        ind = prob < r
+        u_boot[ind] = u1[ind]
+        Y_boot = m + u_boot
+        return self._compute_test_stat(Y_boot, self.exog)
+
     def _est_cond_mean(self):
         """
         Calculates the expected conditional mean
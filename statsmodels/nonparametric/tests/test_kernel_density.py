@@ -261,6 +261,30 @@ class TestKDEMultivariate(MyTest):
         npt.assert_equal(dens.bw, bw_user)
 
 
+    def test_loo_likelihood_vs_loop(self):
+        # blocked computation against the leave-one-out loop
+        from statsmodels.nonparametric._kernel_base import (LeaveOneOut,
+                                                            gpke)
+        # include a level of the unordered variable with a single obs
+        u = self.o2.copy()
+        u[0] = 5
+        data = np.column_stack([self.c1, self.o, u])
+        var_type = 'cou'
+        bw = np.array([0.5, 0.3, 0.2])
+        dens = nparam.KDEMultivariate(data=data, var_type=var_type, bw=bw)
+
+        L = 0
+        for i, X_not_i in enumerate(LeaveOneOut(data)):
+            f_i = gpke(bw, data=-X_not_i, data_predict=-data[i, :],
+                       var_type=var_type)
+            L += np.log(f_i)
+
+        npt.assert_allclose(dens.loo_likelihood(bw, np.log), -L, rtol=1e-12)
+        from statsmodels.nonparametric._kernel_base import _loo_gpke
+        npt.assert_allclose(_loo_gpke(bw, data, var_type, block_size=7),
+                            _loo_gpke(bw, data, var_type), rtol=1e-13)
+
+
 class TestKDEMultivariateConditional(MyTest):
     @dec.slow
     def test_mixeddata_CV_LS(self):
@@ -387,6 +411,28 @@ class TestKDEMultivariateConditional(MyTest):
                                                           n_sub=100))
         npt.assert_equal(dens.bw, bw_user)
 
+    def test_loo_likelihood_vs_loop(self):
+        from statsmodels.nonparametric._kernel_base import (LeaveOneOut,
+                                                            gpke)
+        endog = np.column_stack([self.c1, self.o])
+        exog = np.column_stack([self.c2, self.o2])
+        bw = np.array([0.5, 0.3, 0.8, 0.2])
+        dens = nparam.KDEMultivariateConditional(endog=endog, exog=exog,
+                                                 dep_type='co',
+                                                 indep_type='co', bw=bw)
+        data = np.column_stack([endog, exog])
+        L = 0
+        xLOO = LeaveOneOut(exog).__iter__()
+        for i, Y_j in enumerate(LeaveOneOut(data)):
+            X_not_i = next(xLOO)
+            f_yx = gpke(bw, data=-Y_j, data_predict=-data[i, :],
+                        var_type='coco')
+            f_x = gpke(bw[2:], data=-X_not_i, data_predict=-exog[i, :],
+                       var_type='co')
+            L += np.log(f_yx / f_x)
+
+        npt.assert_allclose(dens.loo_likelihood(bw, np.log), -L, rtol=1e-12)
+
 if __name__ == "__main__":
     import nose
     nose.runmodule(argv=[__file__,'-vvs','-x','--pdb'],
@@ -3,6 +3,7 @@ import numpy.testing as npt
 import numpy.testing.decorators as dec
 
 import statsmodels.api as sm
+from statsmodels.nonparametric import kernel_regression
 nparam = sm.nonparametric
 
 
@@ -327,6 +328,82 @@ class TestKernelReg(MyTest):
         # Bandwidth
         npt.assert_equal(model.bw, bw_user)
 
+    def test_cv_aic_vs_loop(self):
+        # blocked estimators against the leave-one-out loop
+        from statsmodels.nonparametric._kernel_base import (LeaveOneOut,
+                                                            gpke)
+        exog = np.column_stack([self.c1, self.o, self.o2])
+        bw = np.array([0.6, 0.3, 0.2])
+        for reg_type in ['lc', 'll']:
+            for var_type in ['coo', 'cou']:
+                model = nparam.KernelReg(endog=[self.y2], exog=exog,
+                                         reg_type=reg_type,
+                                         var_type=var_type, bw=bw)
+                func = model.est[reg_type]
+                L = 0
+                LOO_Y = LeaveOneOut(model.endog).__iter__()
+                for ii, X_not_i in enumerate(LeaveOneOut(model.exog)):
+                    Y = next(LOO_Y)
+                    G = func(bw, endog=Y, exog=-X_not_i,
+                             data_predict=-model.exog[ii, :])[0]
+                    L += (model.endog[ii] - G) ** 2
+
+                npt.assert_allclose(model.cv_loo(bw, func), L / model.nobs,
+                                    rtol=1e-10)
+
+                H = np.empty((model.nobs, model.nobs))
+                for j in range(model.nobs):
+                    H[:, j] = gpke(bw, data=model.exog,
+                                   data_predict=model.exog[j, :],
+                                   var_type=var_type, tosum=False)
+                trace_H = np.trace(H / H.sum(axis=1))
+                gx = model.fit()[0]
+                sigma = ((np.squeeze(model.endog) - gx)**2).mean()
+                aic = np.log(sigma) + ((1 + trace_H / model.nobs) /
+                                       (1 - (trace_H + 2) / model.nobs))
+                npt.assert_allclose(model.aic_hurvich(bw), aic, rtol=1e-10)
+
+                mean = model._est_mean_batch(bw, data_predict=exog[:7])
+                npt.assert_allclose(mean, model.fit(exog[:7])[0], rtol=1e-10)
+
+    def test_ll_near_singular(self):
+        # small bandwidths give nearly singular moment matrices, the
+        # batched and the loop estimators both use the pseudo-inverse
+        np.random.seed(1234)
+        x = np.sort(np.random.uniform(size=40))
+        y = np.sin(4 * x) + 0.1 * np.random.normal(size=40)
+        for bw in [0.005, 0.02]:
+            model = nparam.KernelReg(endog=[y], exog=[x], reg_type='ll',
+                                     var_type='c', bw=[bw])
+            mean = model._est_mean_batch(model.bw)
+            npt.assert_allclose(mean, model.fit()[0], rtol=1e-6, atol=1e-8)
+
+    def test_significance_n_jobs(self):
+        # parallel bootstrap replications do not depend on the number of
+        # processes, the serial ones keep the draws of the global state
+        nobs = 60
+        np.random.seed(12345)
+        C1 = np.random.normal(size=(nobs, ))
+        C2 = np.random.normal(size=(nobs, ))
+        O = np.random.binomial(2, 0.5, size=(nobs, ))
+        Y = 1.2 * C1 + O + np.random.normal(size=(nobs, ))
+        model = nparam.KernelReg(endog=[Y], exog=[C1, C2, O],
+                                 reg_type='lc', var_type='cco',
+                                 bw=[0.5, 0.5, 0.3])
+        for test, kwds in [(kernel_regression.TestRegCoefC,
+                            dict(nested_res=3, pivot=True)),
+                           (kernel_regression.TestRegCoefD, {})]:
+            test_vars = [2] if kwds == {} else [0, 1]
+            t_dist = []
+            for n_jobs in [1, 1, 2, 3]:
+                np.random.seed(987)
+                res = test(model, test_vars, nboot=6, n_jobs=n_jobs, **kwds)
+                t_dist.append(np.squeeze(res.t_dist))
+            npt.assert_allclose(t_dist[1], t_dist[0], rtol=1e-13)
+            npt.assert_allclose(t_dist[3], t_dist[2], rtol=1e-13)
+            npt.assert_equal(t_dist[0].shape[0], 6)
+            npt.assert_equal(t_dist[2].shape[0], 6)
+
 
 if __name__ == "__main__":
     import nose
@@ -0,0 +1,377 @@
+"""
+Lightweight least squares helpers used inside iterative estimators.
+
+These are not models, they do not do any data handling and they do not
+create results instances.  They are intended for loops like IRLS where a
+weighted least squares problem with a fixed design has to be solved many
+times and only the final solution is exposed to the user.
+"""
+
+import numpy as np
+from scipy import linalg
+
+
+class _MinimalWLS(object):
+    """
+    Minimal weighted least squares solver with preallocated work arrays.
+
+    Parameters
+    ----------
+    exog : ndarray, 2d
+        Design matrix, nobs x k_vars. It is not copied and has to stay
+        unchanged while the instance is used.
+    method : {'cholesky', 'qr', 'pinv'}
+        Method used to solve the weighted normal equations.
+
+        - 'cholesky' factors the weighted cross product X'WX, which is
+          the cheapest option. If the cross product is not numerically
+          positive definite, the solution falls back to 'pinv'.
+        - 'qr' uses a QR decomposition of the sqrt-weighted design.
+        - 'pinv' uses the Moore-Penrose pseudoinverse of the sqrt-weighted
+          design, which is what `WLS.fit` uses by default.
+
+    Notes
+    -----
+    The sqrt-weighted design and endog are written into buffers that are
+    allocated once in ``__init__``, so repeated calls to `fit` do not
+    allocate nobs x k_vars temporaries except for the 'qr' and 'pinv'
+    decompositions.
+
+    The last factorization is kept so that `normalized_cov_params` can be
+    computed once, after the iterations have converged.
+    """
+
+    def __init__(self, exog, method='cholesky'):
+        if method not in ('cholesky', 'qr', 'pinv'):
+            raise ValueError("method %s not understood" % method)
+        exog = np.asarray(exog)
+        if exog.ndim == 1:
+            exog = exog[:, None]
+        self.exog = exog
+        self.method = method
+        nobs, k_vars = exog.shape
+        self.nobs = nobs
+        self.k_vars = k_vars
+        self._sqrt_weights = np.empty(nobs)
+        self._wexog = np.empty((nobs, k_vars))
+        self._wendog = np.empty(nobs)
+        self._factor = None
+        self._factor_method = None
+
+    def fit(self, endog, weights):
+        """
+        Solve the weighted least squares problem for new endog and weights.
+
+        Parameters
+        ----------
+        endog : ndarray, 1d
+            Dependent variable.
+        weights : ndarray, 1d or scalar
+            Observation weights, proportional to the inverse of the variance.
+
+        Returns
+        -------
+        params : ndarray
+            The weighted least squares estimate.
+        """
+        sqrt_w = self._sqrt_weights
+        sqrt_w[:] = weights
+        np.sqrt(sqrt_w, out=sqrt_w)
+        wexog = self._wexog
+        np.multiply(self.exog, sqrt_w[:, None], out=wexog)
+        wendog = self._wendog
+        np.multiply(endog, sqrt_w, out=wendog)
+
+        if self.method == 'cholesky':
+            xtx = np.dot(wexog.T, wexog)
+            try:
+                factor = linalg.cho_factor(xtx, lower=False)
+            except linalg.LinAlgError:
+                return self._fit_pinv()
+            # cho_factor does not check for near singularity
+            diag = np.diag(factor[0])
+            if diag.min() <= (np.sqrt(np.finfo(np.float64).eps) *
+                              diag.max()):
+                return self._fit_pinv()
+            self._factor = factor
+            self._factor_method = 'cholesky'
+            params = linalg.cho_solve(factor, np.dot(wexog.T, wendog))
+        elif self.method == 'qr':
+            Q, R = np.linalg.qr(wexog)
+            diag = np.abs(np.diag(R))
+            tol = np.finfo(np.float64).eps * self.nobs
+            if diag.min() <= tol * diag.max():
+                return self._fit_pinv()
+            self._factor = R
+            self._factor_method = 'qr'
+            params = linalg.solve_triangular(R, np.dot(Q.T, wendog))
+        else:
+            params = self._fit_pinv()
+        return params
+
+    def _fit_pinv(self):
+        pinv_wexog = np.linalg.pinv(self._wexog)
+        self._factor = pinv_wexog
+        self._factor_method = 'pinv'
+        return np.dot(pinv_wexog, self._wendog)
+
+    def normalized_cov_params(self):
+        """
+        (X'WX)^{-1} for the weights of the last call to `fit`.
+
+        A generalized inverse is returned if the last solution had to use
+        the pseudoinverse.
+        """
+        if self._factor is None:
+            raise ValueError("fit has not been called")
+        if self._factor_method == 'cholesky':
+            return linalg.cho_solve(self._factor, np.eye(self.k_vars))
+        elif self._factor_method == 'qr':
+            Rinv = linalg.solve_triangular(self._factor, np.eye(self.k_vars))
+            return np.dot(Rinv, Rinv.T)
+        else:
+            return np.dot(self._factor, self._factor.T)
+
+
+def _elastic_net_cd(exog, endog, alpha, L1_wt, start_params=None,
+                    maxiter=1000, cnvrg_tol=1e-8, gram=None,
+                    exog_endog=None, use_gram=None):
+    """
+    Elastic net least squares by cyclic coordinate descent.
+
+    Minimizes ``RSS + sum(alpha * ((1 - L1_wt) * params**2 / 2 +
+    L1_wt * |params|))``.
+
+    Parameters
+    ----------
+    exog : ndarray, 2d or None
+        Design matrix, nobs x k_exog. Can be None if `gram` and
+        `exog_endog` are given.
+    endog : ndarray, 1d or None
+        Dependent variable. Can be None if `exog_endog` is given.
+    alpha : ndarray, 1d
+        Penalty weights for each coefficient, on the scale of the residual
+        sum of squares.
+    L1_wt : float
+        Fraction of the penalty given to the L1 penalty term.
+    start_params : array-like, optional
+        Starting values, the default is zero for all coefficients.
+    maxiter : int
+        Maximum number of iteration cycles. Full cycles and cycles over
+        the active set are both counted.
+    cnvrg_tol : float
+        Convergence tolerance for the sup-norm of the parameter change in
+        a full cycle.
+    gram : ndarray, 2d, optional
+        Precomputed ``exog.T.dot(exog)``.
+    exog_endog : ndarray, 1d, optional
+        Precomputed ``exog.T.dot(endog)``.
+    use_gram : bool, optional
+        If True, the coordinate updates use the Gram matrix and maintain
+        ``exog.T.dot(resid)``, each update costs O(k_exog). If False, the
+        residual is maintained instead and each update costs O(nobs). The
+        default uses the Gram matrix if it is given or if nobs > k_exog.
+
+    Returns
+    -------
+    params : ndarray
+        The estimated coefficients.
+    converged : bool
+        True if the convergence criterion was met in a full cycle.
+    n_iter : int
+        Number of iteration cycles.
+
+    Notes
+    -----
+    After a full cycle over all coefficients, the iterations are
+    restricted to the active set of nonzero coefficients until they
+    converge. Another full cycle then checks the optimality (KKT)
+    conditions for the excluded coefficients, and the algorithm stops if
+    this cycle does not change the parameters. This follows the strategy
+    used in the glmnet package.
+    """
+    if exog is None:
+        nobs, k_exog = None, gram.shape[0]
+        use_gram = True
+    else:
+        nobs, k_exog = exog.shape
+    alpha = np.asarray(alpha, dtype=np.float64) * np.ones(k_exog)
+    l1_pen = alpha * L1_wt
+    l2_pen = alpha * (1 - L1_wt)
+
+    if start_params is None:
+        params = np.zeros(k_exog, dtype=np.float64)
+    else:
+        params = np.array(start_params, dtype=np.float64)
+
+    if use_gram is None:
+        use_gram = (gram is not None) or (nobs > k_exog)
+
+    if use_gram:
+        if gram is None:
+            gram = np.dot(exog.T, exog)
+        if exog_endog is None:
+            exog_endog = np.dot(exog.T, endog)
+        xxprod = 2 * np.diag(gram)
+        # exog.T.dot(resid)
+        xresid = exog_endog - np.dot(gram, params)
+    else:
+        xxprod = 2 * (exog**2).sum(0)
+        resid = endog - np.dot(exog, params)
+
+    def update(k):
+        # Returns the absolute change of params[k].
+        pk = params[k]
+        if use_gram:
+            xyprod = 2 * (xresid[k] + gram[k, k] * pk)
+        else:
+            xyprod = 2 * np.dot(exog[:, k], resid) + xxprod[k] * pk
+        a = l1_pen[k]
+        if a >= np.abs(xyprod):
+            new = 0.
+        elif xyprod > 0:
+            new = (xyprod - a) / (xxprod[k] + l2_pen[k])
+        else:
+            new = (xyprod + a) / (xxprod[k] + l2_pen[k])
+        delta = new - pk
+        if delta != 0:
+            params[k] = new
+            if use_gram:
+                xresid[:] -= gram[:, k] * delta
+            else:
+                resid[:] -= exog[:, k] * delta
+        return np.abs(delta)
+
+    all_vars = range(k_exog)
+    converged = False
+    n_iter = 0
+    while n_iter < maxiter:
+        # A full cycle, this also checks the KKT conditions for the
+        # coefficients that are currently zero.
+        n_iter += 1
+        pchange = max([update(k) for k in all_vars] + [0.])
+        if pchange < cnvrg_tol:
+            converged = True
+            break
+
+        # Cycle over the active set until it converges.
+        active = np.flatnonzero(params)
+        while n_iter < maxiter:
+            n_iter += 1
+            pchange = max([update(k) for k in active] + [0.])
+            if pchange < cnvrg_tol:
+                break
+
+    return params, converged, n_iter
+
+
+def _elastic_net_path(exog, endog, alphas, L1_wt, start_params=None,
+                      maxiter=1000, cnvrg_tol=1e-8, use_gram=None):
+    """
+    Elastic net least squares solutions for a sequence of penalty weights.
+
+    Parameters
+    ----------
+    exog : ndarray, 2d
+        Design matrix, nobs x k_exog.
+    endog : ndarray, 1d
+        Dependent variable.
+    alphas : ndarray, 2d
+        n_alphas x k_exog penalty weights on the scale of the residual sum
+        of squares, see `_elastic_net_cd`. The rows are solved in the given
+        order, each warm started at the previous solution, so they should
+        be decreasing.
+    L1_wt : float
+        Fraction of the penalty given to the L1 penalty term.
+    start_params : array-like, optional
+        Starting values for the first row of `alphas`.
+    maxiter, cnvrg_tol :
+        Options for the coordinate descent for each row of `alphas`.
+    use_gram : bool, optional
+        See `_elastic_net_cd`. The Gram matrix is computed only once for
+        the entire path.
+
+    Returns
+    -------
+    params : ndarray
+        n_alphas x k_exog array of estimated coefficients.
+    converged : ndarray
+        Boolean array indicating convergence for each row of `alphas`.
+
+    Notes
+    -----
+    Variables are screened with the sequential strong rule of Tibshirani
+    et al. (2012), using the gradient at the solution for the previous
+    penalty. The coordinate descent only runs on the remaining variables.
+    Afterwards the KKT conditions are checked for the discarded variables,
+    and violators are added back before solving again.
+
+    References
+    ----------
+    Tibshirani, R., Bien, J., Friedman, J., Hastie, T., Simon, N.,
+    Taylor, J., and Tibshirani, R. J. (2012). Strong rules for discarding
+    predictors in lasso-type problems. Journal of the Royal Statistical
+    Society, Series B, 74(2), 245-266.
+    """
+    nobs, k_exog = exog.shape
+    n_alphas = alphas.shape[0]
+    if use_gram is None:
+        use_gram = nobs > k_exog
+
+    exog_endog = np.dot(exog.T, endog)
+    if use_gram:
+        gram = np.dot(exog.T, exog)
+
+    def gradient(params):
+        # gradient of -RSS
+        if use_gram:
+            return 2 * (exog_endog - np.dot(gram, params))
+        else:
+            return 2 * np.dot(exog.T, endog - np.dot(exog, params))
+
+    if start_params is None:
+        params = np.zeros(k_exog, dtype=np.float64)
+    else:
+        params = np.array(start_params, dtype=np.float64)
+
+    params_path = np.zeros((n_alphas, k_exog), dtype=np.float64)
+    converged = np.zeros(n_alphas, dtype=bool)
+    l1_pen_prev = None
+    for i in range(n_alphas):
+        l1_pen = alphas[i] * L1_wt
+        grad = gradient(params)
+        if l1_pen_prev is None:
+            keep = np.ones(k_exog, dtype=bool)
+        else:
+            keep = ((np.abs(grad) >= 2 * l1_pen - l1_pen_prev) |
+                    (params != 0))
+
+        while True:
+            ii = np.flatnonzero(keep)
+            if use_gram:
+                params_ii, converged[i], _ = _elastic_net_cd(
+                    None, None, alphas[i, ii], L1_wt,
+                    start_params=params[ii], maxiter=maxiter,
+                    cnvrg_tol=cnvrg_tol, gram=gram[np.ix_(ii, ii)],
+                    exog_endog=exog_endog[ii])
+            else:
+                params_ii, converged[i], _ = _elastic_net_cd(
+                    exog[:, ii], endog, alphas[i, ii], L1_wt,
+                    start_params=params[ii], maxiter=maxiter,
+                    cnvrg_tol=cnvrg_tol, use_gram=False)
+            params = np.zeros(k_exog, dtype=np.float64)
+            params[ii] = params_ii
+            if keep.all():
+                break
+
+            # KKT check for the discarded variables
+            grad = gradient(params)
+            violators = ~keep & (np.abs(grad) > l1_pen)
+            if not violators.any():
+                break
+            keep |= violators
+
+        params_path[i] = params
+        l1_pen_prev = l1_pen
+
+    return params_path, converged
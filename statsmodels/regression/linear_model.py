@@ -53,7 +53,9 @@ import statsmodels.base.model as base
 import statsmodels.base.wrapper as wrap
 from statsmodels.emplike.elregress import _ELRegOpts
 import warnings
-from statsmodels.tools.sm_exceptions import InvalidTestWarning
+from statsmodels.tools.sm_exceptions import (InvalidTestWarning,
+                                             ConvergenceWarning)
+from statsmodels.regression._tools import _elastic_net_cd, _elastic_net_path
 
 def _get_sigma(sigma, nobs):
     """
@@ -139,7 +141,7 @@ class RegressionModel(base.LikelihoodModel):
         raise NotImplementedError("Subclasses should implement.")
 
     def fit(self, method="pinv", cov_type='nonrobust', cov_kwds=None,
-            use_t=None, **kwargs):
+            use_t=None, store_pinv=True, **kwargs):
         """
         Full fit of the model.
 
@@ -152,6 +154,12 @@ class RegressionModel(base.LikelihoodModel):
             Can be "pinv", "qr".  "pinv" uses the Moore-Penrose pseudoinverse
             to solve the least squares problem. "qr" uses the QR
             factorization.
+        store_pinv : bool
+            If True (default), the (nobs, k) pseudoinverse of wexog is kept
+            as the model attribute `pinv_wexog` for reuse in later calls to
+            fit. If False, it is discarded after computing the parameters,
+            which halves the memory for large problems. The robust
+            covariances do not need `pinv_wexog`.
 
         Returns
         -------
@@ -171,15 +179,21 @@ class RegressionModel(base.LikelihoodModel):
                 (not hasattr(self, 'normalized_cov_params')) or
                 (not hasattr(self, 'rank'))):
 
-                self.pinv_wexog, singular_values = pinv_extended(self.wexog)
-                self.normalized_cov_params = np.dot(self.pinv_wexog,
-                                        np.transpose(self.pinv_wexog))
+                pinv_wexog, singular_values = pinv_extended(self.wexog)
+                self.normalized_cov_params = np.dot(pinv_wexog,
+                                        np.transpose(pinv_wexog))
 
                 # Cache these singular values for use later.
                 self.wexog_singular_values = singular_values
                 self.rank = np_matrix_rank(np.diag(singular_values))
 
-            beta = np.dot(self.pinv_wexog, self.wendog)
+                if store_pinv:
+                    self.pinv_wexog = pinv_wexog
+            else:
+                pinv_wexog = self.pinv_wexog
+
+            beta = np.dot(pinv_wexog, self.wendog)
+            del pinv_wexog
 
         elif method == "qr":
             if ((not hasattr(self, 'exog_Q')) or
@@ -269,6 +283,13 @@ class RegressionModel(base.LikelihoodModel):
         Post-estimation results are based on the same data used to
         select variables, hence may be subject to overfitting biases.
 
+        The coordinate updates maintain either the residuals or, if
+        there are more observations than variables, the product of the
+        design with the residuals based on the cached cross product of
+        the design. After each full cycle the iterations are restricted
+        to the active set of nonzero coefficients, and a full cycle is
+        used to check the optimality conditions.
+
         References
         ----------
         Friedman, Hastie, Tibshirani (2008).  Regularization paths for
@@ -282,39 +303,13 @@ class RegressionModel(base.LikelihoodModel):
             alpha = alpha * np.ones(k_exog, dtype=np.float64)
 
         # Below we work with RSS + penalty, so we need to rescale.
-        alpha *= 2 * self.wexog.shape[0]
+        alpha = 2 * self.wexog.shape[0] * np.asarray(alpha, dtype=np.float64)
 
-        if start_params is None:
-            params = np.zeros(k_exog, dtype=np.float64)
-        else:
-            params = start_params.copy()
-
-        converged = False
-        xxprod = 2*(self.wexog**2).sum(0)
-
-        # Coordinate descent
-        for itr in range(maxiter):
-
-            params_save = params.copy()
-            for k in range(self.wexog.shape[1]):
-
-                params[k] = 0.
-                wendog_adj = self.wendog - np.dot(self.wexog, params)
-                xyprod = 2*np.dot(self.wexog[:,k], wendog_adj)
-                den = xxprod[k] + alpha[k] * (1 - L1_wt)
-                a = alpha[k] * L1_wt
-                if a >= np.abs(xyprod):
-                    params[k] = 0.
-                elif xyprod > 0:
-                    params[k] = (xyprod - a) / den
-                else:
-                    params[k] = (xyprod + a) / den
-
-            # Check for convergence
-            pchange = np.max(np.abs(params - params_save))
-            if pchange < cnvrg_tol:
-                converged = True
-                break
+        params, converged, _ = _elastic_net_cd(self.wexog, self.wendog,
+                                               alpha, L1_wt,
+                                               start_params=start_params,
+                                               maxiter=maxiter,
+                                               cnvrg_tol=cnvrg_tol)
 
         # Set approximate zero coefficients to be exactly zero
         params *= np.abs(params) >= zero_tol
@@ -333,6 +328,88 @@ class RegressionModel(base.LikelihoodModel):
         lfit.converged = converged
         return RegressionResultsWrapper(lfit)
 
+    def fit_regularized_path(self, alphas, L1_wt=1., maxiter=1000,
+                             cnvrg_tol=1e-8, zero_tol=1e-8):
+        """
+        Return the elastic net coefficients for a sequence of penalties.
+
+        Parameters
+        ----------
+        alphas : array-like
+            The penalty weights. If 1d, each element is a penalty weight
+            that applies to all variables. If 2d, each row contains the
+            penalty weights for the individual coefficients, see
+            `fit_regularized`.
+        L1_wt : scalar
+            The fraction of the penalty given to the L1 penalty term.
+            Must be between 0 and 1 (inclusive).  If 0, the fit is
+            ridge regression.  If 1, the fit is the lasso.
+        maxiter : integer
+            The maximum number of iteration cycles for each penalty.
+        cnvrg_tol : scalar
+            Convergence tolerance for the coordinate descent, see
+            `fit_regularized`.
+        zero_tol : scalar
+            Any estimated coefficient smaller than this value is
+            replaced with zero.
+
+        Returns
+        -------
+        params : ndarray
+            Array with shape (n_alphas, k_exog). Row i contains the
+            coefficients for penalty ``alphas[i]``.
+
+        Notes
+        -----
+        The objective function for each penalty is the same as in
+        `fit_regularized`. The penalties are solved in decreasing order,
+        each one starting at the solution of the previous, larger penalty.
+        Variables are screened with the sequential strong rule, and the
+        coordinate descent only runs on the variables that are not
+        discarded. The optimality conditions for the discarded variables
+        are checked after each fit.
+
+        No results instances are created. Use `fit_regularized` to obtain
+        the full results for a selected penalty.
+
+        References
+        ----------
+        Friedman, Hastie, Tibshirani (2008).  Regularization paths for
+        generalized linear models via coordinate descent.  Journal of
+        Statistical Software 33(1), 1-22 Feb 2010.
+
+        Tibshirani, R., Bien, J., Friedman, J., Hastie, T., Simon, N.,
+        Taylor, J., and Tibshirani, R. J. (2012). Strong rules for
+        discarding predictors in lasso-type problems. Journal of the Royal
+        Statistical Society, Series B, 74(2), 245-266.
+        """
+        k_exog = self.wexog.shape[1]
+
+        alphas = np.asarray(alphas, dtype=np.float64)
+        if alphas.ndim == 1:
+            alphas = alphas[:, None] * np.ones(k_exog, dtype=np.float64)
+
+        # solve from the largest to the smallest penalty
+        order = np.argsort(-alphas.sum(1), kind='mergesort')
+        # Below we work with RSS + penalty, so we need to rescale.
+        pen = 2 * self.wexog.shape[0] * alphas[order]
+
+        params_sorted, converged = _elastic_net_path(self.wexog, self.wendog,
+                                                     pen, L1_wt,
+                                                     maxiter=maxiter,
+                                                     cnvrg_tol=cnvrg_tol)
+        if not converged.all():
+            warnings.warn("Coordinate descent did not converge for %d of %d "
+                          "penalties" % ((~converged).sum(), len(converged)),
+                          ConvergenceWarning)
+
+        # Set approximate zero coefficients to be exactly zero
+        params_sorted *= np.abs(params_sorted) >= zero_tol
+
+        params = np.empty_like(params_sorted)
+        params[order] = params_sorted
+        return params
+
     def predict(self, params, exog=None):
         """
         Return linear predicted values from a design matrix.
@@ -1253,11 +1330,21 @@ class RegressionResults(base.LikelihoodModelResults):
         eigvals = self.eigenvals
         return np.sqrt(eigvals[0]/eigvals[-1])
 
+    # number of observations per block in the robust covariances
+    _hc_chunksize = 100000
+
     #TODO: make these properties reset bse
     def _HCCM(self, scale):
-        H = np.dot(self.model.pinv_wexog,
-            scale[:,None]*self.model.pinv_wexog.T)
-        return H
+        # (X'X)^(-1) X' diag(scale) X (X'X)^(-1), X' diag(scale) X is
+        # accumulated in row blocks so that pinv_wexog is not needed
+        import statsmodels.stats.sandwich_covariance as sw
+        return sw._HCCM(self, scale, chunksize=self._hc_chunksize)
+
+    def _leverage(self):
+        # diagonal of the hat matrix of wexog, in row blocks
+        import statsmodels.stats.sandwich_covariance as sw
+        return sw._leverage(self.model.wexog, self.normalized_cov_params,
+                            chunksize=self._hc_chunksize)
 
 
     @cache_readonly
@@ -1288,10 +1375,7 @@ class RegressionResults(base.LikelihoodModelResults):
         See statsmodels.RegressionResults
         """
 
-        # probably could be optimized
-        h = np.diag(chain_dot(self.model.wexog,
-                              self.normalized_cov_params,
-                              self.model.wexog.T))
+        h = self._leverage()
         self.het_scale = self.wresid**2/(1-h)
         cov_HC2 = self._HCCM(self.het_scale)
         return cov_HC2
@@ -1302,9 +1386,7 @@ class RegressionResults(base.LikelihoodModelResults):
         """
         See statsmodels.RegressionResults
         """
-        h = np.diag(chain_dot(self.model.wexog,
-                              self.normalized_cov_params,
-                              self.model.wexog.T))
+        h = self._leverage()
         self.het_scale=(self.wresid/(1-h))**2
         cov_HC3 = self._HCCM(self.het_scale)
         return cov_HC3
@@ -1788,7 +1870,8 @@ class RegressionResults(base.LikelihoodModelResults):
                  'sample correction') % (maxlags, ['without', 'with'][use_correction])
 
             res.cov_params_default = sw.cov_hac_simple(self, nlags=maxlags,
-                                                 use_correction=use_correction)
+                                                 use_correction=use_correction,
+                                                 chunksize=self._hc_chunksize)
         elif cov_type == 'cluster':
             #cluster robust standard errors, one- or two-way
             groups = kwds['groups']
@@ -1803,7 +1886,8 @@ class RegressionResults(base.LikelihoodModelResults):
                     # duplicate work
                     self.n_groups = n_groups = len(np.unique(groups))
                 res.cov_params_default = sw.cov_cluster(self, groups,
-                                                 use_correction=use_correction)
+                                                 use_correction=use_correction,
+                                                 chunksize=self._hc_chunksize)
 
             elif groups.ndim == 2:
                 if adjust_df:
@@ -1816,7 +1900,8 @@ class RegressionResults(base.LikelihoodModelResults):
 
                 # Note: sw.cov_cluster_2groups has 3 returns
                 res.cov_params_default = sw.cov_cluster_2groups(self, groups,
-                                             use_correction=use_correction)[0]
+                                             use_correction=use_correction,
+                                             chunksize=self._hc_chunksize)[0]
             else:
                 raise ValueError('only two groups are supported')
             res.cov_kwds['description'] = ('Standard Errors are robust to' +
@@ -414,6 +414,41 @@ def _smw_logdet(s, A, AtA, B, BI, B_logdet):
     return B_logdet + ld + ld1
 
 
+def _group_sums(x, offsets):
+    """
+    Sums the rows of `x` within the groups of consecutive rows
+    defined by `offsets`; group k contains the rows
+    offsets[k]:offsets[k+1].  All groups must be nonempty.
+    """
+    return np.add.reduceat(x, offsets[:-1], axis=0)
+
+
+def _group_cross(x, y, offsets):
+    """
+    Returns the stacked within-group cross products x_k' * y_k, with
+    shape (n_groups, x.shape[1], y.shape[1]).
+    """
+    return np.concatenate([_group_sums(x[:, j:j+1] * y, offsets)[:, None, :]
+                           for j in range(x.shape[1])], axis=1)
+
+
+def _dV_dPsi_basis(k_re):
+    """
+    Returns the matrices E_jj with dV/dPsi_jj = Z * E_jj * Z', one for
+    each free element of the symmetric matrix Psi, stacked along the
+    first axis, in the order of the lower triangle.
+    """
+    k_re2 = k_re * (k_re + 1) // 2
+    basis = np.zeros((k_re2, k_re, k_re))
+    jj = 0
+    for j1 in range(k_re):
+        for j2 in range(j1 + 1):
+            basis[jj, j1, j2] = 1
+            basis[jj, j2, j1] = 1
+            jj += 1
+    return basis
+
+
 class MixedLM(base.LikelihoodModel):
     """
     An object specifying a linear mixed effects model.  Use the `fit`
@@ -504,27 +539,24 @@ class MixedLM(base.LikelihoodModel):
 
         self.k_params = self.k_fe + self.k_re2
 
-        # Convert the data to the internal representation, which is a
-        # list of arrays, corresponding to the groups.
-        group_labels = list(set(groups))
-        group_labels.sort()
-        row_indices = dict((s, []) for s in group_labels)
-        for i,g in enumerate(groups):
-            row_indices[g].append(i)
-        self.row_indices = row_indices
-        self.group_labels = group_labels
+        # Convert the data to the internal representation.  The
+        # observations are sorted by group and stored contiguously,
+        # the rows of group k are group_offsets[k]:group_offsets[k+1].
+        group_labels, group_ix = np.unique(np.asarray(groups),
+                                           return_inverse=True)
+        self._group_order = np.argsort(group_ix, kind='mergesort')
+        self.group_offsets = np.r_[0, np.cumsum(np.bincount(group_ix))]
+        self.group_labels = list(group_labels)
         self.n_groups = len(self.group_labels)
+        self.row_indices = dict(zip(self.group_labels,
+                                    np.split(self._group_order,
+                                             self.group_offsets[1:-1])))
 
-        # Split the data by groups
-        self.endog_li = self.group_list(self.endog)
-        self.exog_li = self.group_list(self.exog)
-        self.exog_re_li = self.group_list(self.exog_re)
-
-        # Precompute this.
-        self.exog_re2_li = [np.dot(x.T, x) for x in self.exog_re_li]
+        # Sort and split the data by groups
+        self._set_group_data()
 
         # The total number of observations, summed over all groups
-        self.n_totobs = sum([len(y) for y in self.endog_li])
+        self.n_totobs = len(self._endog_g)
         # why do it like the above?
         self.nobs = len(self.endog)
 
@@ -627,12 +659,129 @@ class MixedLM(base.LikelihoodModel):
         grouping structure.
         """
 
-        if array.ndim == 1:
-            return [np.array(array[self.row_indices[k]])
-                    for k in self.group_labels]
+        array = np.asarray(array)[self._group_order]
+        return np.split(array, self.group_offsets[1:-1])
+
+    def _set_group_data(self):
+        """
+        Stores the data sorted by group and precomputes the group
+        level cross products that do not depend on the parameters.
+
+        `endog_li`, `exog_li` and `exog_re_li` are views into the
+        sorted arrays.
+        """
+
+        order = self._group_order
+        offsets = self.group_offsets
+        self._endog_g = self.endog[order]
+        self._exog_g = self.exog[order, :]
+        self._exog_re_g = self.exog_re[order, :]
+
+        self.endog_li = np.split(self._endog_g, offsets[1:-1])
+        self.exog_li = np.split(self._exog_g, offsets[1:-1])
+        self.exog_re_li = np.split(self._exog_re_g, offsets[1:-1])
+
+        # Z'Z and Z'X for each group and X'X summed over the groups,
+        # and the same cross products with the residuals r0 of the OLS
+        # fit.  These are sufficient statistics for the likelihood and
+        # its derivatives.  Working with r0 rather than endog avoids
+        # the cancellation in y'y - 2*b'X'y + b'X'X*b when endog has
+        # a large mean.
+        self._fe_ref = np.dot(np.linalg.pinv(self._exog_g), self._endog_g)
+        resid0 = self._endog_g - np.dot(self._exog_g, self._fe_ref)
+        self._ztz = _group_cross(self._exog_re_g, self._exog_re_g, offsets)
+        self._ztx = _group_cross(self._exog_re_g, self._exog_g, offsets)
+        self._ztr0 = _group_sums(self._exog_re_g * resid0[:, None], offsets)
+        self._xtx = np.dot(self._exog_g.T, self._exog_g)
+        self._xtr0 = np.dot(self._exog_g.T, resid0)
+        self._rtr0 = np.dot(resid0, resid0)
+        self.exog_re2_li = list(self._ztz)
+
+    def _resid_cross(self, fe_params):
+        """
+        Returns Z'r for each group, X'r and r'r summed over the
+        groups, for the residuals r = endog - exog*fe_params.
+
+        These are updated from the cross products of the OLS residuals
+        r0 using r = r0 - exog*(fe_params - fe_ols).
+        """
+
+        dfe = fe_params - self._fe_ref
+        ztr = self._ztr0 - np.dot(self._ztx, dfe)
+        xtr = self._xtr0 - np.dot(self._xtx, dfe)
+        rtr = self._rtr0 - np.dot(dfe, self._xtr0) - np.dot(dfe, xtr)
+        return ztr, xtr, rtr
+
+    def _gls_terms(self, fe_params, cov_re, scale=1.):
+        """
+        Returns the generalized least squares quantities of all
+        groups, for the marginal covariance matrices V = scale*I +
+        Z*cov_re*Z', where Z is the random effects design of a group.
+
+        Returns
+        -------
+        logdet : float
+            log|V|, summed over the groups
+        rvir : float
+            resid' V^{-1} resid, summed over the groups
+        xtvir : 1d ndarray
+            exog' V^{-1} resid, summed over the groups
+        xtvix : 2d ndarray
+            exog' V^{-1} exog, summed over the groups
+        ztvz : 3d ndarray
+            Z' V^{-1} Z for each group
+        ztvr : 2d ndarray
+            Z' V^{-1} resid for each group
+        ztvx : 3d ndarray
+            Z' V^{-1} exog for each group
+
+        Notes
+        -----
+        The inverse is V^{-1} = (I - Z*H*Z') / scale with H = cov_re
+        (scale*I + Z'Z*cov_re)^{-1}, and |V| = scale^(n - k_re) *
+        |scale*I + Z'Z*cov_re|.  Only k_re x k_re systems are solved,
+        stacked over the groups, and for a single random effect
+        (e.g. random intercepts) these are scalar divisions.  `cov_re`
+        may be singular.
+
+        The residuals enter only through the group level sufficient
+        statistics computed in `_set_group_data`, so the cost does not
+        depend on the number of observations.
+        """
+
+        ztz = self._ztz
+        ztx = self._ztx
+
+        ztr, xtr, rtr = self._resid_cross(fe_params)
+
+        # mat = scale*I + cov_re*Z'Z, H = mat^{-1} cov_re
+        if self.k_re == 1:
+            mat = scale + cov_re[0, 0] * ztz[:, 0, 0]
+            logdet = np.log(np.abs(mat)).sum()
+            hmat = (cov_re[0, 0] / mat)[:, None, None]
         else:
-            return [np.array(array[self.row_indices[k], :])
-                    for k in self.group_labels]
+            mat = np.einsum('ij,gjk->gik', cov_re, ztz)
+            mat += scale * np.eye(self.k_re)
+            _, logdet = np.linalg.slogdet(mat)
+            logdet = logdet.sum()
+            hmat = np.linalg.solve(mat,
+                                   cov_re * np.ones((self.n_groups, 1, 1)))
+        logdet += (self.n_totobs - self.n_groups * self.k_re) * np.log(scale)
+
+        # H*Z'r and H*Z'X
+        hztr = np.einsum('gij,gj->gi', hmat, ztr)
+        hztx = np.einsum('gij,gjk->gik', hmat, ztx)
+
+        rvir = (rtr - (ztr * hztr).sum()) / scale
+        xtvir = (xtr - np.einsum('gji,gj->i', ztx, hztr)) / scale
+        xtvix = (self._xtx - np.einsum('gji,gjk->ik', ztx, hztx)) / scale
+
+        ztvz = (ztz - np.einsum('gij,gjk->gik', ztz,
+                                np.einsum('gij,gjk->gik', hmat, ztz))) / scale
+        ztvr = (ztr - np.einsum('gij,gj->gi', ztz, hztr)) / scale
+        ztvx = (ztx - np.einsum('gij,gjk->gik', ztz, hztx)) / scale
+
+        return logdet, rvir, xtvir, xtvix, ztvz, ztvr, ztvx
 
 
     def fit_regularized(self, start_params=None, method='l1', alpha=0,
@@ -916,11 +1065,6 @@ class MixedLM(base.LikelihoodModel):
             cov_re_inv = np.linalg.inv(cov_re)
         except np.linalg.LinAlgError:
             cov_re_inv = None
-        _, cov_re_logdet = np.linalg.slogdet(cov_re)
-
-        # The residuals
-        expval = np.dot(self.exog, fe_params)
-        resid_all = self.endog - expval
 
         likeval = 0.
 
@@ -932,29 +1076,13 @@ class MixedLM(base.LikelihoodModel):
         if self.fe_pen is not None:
             likeval -= self.fe_pen.func(fe_params)
 
-        xvx, qf = 0., 0.
-        for k, lab in enumerate(self.group_labels):
+        ld, qf, _, xvx, _, _, _ = self._gls_terms(fe_params, cov_re)
 
-            exog = self.exog_li[k]
-            ex_r = self.exog_re_li[k]
-            ex2_r = self.exog_re2_li[k]
-            resid = resid_all[self.row_indices[lab]]
-
-            # Part 1 of the log likelihood (for both ML and REML)
-            ld = _smw_logdet(1., ex_r, ex2_r, cov_re, cov_re_inv,
-                             cov_re_logdet)
-            likeval -= ld / 2.
-
-            # Part 2 of the log likelihood (for both ML and REML)
-            u = _smw_solve(1., ex_r, ex2_r, cov_re, cov_re_inv, resid)
-            qf += np.dot(resid, u)
-
-            # Adjustment for REML
-            if self.reml:
-                mat = _smw_solve(1., ex_r, ex2_r, cov_re, cov_re_inv,
-                                 exog)
-                xvx += np.dot(exog.T, mat)
+        # Part 1 of the log likelihood (for both ML and REML)
+        likeval -= ld / 2.
 
+        # Part 2 of the log likelihood, qf = resid' V^{-1} resid, and
+        # the adjustment for REML, xvx = exog' V^{-1} exog.
         if self.reml:
             likeval -= (self.n_totobs - self.k_fe) * np.log(qf) / 2.
             _,ld = np.linalg.slogdet(xvx)
@@ -971,29 +1099,6 @@ class MixedLM(base.LikelihoodModel):
 
         return likeval
 
-    def _gen_dV_dPsi(self, ex_r, max_ix=None):
-        """
-        A generator that yields the derivative of the covariance
-        matrix V (=I + Z*Psi*Z') with respect to the free elements of
-        Psi.  Each call to the generator yields the index of Psi with
-        respect to which the derivative is taken, and the derivative
-        matrix with respect to that element of Psi.  Psi is a
-        symmetric matrix, so the free elements are the lower triangle.
-        If max_ix is not None, the iterations terminate after max_ix
-        values are yielded.
-        """
-
-        jj = 0
-        for j1 in range(self.k_re):
-            for j2 in range(j1 + 1):
-                if max_ix is not None and jj > max_ix:
-                    return
-                mat = np.outer(ex_r[:,j1], ex_r[:,j2])
-                if j1 != j2:
-                    mat += mat.T
-                yield jj,mat
-                jj += 1
-
     def score(self, params):
         """
         Returns the score vector of the profile log-likelihood.
@@ -1079,62 +1184,28 @@ class MixedLM(base.LikelihoodModel):
         if self.fe_pen is not None:
             score_fe -= self.fe_pen.grad(fe_params)
 
-        # resid' V^{-1} resid, summed over the groups (a scalar)
-        rvir = 0.
-
-        # exog' V^{-1} resid, summed over the groups (a k_fe
-        # dimensional vector)
-        xtvir = 0.
+        # resid' V^{-1} resid (a scalar), exog' V^{-1} resid (a k_fe
+        # dimensional vector) and exog' V^{-1} exog (a k_fe x k_fe
+        # matrix), summed over the groups, and Z' V^{-1} Z,
+        # Z' V^{-1} resid and Z' V^{-1} exog for each group.
+        _, rvir, xtvir, xtvix, ztvz, ztvr, ztvx = \
+            self._gls_terms(fe_params, cov_re)
 
-        # exog' V^{_1} exog, summed over the groups (a k_fe x k_fe
-        # matrix)
-        xtvix = 0.
+        # dV/dQ_jj = Z E_jj Z', where Q_jj is the jj^th covariance
+        # parameter.
+        basis = _dV_dPsi_basis(self.k_re)
 
-        # V^{-1} exog' dV/dQ_jj exog V^{-1}, where Q_jj is the jj^th
-        # covariance parameter.
-        xtax = [0.,] * self.k_re2
-
-        # Temporary related to the gradient of log |V|
-        dlv = np.zeros(self.k_re2, dtype=np.float64)
+        # Contribution of log|V| to the covariance parameter
+        # gradient, trace(V^{-1} dV/dQ_jj).
+        score_re -= 0.5 * np.einsum('jab,ba->j', basis, ztvz.sum(0))
 
         # resid' V^{-1} dV/dQ_jj V^{-1} resid (a scalar)
-        rvavr = np.zeros(self.k_re2, dtype=np.float64)
-
-        for k in range(self.n_groups):
-
-            exog = self.exog_li[k]
-            ex_r = self.exog_re_li[k]
-            ex2_r = self.exog_re2_li[k]
-
-            # The residuals
-            expval = np.dot(exog, fe_params)
-            resid = self.endog_li[k] - expval
-
-            if self.reml:
-                viexog = _smw_solve(1., ex_r, ex2_r, cov_re,
-                                    cov_re_inv, exog)
-                xtvix += np.dot(exog.T, viexog)
-
-            # Contributions to the covariance parameter gradient
-            jj = 0
-            vex = _smw_solve(1., ex_r, ex2_r, cov_re, cov_re_inv,
-                             ex_r)
-            vir = _smw_solve(1., ex_r, ex2_r, cov_re, cov_re_inv,
-                             resid)
-            for jj,mat in self._gen_dV_dPsi(ex_r):
-                dlv[jj] = np.trace(_smw_solve(1., ex_r, ex2_r, cov_re,
-                                     cov_re_inv, mat))
-                rvavr[jj] += np.dot(vir, np.dot(mat, vir))
-                if self.reml:
-                    xtax[jj] += np.dot(viexog.T, np.dot(mat, viexog))
-
-            # Contribution of log|V| to the covariance parameter
-            # gradient.
-            score_re -= 0.5 * dlv
-
-            # Needed for the fixed effects params gradient
-            rvir += np.dot(resid, vir)
-            xtvir += np.dot(exog.T, vir)
+        rvavr = np.einsum('ga,jab,gb->j', ztvr, basis, ztvr)
+
+        # V^{-1} exog' dV/dQ_jj exog V^{-1}
+        if self.reml:
+            xtax = np.einsum('gjbk,gbi->jik',
+                             np.einsum('jab,gak->gjbk', basis, ztvx), ztvx)
 
         fac = self.n_totobs
         if self.reml:
@@ -1226,10 +1297,6 @@ class MixedLM(base.LikelihoodModel):
 
         fe_params = params.get_fe_params()
         cov_re = params.get_cov_re()
-        try:
-            cov_re_inv = np.linalg.inv(cov_re)
-        except np.linalg.LinAlgError:
-            cov_re_inv = None
 
         # Blocks for the fixed and random effects parameters.
         hess_fe = 0.
@@ -1241,56 +1308,33 @@ class MixedLM(base.LikelihoodModel):
         if self.reml:
             fac -= self.exog.shape[1]
 
-        rvir = 0.
-        xtvix = 0.
-        xtax = [0.,] * self.k_re2
-        B = np.zeros(self.k_re2, dtype=np.float64)
-        D = np.zeros((self.k_re2, self.k_re2), dtype=np.float64)
-        F = [[0.,]*self.k_re2 for k in range(self.k_re2)]
-        for k in range(self.n_groups):
-
-            exog = self.exog_li[k]
-            ex_r = self.exog_re_li[k]
-            ex2_r = self.exog_re2_li[k]
-
-            # The residuals
-            expval = np.dot(exog, fe_params)
-            resid = self.endog_li[k] - expval
-
-            viexog = _smw_solve(1., ex_r, ex2_r, cov_re, cov_re_inv,
-                                exog)
-            xtvix += np.dot(exog.T, viexog)
-            vir = _smw_solve(1., ex_r, ex2_r, cov_re, cov_re_inv,
-                             resid)
-            rvir += np.dot(resid, vir)
-
-            for jj1,mat1 in self._gen_dV_dPsi(ex_r):
-
-                hess_fere[jj1,:] += np.dot(viexog.T,
-                                           np.dot(mat1, vir))
-                if self.reml:
-                    xtax[jj1] += np.dot(viexog.T, np.dot(mat1, viexog))
-
-                B[jj1] += np.dot(vir, np.dot(mat1, vir))
-                E = _smw_solve(1., ex_r, ex2_r, cov_re, cov_re_inv,
-                               mat1)
-
-                for jj2,mat2 in self._gen_dV_dPsi(ex_r, jj1):
-                    Q = np.dot(mat2, E)
-                    Q1 = Q + Q.T
-                    vt = np.dot(vir, np.dot(Q1, vir))
-                    D[jj1, jj2] += vt
-                    if jj1 != jj2:
-                        D[jj2, jj1] += vt
-                    R = _smw_solve(1., ex_r, ex2_r, cov_re,
-                                   cov_re_inv, Q)
-                    rt = np.trace(R) / 2
-                    hess_re[jj1, jj2] += rt
-                    if jj1 != jj2:
-                        hess_re[jj2, jj1] += rt
-                    if self.reml:
-                        F[jj1][jj2] += np.dot(viexog.T,
-                                              np.dot(Q, viexog))
+        _, rvir, _, xtvix, ztvz, ztvr, ztvx = \
+            self._gls_terms(fe_params, cov_re)
+
+        # dV/dQ_jj = Z E_jj Z', E_jj Z' V^{-1} resid and
+        # E_jj Z' V^{-1} exog for each group.
+        basis = _dV_dPsi_basis(self.k_re)
+        er = np.einsum('jab,gb->gja', basis, ztvr)
+        ex = np.einsum('jab,gbk->gjak', basis, ztvx)
+
+        # exog' V^{-1} dV/dQ_jj V^{-1} resid
+        hess_fere += np.einsum('gjak,ga->jk', ex, ztvr)
+
+        # resid' V^{-1} dV/dQ_jj V^{-1} resid
+        B = np.einsum('gja,ga->j', er, ztvr)
+
+        # resid' V^{-1} dV/dQ_j2 V^{-1} dV/dQ_j1 V^{-1} resid, twice
+        D = 2 * np.einsum('gja,gab,gkb->jk', er, ztvz, er)
+
+        # trace(V^{-1} dV/dQ_j2 V^{-1} dV/dQ_j1) / 2
+        mat = np.einsum('jab,gbc->gjac', basis, ztvz)
+        hess_re += 0.5 * np.einsum('gjab,gkba->jk', mat, mat)
+
+        if self.reml:
+            # exog' V^{-1} dV/dQ_jj V^{-1} exog
+            xtax = np.einsum('gjak,gal->jkl', ex, ztvx)
+            # exog' V^{-1} dV/dQ_j2 V^{-1} dV/dQ_j1 V^{-1} exog
+            F = np.einsum('gjak,gab,gmbl->mjkl', ex, ztvz, ex)
 
         hess_fe -= fac * xtvix / rvir
 
@@ -1393,41 +1437,33 @@ class MixedLM(base.LikelihoodModel):
             sum_groups :math:`Z'*Z * E[gamma * gamma' | Y]`
         """
 
-        m1x, m1y, m2, m2xx = 0., 0., 0., 0.
-        try:
-            cov_re_inv = np.linalg.inv(cov_re)
-        except np.linalg.LinAlgError:
-            cov_re_inv = None
+        m1x, m1r, m2, m2xx = self._Estep(fe_params, cov_re, scale)
+        m1y = m1r + np.dot(self._fe_ref, m1x)
 
-        for k in range(self.n_groups):
+        return m1x, m1y, m2, m2xx
 
-            # Get the residuals
-            expval = np.dot(self.exog_li[k], fe_params)
-            resid = self.endog_li[k] - expval
-
-            # Contruct the marginal covariance matrix for this group
-            ex_r = self.exog_re_li[k]
-            ex2_r = self.exog_re2_li[k]
-
-            vr1 = _smw_solve(scale, ex_r, ex2_r, cov_re, cov_re_inv,
-                             resid)
-            vr1 = np.dot(ex_r.T, vr1)
-            vr1 = np.dot(cov_re, vr1)
-
-            vr2 = _smw_solve(scale, ex_r, ex2_r, cov_re, cov_re_inv,
-                            self.exog_re_li[k])
-            vr2 = np.dot(vr2, cov_re)
-            vr2 = np.dot(ex_r.T, vr2)
-            vr2 = np.dot(cov_re, vr2)
-
-            rg = np.dot(ex_r, vr1)
-            m1x += np.dot(self.exog_li[k].T, rg)
-            m1y += np.dot(self.endog_li[k].T, rg)
-            egg = cov_re - vr2 + np.outer(vr1, vr1)
-            m2 += egg
-            m2xx += np.dot(np.dot(ex_r.T, ex_r), egg)
+    def _Estep(self, fe_params, cov_re, scale):
+        """
+        The E-step of the EM algorithm, with the moment involving Y
+        replaced by sum_groups r0'*Z*E[gamma | Y] for the OLS
+        residuals r0.  See `Estep`.
+        """
 
-        return m1x, m1y, m2, m2xx
+        _, _, _, _, ztvz, ztvr, _ = self._gls_terms(fe_params, cov_re,
+                                                    scale)
+
+        # E[gamma | Y] = cov_re Z' V^{-1} resid and
+        # Var[gamma | Y] = cov_re - cov_re Z' V^{-1} Z cov_re
+        vr1 = np.dot(ztvr, cov_re)
+        vr2 = np.einsum('ij,gjk,kl->gil', cov_re, ztvz, cov_re)
+
+        m1x = np.einsum('gji,gj->i', self._ztx, vr1)
+        m1r = (self._ztr0 * vr1).sum()
+        egg = cov_re - vr2 + vr1[:, :, None] * vr1[:, None, :]
+        m2 = egg.sum(0)
+        m2xx = np.einsum('gij,gjk->ik', self._ztz, egg)
+
+        return m1x, m1r, m2, m2xx
 
 
     def EM(self, fe_params, cov_re, scale, niter_em=10,
@@ -1454,27 +1490,19 @@ class MixedLM(base.LikelihoodModel):
         likelihood used in the gradient calculations.
         """
 
-        xxtot = 0.
-        for x in self.exog_li:
-            xxtot += np.dot(x.T, x)
-
-        xytot = 0.
-        for x,y in zip(self.exog_li, self.endog_li):
-            xytot += np.dot(x.T, y)
-
         pp = []
         for itr in range(niter_em):
 
-            m1x, m1y, m2, m2xx = self.Estep(fe_params, cov_re, scale)
+            m1x, m1r, m2, m2xx = self._Estep(fe_params, cov_re, scale)
 
-            fe_params = np.linalg.solve(xxtot, xytot - m1x)
+            # X'y = X'X*fe_ols + X'r0
+            fe_params = self._fe_ref + np.linalg.solve(self._xtx,
+                                                       self._xtr0 - m1x)
             cov_re = m2 / self.n_groups
 
-            scale = 0.
-            for x,y in zip(self.exog_li, self.endog_li):
-                scale += np.sum((y - np.dot(x, fe_params))**2)
-            scale -= 2 * m1y
-            scale += 2 * np.dot(fe_params, m1x)
+            # Y'Z*E[gamma] - fe_params'X'Z*E[gamma] in terms of r0
+            _, _, scale = self._resid_cross(fe_params)
+            scale -= 2 * (m1r - np.dot(fe_params - self._fe_ref, m1x))
             scale += np.trace(m2xx)
             scale /= self.n_totobs
 
@@ -1502,25 +1530,7 @@ class MixedLM(base.LikelihoodModel):
             The estimated error variance.
         """
 
-        try:
-            cov_re_inv = np.linalg.inv(cov_re)
-        except np.linalg.LinAlgError:
-            cov_re_inv = None
-
-        qf = 0.
-        for k in range(self.n_groups):
-
-            exog = self.exog_li[k]
-            ex_r = self.exog_re_li[k]
-            ex2_r = self.exog_re2_li[k]
-
-            # The residuals
-            expval = np.dot(exog, fe_params)
-            resid = self.endog_li[k] - expval
-
-            mat = _smw_solve(1., ex_r, ex2_r, cov_re, cov_re_inv,
-                             resid)
-            qf += np.dot(resid, mat)
+        _, qf, _, _, _, _, _ = self._gls_terms(fe_params, cov_re)
 
         if self.reml:
             qf /= (self.n_totobs - self.k_fe)
@@ -1987,12 +1997,12 @@ class MixedLMResults(base.LikelihoodModelResults):
 
         # Need to permute the columns of the random effects design
         # matrix so that the profiled variable is in the first column.
-        exog_re_li_save = [x.copy() for x in model.exog_re_li]
+        exog_re_save = model.exog_re
         ix = np.arange(k_re)
         ix[0] = re_ix
         ix[re_ix] = 0
-        for k in range(self.model.n_groups):
-            model.exog_re_li[k] = model.exog_re_li[k][:, ix]
+        model.exog_re = model.exog_re[:, ix]
+        model._set_group_data()
 
         # Permute the covariance structure to match the permuted
         # design matrix.
@@ -2034,7 +2044,8 @@ class MixedLMResults(base.LikelihoodModelResults):
         likev = np.asarray(likev)
 
         # Restore the original exog
-        model.exog_re_li = exog_re_li_save
+        model.exog_re = exog_re_save
+        model._set_group_data()
 
         return likev
 
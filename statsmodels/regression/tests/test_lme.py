@@ -9,7 +9,6 @@ from statsmodels.base import _penalties as penalties
 import os
 import csv
 
-# TODO: add tests with unequal group sizes
 
 class R_Results(object):
     """
@@ -152,6 +151,98 @@ class TestMixedLM(object):
         mdf2 = MixedLM(endog, exog, groups, np.ones(300)).fit()
         assert_almost_equal(mdf1.params, mdf2.params, decimal=8)
 
+    def test_unequal_groups(self):
+
+        np.random.seed(4231)
+        gsizes = np.random.randint(1, 8, size=50)
+        groups = np.random.permutation(np.repeat(np.arange(50), gsizes))
+        n = len(groups)
+        exog = np.random.normal(size=(n, 3))
+        exog_re = np.random.normal(size=(n, 2))
+        exog_re[:, 0] = 1
+        endog = exog.sum(1) + np.random.normal(size=n)
+
+        fe_params = np.r_[1., -1, 0.5]
+        cov_re = np.array([[1., 0.3], [0.3, 0.5]])
+        params = MixedLMParams.from_components(fe_params, cov_re)
+
+        # ML profile likelihood from the dense marginal covariance,
+        # with one random effect (the scalar case) and with two.
+        for k_re in 1, 2:
+            cov_re1 = cov_re[0:k_re, 0:k_re]
+            ld, qf = 0., 0.
+            for g in range(50):
+                ii = np.flatnonzero(groups == g)
+                z = exog_re[ii, 0:k_re]
+                vmat = np.eye(len(ii)) + np.dot(z, np.dot(cov_re1, z.T))
+                resid = endog[ii] - np.dot(exog[ii, :], fe_params)
+                ld += np.linalg.slogdet(vmat)[1]
+                qf += np.dot(resid, np.linalg.solve(vmat, resid))
+            llf = -ld / 2 - n * np.log(qf) / 2 - n * np.log(2 * np.pi) / 2
+            llf += n * np.log(n) / 2 - n / 2.
+
+            md = MixedLM(endog, exog, groups, exog_re[:, 0:k_re],
+                         use_sqrt=False)
+            md.fit()
+            md.reml = False
+            params1 = MixedLMParams.from_components(fe_params, cov_re1)
+            assert_allclose(md.loglike(params1), llf, rtol=1e-10)
+            assert_equal(np.asarray(md.group_labels), np.arange(50))
+            assert_equal([len(y) for y in md.endog_li], gsizes)
+
+        # The results do not depend on the order of the rows
+        ii = np.random.permutation(n)
+        md2 = MixedLM(endog[ii], exog[ii, :], groups[ii], exog_re[ii, :],
+                      use_sqrt=False)
+        md2.fit()
+        for reml in False, True:
+            md.reml = md2.reml = reml
+            assert_allclose(md.loglike(params), md2.loglike(params),
+                            rtol=1e-10)
+            assert_allclose(md.score_full(params), md2.score_full(params),
+                            rtol=1e-8)
+            assert_allclose(md.hessian_full(params),
+                            md2.hessian_full(params), rtol=1e-8)
+
+    def test_large_mean(self):
+
+        # The sufficient statistics must not lose precision when endog
+        # has a large mean relative to its variation.
+        np.random.seed(3461)
+        groups = np.kron(np.arange(200), np.ones(5))
+        exog = np.ones((1000, 2))
+        exog[:, 1] = np.random.normal(size=1000)
+        g_errors = np.kron(np.random.normal(size=200), np.ones(5))
+        endog = exog[:, 1] + g_errors + np.random.normal(size=1000)
+        rslt0 = MixedLM(endog, exog, groups).fit()
+
+        for mean in 1e4, 1e6, 1e8:
+            md = MixedLM(endog + mean, exog, groups)
+            rslt = md.fit()
+            assert_allclose(rslt.llf, rslt0.llf, rtol=1e-6)
+            assert_allclose(rslt.scale, rslt0.scale, rtol=1e-5)
+            assert_allclose(np.asarray(rslt.cov_re),
+                            np.asarray(rslt0.cov_re), rtol=1e-3)
+            assert_allclose(rslt.fe_params, rslt0.fe_params + [mean, 0],
+                            rtol=1e-8, atol=1e-3)
+
+            # ML profile likelihood from the row level residuals
+            fe_params = rslt.fe_params
+            cov_re = np.asarray(rslt.cov_re) / rslt.scale
+            ld, qf = 0., 0.
+            for g in range(200):
+                ii = np.flatnonzero(groups == g)
+                vmat = np.eye(5) + cov_re[0, 0]
+                resid = endog[ii] + mean - np.dot(exog[ii, :], fe_params)
+                ld += np.linalg.slogdet(vmat)[1]
+                qf += np.dot(resid, np.linalg.solve(vmat, resid))
+            n = 1000
+            llf = -ld / 2 - n * np.log(qf) / 2 - n * np.log(2 * np.pi) / 2
+            llf += n * np.log(n) / 2 - n / 2.
+            md.reml = False
+            params = MixedLMParams.from_components(fe_params, cov_re)
+            assert_allclose(md.loglike(params), llf, rtol=1e-10)
+
     def test_history(self):
 
         np.random.seed(3235)
@@ -7,7 +7,8 @@ import warnings
 import pandas
 import numpy as np
 from numpy.testing import (assert_almost_equal, assert_approx_equal,
-                            assert_raises, assert_equal, assert_allclose)
+                            assert_raises, assert_equal, assert_allclose,
+                            assert_, assert_array_less)
 from scipy.linalg import toeplitz
 from statsmodels.tools.tools import add_constant, categorical
 from statsmodels.compat.numpy import np_matrix_rank
@@ -1028,6 +1029,59 @@ class TestRegularizedFit(object):
             # Smoke test for summary
             smry = rslt.summary()
 
+    def test_coord_descent_updates(self):
+        # residual and Gram updates agree with the optimality conditions
+        from statsmodels.regression._tools import _elastic_net_cd
+
+        np.random.seed(3463)
+        for n, p in [(200, 10), (40, 60)]:
+            exog = np.random.normal(size=(n, p))
+            endog = exog[:, :3].sum(1) + np.random.normal(size=n)
+            alpha = 0.1 * np.ones(p)
+            alpha_copy = alpha.copy()
+
+            model = OLS(endog, exog)
+            rslt = model.fit_regularized(alpha=alpha, L1_wt=1)
+            assert_equal(alpha, alpha_copy)
+            assert_(rslt.converged)
+
+            pen = 2 * n * alpha
+            for use_gram in True, False:
+                params, converged, _ = _elastic_net_cd(exog, endog, pen, 1.,
+                                                       use_gram=use_gram)
+                assert_(converged)
+                assert_allclose(params, rslt.params, atol=1e-6)
+
+            # KKT conditions of the lasso
+            params = rslt.params
+            grad = 2 * np.dot(exog.T, endog - np.dot(exog, params))
+            ii = np.abs(params) > 0
+            assert_allclose(grad[ii], pen[ii] * np.sign(params[ii]),
+                            rtol=1e-4, atol=1e-4)
+            assert_array_less(np.abs(grad[~ii]), pen[~ii] + 1e-4)
+
+    def test_regularized_path(self):
+        # warm started path agrees with separate fits
+        np.random.seed(8723)
+        for n, p in [(200, 10), (40, 60)]:
+            exog = np.random.normal(size=(n, p))
+            endog = exog[:, :3].sum(1) + np.random.normal(size=n)
+            model = OLS(endog, exog)
+            alphas = np.array([0.05, 0.5, 0.2, 0.1, 1.])
+            for L1_wt in 1., 0.5:
+                path = model.fit_regularized_path(alphas, L1_wt=L1_wt)
+                assert_equal(path.shape, (len(alphas), p))
+                for alpha, params in zip(alphas, path):
+                    rslt = model.fit_regularized(alpha=alpha, L1_wt=L1_wt)
+                    assert_allclose(params, rslt.params, atol=1e-6)
+
+            # coefficient specific penalty weights
+            alphas2 = alphas[:, None] * np.ones(p)
+            alphas2[:, 0] = 0
+            path = model.fit_regularized_path(alphas2)
+            rslt = model.fit_regularized(alpha=alphas2[1])
+            assert_allclose(path[1], rslt.params, atol=1e-6)
+
 
 if __name__=="__main__":
 
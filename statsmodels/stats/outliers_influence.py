@@ -180,15 +180,10 @@ class OLSInfluence(object):
     -----
     One part of the results can be calculated without any auxiliary regression
     (some of which have the `_internal` postfix in the name. Other statistics
-    require leave-one-observation-out (LOOO) auxiliary regression, and will be
-    slower (mainly results with `_external` postfix in the name).
-    The auxiliary LOOO regression only the required results are stored.
-
-    Using the LOO measures is currently only recommended if the data set
-    is not too large. One possible approach for LOOO measures would be to
-    identify possible problem observations with the _internal measures, and
-    then run the leave-one-observation-out only with observations that are
-    possible outliers. (However, this is not yet available in an automized way.)
+    are based on leave-one-observation-out (LOOO) auxiliary regressions
+    (mainly results with `_external` postfix in the name). The LOOO results
+    are not computed by refitting, but with the closed form deletion formulas
+    from the hat matrix diagonal and the residuals, see `_res_looo`.
 
     This should be extended to general least squares.
 
@@ -218,7 +213,9 @@ class OLSInfluence(object):
         -----
         temporarily calculated here, this should go to model class
         '''
-        return (self.exog * self.results.model.pinv_wexog.T).sum(1)
+        from statsmodels.stats.sandwich_covariance import _leverage
+        return _leverage(self.exog, self.results.normalized_cov_params,
+                         chunksize=100000)
 
     @cache_readonly
     def resid_press(self):
@@ -270,7 +267,7 @@ class OLSInfluence(object):
 
         this uses sigma from leave-one-out estimates
 
-        requires leave one out loop for observations
+        uses leave-one-observation-out results, no nobs loop
         '''
         sigma_looo = np.sqrt(self.sigma2_not_obsi)
         return self.get_resid_studentized_external(sigma=sigma_looo)
@@ -329,7 +326,7 @@ class OLSInfluence(object):
         '''(cached attribute) dffits measure for influence of an observation
 
         based on resid_studentized_external,
-        uses results from leave-one-observation-out loop
+        uses leave-one-observation-out results, no nobs loop
 
         It is recommended that observations with dffits large than a
         threshold of 2 sqrt{k / n} where k is the number of parameters, should
@@ -357,7 +354,7 @@ class OLSInfluence(object):
     def dfbetas(self):
         '''(cached attribute) dfbetas
 
-        uses results from leave-one-observation-out loop
+        uses leave-one-observation-out results, no nobs loop
         '''
         dfbetas = self.results.params - self.params_not_obsi#[None,:]
         dfbetas /= np.sqrt(self.sigma2_not_obsi[:,None])
@@ -370,7 +367,7 @@ class OLSInfluence(object):
 
         This is 'mse_resid' from each auxiliary regression.
 
-        uses results from leave-one-observation-out loop
+        uses leave-one-observation-out results, no nobs loop
         '''
         return np.asarray(self._res_looo['mse_resid'])
 
@@ -378,7 +375,7 @@ class OLSInfluence(object):
     def params_not_obsi(self):
         '''(cached attribute) parameter estimates for all LOOO regressions
 
-        uses results from leave-one-observation-out loop
+        uses leave-one-observation-out results, no nobs loop
         '''
         return np.asarray(self._res_looo['params'])
 
@@ -386,7 +383,7 @@ class OLSInfluence(object):
     def det_cov_params_not_obsi(self):
         '''(cached attribute) determinant of cov_params of all LOOO regressions
 
-        uses results from leave-one-observation-out loop
+        uses leave-one-observation-out results, no nobs loop
         '''
         return np.asarray(self._res_looo['det_cov_params'])
 
@@ -415,7 +412,7 @@ class OLSInfluence(object):
 
         This uses determinant of the estimate of the parameter covariance
         from leave-one-out estimates.
-        requires leave one out loop for observations
+        uses leave-one-observation-out results, no nobs loop
 
         '''
         #don't use inplace division / because then we change original
@@ -530,31 +527,40 @@ class OLSInfluence(object):
 
     @cache_readonly
     def _res_looo(self):
-        '''collect required results from the LOOO loop
+        '''collect required results for leave-one-observation-out (LOOO)
 
         all results will be attached.
         currently only 'params', 'mse_resid', 'det_cov_params' are stored
 
-        regresses endog on exog dropping one observation at a time
+        These are the results of regressing endog on exog dropping one
+        observation at a time. They are not computed with a nobs loop of
+        regressions but from the closed form deletion formulas (Sherman-
+        Morrison), for observation i with residual u_i and hat diagonal h_i::
 
-        this uses a nobs loop, only attributes of the OLS instance are stored.
-        '''
-        from statsmodels.sandbox.tools.cross_val import LeaveOneOut
-        get_det_cov_params = lambda res: np.linalg.det(res.cov_params())
+            params_(i) = params - (X'X)^(-1) x_i' u_i / (1 - h_i)
+            ssr_(i) = ssr - u_i**2 / (1 - h_i)
+            det((X_(i)'X_(i))^(-1)) = det((X'X)^(-1)) / (1 - h_i)
 
-        endog = self.endog
+        The arrays are filled in blocks of observations to limit the size of
+        temporary arrays.
+        '''
         exog = self.exog
-
-        params = np.zeros_like(exog)
-        mse_resid = np.zeros_like(endog)
-        det_cov_params = np.zeros_like(endog)
-
-        cv_iter = LeaveOneOut(self.nobs)
-        for inidx, outidx in cv_iter:
-            res_i = self.model_class(endog[inidx], exog[inidx]).fit()
-            params[outidx] = res_i.params
-            mse_resid[outidx] = res_i.mse_resid
-            det_cov_params[outidx] = get_det_cov_params(res_i)
+        resid = self.results.resid
+        xtxi = np.asarray(self.results.normalized_cov_params)
+        hii = self.hat_matrix_diag
+        resid_h = resid / (1 - hii)
+
+        mse_resid = ((self.results.ssr - resid * resid_h) /
+                     (self.results.df_resid - 1))
+        det_cov_params = (mse_resid**self.k_vars * np.linalg.det(xtxi) /
+                          (1 - hii))
+
+        params = np.empty_like(exog, dtype=np.float64)
+        chunksize = 100000
+        for start in range(0, self.nobs, chunksize):
+            sl = slice(start, start + chunksize)
+            params[sl] = (self.results.params -
+                          np.dot(exog[sl], xtxi) * resid_h[sl, None])
 
         return dict(params=params, mse_resid=mse_resid,
                        det_cov_params=det_cov_params)
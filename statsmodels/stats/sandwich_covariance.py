@@ -158,60 +158,93 @@ __all__ = ['cov_cluster', 'cov_cluster_2groups', 'cov_hac', 'cov_nw_panel',
 
 '''
 
-def _HCCM(results, scale):
+def _row_chunks(nobs, chunksize=None):
+    '''slices of consecutive rows with at most chunksize rows each
+
+    If chunksize is None, then all rows are in one slice.
+    '''
+    if chunksize is None or chunksize >= nobs:
+        return [slice(0, nobs)]
+    return [slice(start, min(start + chunksize, nobs))
+            for start in range(0, nobs, chunksize)]
+
+def _leverage(exog, hessian_inv, chunksize=None):
+    '''diagonal of the hat matrix, x_i (X'X)^(-1) x_i', in row blocks
+
+    Only a (chunksize, k_vars) temporary is created instead of the
+    (nobs, k_vars) pinv(x) or the (nobs, nobs) hat matrix.
+    '''
+    nobs = exog.shape[0]
+    h = np.empty(nobs)
+    for sl in _row_chunks(nobs, chunksize):
+        x = exog[sl]
+        h[sl] = (np.dot(x, hessian_inv) * x).sum(1)
+    return h
+
+def _xtdx(x, scale, chunksize=None):
+    '''x' diag(scale) x accumulated over row blocks of x
+    '''
+    S = 0.
+    for sl in _row_chunks(x.shape[0], chunksize):
+        xs = x[sl]
+        S += np.dot(xs.T, scale[sl, None] * xs)
+    return S
+
+def _HCCM(results, scale, chunksize=None):
     '''
     sandwich with pinv(x) * diag(scale) * pinv(x).T
 
     where pinv(x) = (X'X)^(-1) X
     and scale is (nobs,)
+
+    This is computed as (X'X)^(-1) X' diag(scale) X (X'X)^(-1), so
+    pinv(x) is not needed.  X' diag(scale) X is accumulated over blocks of
+    chunksize rows.
     '''
-    H = np.dot(results.model.pinv_wexog,
-        scale[:,None]*results.model.pinv_wexog.T)
-    return H
+    S = _xtdx(results.model.wexog, scale, chunksize=chunksize)
+    return _HCCM2(np.asarray(results.normalized_cov_params), S)
 
-def cov_hc0(results):
+def cov_hc0(results, chunksize=None):
     """
     See statsmodels.RegressionResults
     """
 
     het_scale = results.resid**2 # or whitened residuals? only OLS?
-    cov_hc0 = _HCCM(results, het_scale)
+    cov_hc0 = _HCCM(results, het_scale, chunksize=chunksize)
 
     return cov_hc0
 
-def cov_hc1(results):
+def cov_hc1(results, chunksize=None):
     """
     See statsmodels.RegressionResults
     """
 
     het_scale = results.nobs/(results.df_resid)*(results.resid**2)
-    cov_hc1 = _HCCM(results, het_scale)
+    cov_hc1 = _HCCM(results, het_scale, chunksize=chunksize)
     return cov_hc1
 
-def cov_hc2(results):
+def cov_hc2(results, chunksize=None):
     """
     See statsmodels.RegressionResults
     """
 
-    # probably could be optimized
-    h = np.diag(np.dot(results.model.exog,
-                          np.dot(results.normalized_cov_params,
-                          results.model.exog.T)))
+    h = _leverage(results.model.exog,
+                  np.asarray(results.normalized_cov_params),
+                  chunksize=chunksize)
     het_scale = results.resid**2/(1-h)
-    cov_hc2_ = _HCCM(results, het_scale)
+    cov_hc2_ = _HCCM(results, het_scale, chunksize=chunksize)
     return cov_hc2_
 
-def cov_hc3(results):
+def cov_hc3(results, chunksize=None):
     """
     See statsmodels.RegressionResults
     """
 
-    # above probably could be optimized to only calc the diag
-    h = np.diag(np.dot(results.model.exog,
-                          np.dot(results.normalized_cov_params,
-                          results.model.exog.T)))
+    h = _leverage(results.model.exog,
+                  np.asarray(results.normalized_cov_params),
+                  chunksize=chunksize)
     het_scale=(results.resid/(1-h))**2
-    cov_hc3_ = _HCCM(results, het_scale)
+    cov_hc3_ = _HCCM(results, het_scale, chunksize=chunksize)
     return cov_hc3_
 
 #---------------------------------------
@@ -250,6 +283,41 @@ def _get_sandwich_arrays(results):
     return xu, hessian_inv
 
 
+def _get_sandwich_chunks(results, chunksize=None):
+    """Helper function to get scores in blocks of rows from results
+
+    For regression results, i.e. if the model has neither `jac` nor
+    `score_obs`, the scores wexog * wresid are created for chunksize rows
+    at a time.  Otherwise all scores are returned as a single block, see
+    `_get_sandwich_arrays`.
+
+    Returns
+    -------
+    chunks : iterable
+        iterable over arrays with consecutive rows of the scores
+    hessian_inv : ndarray
+    nobs : int
+    k_params : int
+    """
+
+    if hasattr(results, '_results'):
+        results = results._results
+    if (chunksize is None or isinstance(results, tuple) or
+            hasattr(results.model, 'jac') or
+            hasattr(results.model, 'score_obs')):
+        xu, hessian_inv = _get_sandwich_arrays(results)
+        if xu.ndim == 1:
+            xu = xu[:, None]
+        return [xu], hessian_inv, xu.shape[0], xu.shape[1]
+
+    wexog = results.model.wexog
+    wresid = results.wresid
+    chunks = (wexog[sl] * wresid[sl, None]
+              for sl in _row_chunks(wexog.shape[0], chunksize))
+    hessian_inv = np.asarray(results.normalized_cov_params)
+    return chunks, hessian_inv, wexog.shape[0], wexog.shape[1]
+
+
 def _HCCM1(results, scale):
     '''
     sandwich with pinv(x) * scale * pinv(x).T
@@ -393,6 +461,37 @@ def S_hac_simple(x, nlags=None, weights_func=weights_bartlett):
 
     return S
 
+def _S_hac_chunks(chunks, nlags, weights_func=weights_bartlett):
+    '''inner covariance matrix for HAC accumulated over blocks of rows
+
+    Same as S_hac_simple applied to the rows of all chunks stacked, but only
+    the last nlags rows of the previous chunk are kept for the lagged
+    cross products.
+    '''
+    weights = weights_func(nlags)
+
+    S = 0.
+    tail = None
+    for x in chunks:
+        if x.ndim == 1:
+            x = x[:,None]
+        start = 0
+        if tail is not None:
+            start = tail.shape[0]
+            x = np.concatenate((tail, x))
+        S += weights[0] * np.dot(x[start:].T, x[start:])
+        for lag in range(1, nlags+1):
+            # pairs (t, t - lag) with t in the current chunk
+            t0 = max(start, lag)
+            if t0 >= x.shape[0]:
+                break
+            s = np.dot(x[t0:].T, x[t0-lag:-lag])
+            S += weights[lag] * (s + s.T)
+        if nlags > 0:
+            tail = x[-nlags:]
+
+    return S
+
 def S_white_simple(x):
     '''inner covariance matrix for White heteroscedastistity sandwich
 
@@ -502,7 +601,7 @@ def cov_crosssection_0(results, group):
     cov = _HCCM1(results, scale)
     return cov
 
-def cov_cluster(results, group, use_correction=True):
+def cov_cluster(results, group, use_correction=True, chunksize=None):
     '''cluster robust covariance matrix
 
     Calculates sandwich covariance matrix for a single cluster, i.e. grouped
@@ -515,6 +614,9 @@ def cov_cluster(results, group, use_correction=True):
        TODO: this should use wexog instead
     use_correction : bool
        If true (default), then the small sample correction factor is used.
+    chunksize : int or None
+       If not None and results is a regression result, then the scores and
+       their group sums are computed for chunksize observations at a time.
 
     Returns
     -------
@@ -527,18 +629,28 @@ def cov_cluster(results, group, use_correction=True):
 
     '''
     #TODO: currently used version of groupsums requires 2d resid
-    xu, hessian_inv = _get_sandwich_arrays(results)
+    chunks, hessian_inv, nobs, k_params = _get_sandwich_chunks(results,
+                                                               chunksize)
 
     if not hasattr(group, 'dtype') or group.dtype != np.dtype('int'):
         clusters, group = np.unique(group, return_inverse=True)
     else:
         clusters = np.unique(group)
 
-    scale = S_crosssection(xu, group)
-
-    nobs, k_params = xu.shape
     n_groups = len(clusters) #replace with stored group attributes if available
 
+    # sum the scores within groups one chunk at a time
+    x_group_sums = 0.
+    start = 0
+    for xu in chunks:
+        stop = start + xu.shape[0]
+        g = group[start:stop]
+        x_group_sums += np.array([np.bincount(g, weights=xu[:, col],
+                                              minlength=group.max() + 1)
+                                  for col in range(xu.shape[1])]).T
+        start = stop
+    scale = S_white_simple(x_group_sums)
+
     cov_c = _HCCM2(hessian_inv, scale)
 
     if use_correction:
@@ -547,7 +659,8 @@ def cov_cluster(results, group, use_correction=True):
 
     return cov_c
 
-def cov_cluster_2groups(results, group, group2=None, use_correction=True):
+def cov_cluster_2groups(results, group, group2=None, use_correction=True,
+                        chunksize=None):
     '''cluster robust covariance matrix for two groups/clusters
 
     Parameters
@@ -557,6 +670,9 @@ def cov_cluster_2groups(results, group, group2=None, use_correction=True):
        TODO: this should use wexog instead
     use_correction : bool
        If true (default), then the small sample correction factor is used.
+    chunksize : int or None
+       If not None and results is a regression result, then the scores are
+       computed for chunksize observations at a time, see cov_cluster.
 
     Returns
     -------
@@ -588,15 +704,18 @@ def cov_cluster_2groups(results, group, group2=None, use_correction=True):
         group = (group0, group1)
 
 
-    cov0 = cov_cluster(results, group0, use_correction=use_correction)
+    cov0 = cov_cluster(results, group0, use_correction=use_correction,
+                       chunksize=chunksize)
     #[0] because we get still also returns bse
-    cov1 = cov_cluster(results, group1, use_correction=use_correction)
+    cov1 = cov_cluster(results, group1, use_correction=use_correction,
+                       chunksize=chunksize)
 
     group_intersection = Group(group)
     #cov of cluster formed by intersection of two groups
     cov01 = cov_cluster(results,
                         group_intersection.group_int,
-                        use_correction=use_correction)
+                        use_correction=use_correction,
+                        chunksize=chunksize)
 
     #robust cov matrix for union of groups
     cov_both = cov0 + cov1 - cov01
@@ -605,7 +724,7 @@ def cov_cluster_2groups(results, group, group2=None, use_correction=True):
     return cov_both, cov0, cov1
 
 
-def cov_white_simple(results, use_correction=True):
+def cov_white_simple(results, use_correction=True, chunksize=None):
     '''
     heteroscedasticity robust covariance matrix (White)
 
@@ -614,6 +733,9 @@ def cov_white_simple(results, use_correction=True):
     results : result instance
        result of a regression, uses results.model.exog and results.resid
        TODO: this should use wexog instead
+    chunksize : int or None
+       If not None and results is a regression result, then the scores are
+       computed for chunksize observations at a time.
 
     Returns
     -------
@@ -633,20 +755,22 @@ def cov_white_simple(results, use_correction=True):
         with small sample corrections
 
     '''
-    xu, hessian_inv = _get_sandwich_arrays(results)
-    sigma = S_white_simple(xu)
+    chunks, hessian_inv, nobs, k_params = _get_sandwich_chunks(results,
+                                                               chunksize)
+    sigma = 0.
+    for xu in chunks:
+        sigma += S_white_simple(xu)
 
     cov_w = _HCCM2(hessian_inv, sigma)  #add bread to sandwich
 
     if use_correction:
-        nobs, k_params = xu.shape
         cov_w *= nobs / float(nobs - k_params)
 
     return cov_w
 
 
 def cov_hac_simple(results, nlags=None, weights_func=weights_bartlett,
-                   use_correction=True):
+                   use_correction=True, chunksize=None):
     '''
     heteroscedasticity and autocorrelation robust covariance matrix (Newey-West)
 
@@ -665,6 +789,9 @@ def cov_hac_simple(results, nlags=None, weights_func=weights_bartlett,
     weights_func : callable
         weights_func is called with nlags as argument to get the kernel
         weights. default are Bartlett weights
+    chunksize : int or None
+       If not None and results is a regression result, then the scores are
+       computed for chunksize observations at a time.
 
     Returns
     -------
@@ -679,13 +806,15 @@ def cov_hac_simple(results, nlags=None, weights_func=weights_bartlett,
     options might change when other kernels besides Bartlett are available.
 
     '''
-    xu, hessian_inv = _get_sandwich_arrays(results)
-    sigma = S_hac_simple(xu, nlags=nlags, weights_func=weights_func)
+    chunks, hessian_inv, nobs, k_params = _get_sandwich_chunks(results,
+                                                               chunksize)
+    if nlags is None:
+        nlags = int(np.floor(4 * (nobs / 100.)**(2./9.)))
+    sigma = _S_hac_chunks(chunks, nlags, weights_func=weights_func)
 
     cov_hac = _HCCM2(hessian_inv, sigma)
 
     if use_correction:
-        nobs, k_params = xu.shape
         cov_hac *= nobs / float(nobs - k_params)
 
     return cov_hac
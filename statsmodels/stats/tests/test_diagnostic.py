@@ -14,7 +14,7 @@ import os
 import numpy as np
 
 from numpy.testing import (assert_, assert_almost_equal, assert_equal,
-                           assert_approx_equal)
+                           assert_approx_equal, assert_allclose)
 from nose import SkipTest
 
 from statsmodels.regression.linear_model import OLS, GLSAR
@@ -761,6 +761,30 @@ def test_influence_wrapped():
     assert_almost_equal(infl.dfbetas, infl_r2[:,:3], decimal=13)
     assert_almost_equal(infl.cov_ratio, infl_r2[:,4], decimal=14)
 
+def test_influence_looo_closed_form():
+    # compare deletion formulas with explicit leave-one-out regressions
+    np.random.seed(63525)
+    nobs = 40
+    exog = add_constant(np.random.randn(nobs, 3))
+    endog = exog.sum(1) + np.random.randn(nobs)
+    endog[5] += 5
+    res = OLS(endog, exog).fit()
+    infl = oi.OLSInfluence(res)
+
+    params = np.zeros_like(exog)
+    mse_resid = np.zeros(nobs)
+    det_cov_params = np.zeros(nobs)
+    for i in range(nobs):
+        mask = np.arange(nobs) != i
+        res_i = OLS(endog[mask], exog[mask]).fit()
+        params[i] = res_i.params
+        mse_resid[i] = res_i.mse_resid
+        det_cov_params[i] = np.linalg.det(res_i.cov_params())
+
+    assert_allclose(infl.params_not_obsi, params, rtol=1e-10)
+    assert_allclose(infl.sigma2_not_obsi, mse_resid, rtol=1e-10)
+    assert_allclose(infl.det_cov_params_not_obsi, det_cov_params, rtol=1e-10)
+
 def test_outlier_test():
     # results from R with NA -> 1. Just testing interface here because
     # outlier_test is just a wrapper
@@ -10,7 +10,7 @@ Created on Sat Dec 17 08:39:16 2011
 Author: Josef Perktold
 """
 import numpy as np
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_almost_equal, assert_allclose, assert_equal
 
 from statsmodels.regression.linear_model import OLS, GLSAR
 from statsmodels.tools.tools import add_constant
@@ -89,6 +89,45 @@ def test_hac_simple():
     cov4 = sw.cov_hac_simple(res_olsg, nlags=4, use_correction=False)
     assert_almost_equal(cov3, cov4, decimal=14)
 
+def test_chunked():
+    # blocked computations agree with the ones using all rows at once
+
+    np.random.seed(987125)
+    nobs = 503
+    exog = add_constant(np.random.randn(nobs, 3))
+    endog = exog.sum(1) + np.random.randn(nobs) * (1 + np.abs(exog[:, 1]))
+    group = np.repeat(np.arange(51), 10)[:nobs]
+    res = OLS(endog, exog).fit()
+    res_np = OLS(endog, exog).fit(store_pinv=False)
+    assert_equal(hasattr(res_np.model, 'pinv_wexog'), False)
+    assert_allclose(res_np.params, res.params, rtol=1e-12)
+
+    pinv_wexog = res.model.pinv_wexog
+    for cov_type in ['HC0', 'HC1', 'HC2', 'HC3']:
+        cov_res = getattr(res, 'cov_' + cov_type)
+        het_scale = res.het_scale
+        cov = np.dot(pinv_wexog, het_scale[:, None] * pinv_wexog.T)
+        assert_allclose(cov_res, cov, rtol=1e-10)
+        assert_allclose(getattr(res_np, 'cov_' + cov_type), cov, rtol=1e-10)
+        cov_sw = getattr(sw, 'cov_' + cov_type.lower())(res, chunksize=50)
+        assert_allclose(cov_sw, cov, rtol=1e-10)
+
+    assert_allclose(sw._leverage(exog, res.normalized_cov_params, 50),
+                    (exog * pinv_wexog.T).sum(1), rtol=1e-10)
+
+    for nlags in [0, 1, 4, 60]:
+        cov1 = sw.cov_hac_simple(res, nlags=nlags)
+        cov2 = sw.cov_hac_simple(res, nlags=nlags, chunksize=50)
+        assert_allclose(cov2, cov1, rtol=1e-10)
+
+    cov1 = sw.cov_cluster(res, group)
+    cov2 = sw.cov_cluster(res, group, chunksize=50)
+    assert_allclose(cov2, cov1, rtol=1e-10)
+
+    cov1 = sw.cov_white_simple(res)
+    cov2 = sw.cov_white_simple(res, chunksize=50)
+    assert_allclose(cov2, cov1, rtol=1e-10)
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=[__file__, '-vvs', '-x'], exit=False)
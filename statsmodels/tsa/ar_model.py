@@ -22,6 +22,52 @@ from statsmodels.tsa.base.datetools import _index_date
 __all__ = ['AR']
 
 
+def _nested_ar_ic(y, X, k_trend, startlag, ic):
+    """
+    Information criteria of the conditional MLE for lags startlag, ...,
+    maxlag
+
+    X has the trend columns followed by the lags 1, ..., maxlag. The model
+    with `lag` lags uses the first k_trend + lag columns, so the sum of
+    squared residuals of every model follows from one QR decomposition of X.
+    For 't-stat' the t-value of the highest lag is returned instead.
+
+    X needs at least as many rows as columns, otherwise the QR decomposition
+    does not identify the models with the highest lags.
+    """
+    nobs, k_max = X.shape
+    q, r = np.linalg.qr(X)
+    b = np.dot(q.T, y)
+    resid = y - np.dot(q, b)
+    # ssr of the model with the first k columns, accumulated from the
+    # full model to avoid cancellation in y'y - b'b
+    ssr = np.dot(resid, resid) + np.r_[np.cumsum((b**2)[::-1])[::-1], 0]
+
+    results = {}
+    for lag in range(startlag, k_max - k_trend + 1):
+        k = k_trend + lag
+        if ic == 't-stat':
+            # last coefficient is b[k-1] / r[k-1, k-1] with standard error
+            # sqrt(ols_scale) / |r[k-1, k-1]|
+            ols_scale = ssr[k] / (nobs - k)
+            results[lag] = (b[k - 1] * np.sign(r[k - 1, k - 1]) /
+                            np.sqrt(ols_scale))
+            continue
+        sigma2 = ssr[k] / nobs
+        df_model = k
+        if ic == 'aic':
+            results[lag] = np.log(sigma2) + 2 * (1 + df_model) / nobs
+        elif ic == 'bic':
+            results[lag] = (np.log(sigma2) +
+                            (1 + df_model) * np.log(nobs) / nobs)
+        elif ic == 'hqic':
+            results[lag] = (np.log(sigma2) + 2 * np.log(np.log(nobs)) / nobs *
+                            (1 + df_model))
+        else:
+            raise ValueError("ic option %s not understood" % ic)
+    return results
+
+
 def _check_ar_start(start, k_ar, method, dynamic):
     if (method == 'cmle' or dynamic) and start < k_ar:
         raise ValueError("Start must be >= k_ar for conditional MLE "
@@ -395,7 +441,8 @@ class AR(tsbase.TimeSeriesModel):
         self.k_trend = k_trend
         return X
 
-    def select_order(self, maxlag, ic, trend='c', method='mle'):
+    def select_order(self, maxlag, ic, trend='c', method='mle',
+                     full_output=False):
         """
         Select the lag order according to the information criterion.
 
@@ -409,11 +456,28 @@ class AR(tsbase.TimeSeriesModel):
         trend : str {'c','nc'}
             Whether to include a constant or not. 'c' - include constant.
             'nc' - no constant.
+        method : str {'cmle', 'mle'}
+            Estimation method used for the candidate models. See `AR.fit`.
+        full_output : bool
+            If True, the criterion for all lags is also returned.
 
         Returns
         -------
         bestlag : int
             Best lag according to IC.
+        results : dict
+            Only returned if `full_output` is True. Maps each lag to the
+            value of the information criterion, or to the t-value of the
+            highest lag if `ic` is 't-stat'.
+
+        Notes
+        -----
+        For `method` 'cmle' all candidate models are regressions on the
+        first columns of the design for `maxlag`, and the criteria for all
+        lags are computed from a single QR decomposition. For 't-stat' all
+        lags are then evaluated, not only the lags down to the selected one.
+        If that design has fewer observations than columns, each lag is
+        fit separately instead.
         """
         endog = self.endog
 
@@ -426,7 +490,20 @@ class AR(tsbase.TimeSeriesModel):
         k = max(1, k)  # handle if startlag is 0
         results = {}
 
-        if ic != 't-stat':
+        if method == 'cmle' and X.shape[0] >= X.shape[1]:
+            results = _nested_ar_ic(Y[:, 0], X, self.k_trend, k, ic)
+            if ic != 't-stat':
+                bestic, bestlag = min((res, k) for k, res in
+                                      iteritems(results))
+            else:
+                stop = 1.6448536269514722  # for t-stat, norm.ppf(.95)
+                bestlag = k  # no lag is significant
+                for lag in range(maxlag, k - 1, -1):
+                    if np.abs(results[lag]) >= stop:
+                        bestlag = lag
+                        break
+
+        elif ic != 't-stat':
             for lag in range(k, maxlag+1):
                 # have to reinstantiate the model to keep comparable models
                 endog_tmp = endog[maxlag-lag:]
@@ -444,10 +521,13 @@ class AR(tsbase.TimeSeriesModel):
                 fit = AR(endog_tmp).fit(maxlag=lag, method=method,
                                         full_output=0, trend=trend,
                                         maxiter=35, disp=-1)
+                results[lag] = fit.tvalues[-1]
 
                 if np.abs(fit.tvalues[-1]) >= stop:
                     bestlag = lag
                     break
+        if full_output:
+            return bestlag, results
         return bestlag
 
     def fit(self, maxlag=None, method='cmle', ic=None, trend='c',
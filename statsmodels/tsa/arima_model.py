@@ -5,7 +5,7 @@
 #       packages such as gretl and X12-ARIMA
 
 from __future__ import absolute_import
-from statsmodels.compat.python import string_types, range
+from statsmodels.compat.python import string_types, range, lrange
 # for 2to3 with extensions
 
 from datetime import datetime
@@ -15,7 +15,7 @@ from scipy import optimize
 from scipy.stats import t, norm
 from scipy.signal import lfilter
 from numpy import dot, log, zeros, pi
-from numpy.linalg import inv
+from numpy.linalg import inv, LinAlgError
 
 from statsmodels.tools.decorators import (cache_readonly,
                                           resettable_cache)
@@ -29,9 +29,12 @@ from statsmodels.tsa.tsatools import (lagmat, add_trend,
 from statsmodels.tsa.vector_ar import util
 from statsmodels.tsa.ar_model import AR
 from statsmodels.tsa.arima_process import arma2ma
-from statsmodels.tools.numdiff import approx_hess_cs, approx_fprime_cs
+from statsmodels.tools.numdiff import (approx_hess_cs, approx_fprime_cs,
+                                       approx_fprime)
 from statsmodels.tsa.base.datetools import _index_date
 from statsmodels.tsa.kalmanf import KalmanFilter
+from statsmodels.tools.parallel import parallel_func
+from statsmodels.base.optimizer import Optimizer
 
 _armax_notes = """
 
@@ -576,20 +579,61 @@ class ARMA(tsbase.TimeSeriesModel):
 
         Notes
         -----
-        This is a numerical approximation.
+        For the exact likelihood, methods 'mle' and 'css-mle', the score is
+        computed analytically by the derivative recursions of the Kalman
+        filter. Otherwise this is a numerical approximation.
         """
+        if self.method in ['mle', 'css-mle'] and np.isrealobj(params):
+            return self.score_obs(params).sum(0)
         return approx_fprime_cs(params, self.loglike, args=(False,))
 
+    def score_obs(self, params):
+        """
+        Compute the score contribution of each observation at params.
+
+        Notes
+        -----
+        Only available for the exact likelihood, methods 'mle' and 'css-mle'.
+        The variance of the innovations, sigma2, is concentrated out of the
+        loglikelihood. The outer product of the score contributions is the
+        OPG estimate of the information matrix.
+        """
+        return self._loglike_score(params)[1]
+
+    def information(self, params):
+        """
+        Compute the expected information matrix at params.
+
+        Notes
+        -----
+        Only available for the exact likelihood, methods 'mle' and 'css-mle'.
+        See Harvey (1989) section 3.4.6. The variance of the innovations,
+        sigma2, is concentrated out of the loglikelihood.
+        """
+        return self._loglike_score(params)[2]
+
     def hessian(self, params):
         """
         Compute the Hessian at params,
 
         Notes
         -----
-        This is a numerical approximation.
+        This is a numerical approximation. For the exact likelihood, methods
+        'mle' and 'css-mle', it is the numerical derivative of the analytic
+        score.
         """
+        if self.method in ['mle', 'css-mle']:
+            hess = approx_fprime(params, self.score, centered=True)
+            return (hess + hess.T) / 2.
         return approx_hess_cs(params, self.loglike, args=(False,))
 
+    def _loglike_score(self, params, set_sigma2=False):
+        if self.method not in ['mle', 'css-mle']:
+            raise ValueError("Analytic derivatives are only available for "
+                             "method 'mle' or 'css-mle'")
+        params = np.asarray(params, dtype=float)
+        return KalmanFilter.loglike_score(params, self, set_sigma2)
+
     def _transparams(self, params):
         """
         Transforms params to induce stationarity/invertability.
@@ -806,6 +850,54 @@ class ARMA(tsbase.TimeSeriesModel):
         llf = -nobs/2.*(log(2*pi) + log(sigma2)) - ssr/(2*sigma2)
         return llf
 
+    def _setup_fit(self, trend, method, transparams):
+        """
+        Set the trend, exog, names, method and nobs of the model as used in
+        the estimation. Returns the lower case method.
+        """
+        k_ar = self.k_ar
+        k_ma = self.k_ma
+
+        # enforce invertibility
+        self.transparams = transparams
+
+        endog, exog = self.endog, self.exog
+        k_exog = self.k_exog
+        self.nobs = len(endog)  # this is overwritten if method is 'css'
+
+        # (re)set trend and handle exogenous variables
+        # always pass original exog
+        k_trend, exog = _make_arma_exog(endog, self.exog, trend)
+
+        # Check has something to estimate
+        if k_ar == 0 and k_ma == 0 and k_trend == 0 and k_exog == 0:
+            raise ValueError("Estimation requires the inclusion of least one "
+                         "AR term, MA term, a constant or an exogenous "
+                         "variable.")
+
+        # check again now that we know the trend
+        _check_estimable(len(endog), k_ar + k_ma + k_exog + k_trend)
+
+        self.k_trend = k_trend
+        self.exog = exog    # overwrites original exog from __init__
+
+        # (re)set names for this model, there are no names without the data
+        # handling of the model
+        if self.data is not None:
+            self.exog_names = _make_arma_names(self.data, k_trend,
+                                               (k_ar, k_ma), self.exog_names)
+
+        # choose objective function
+        if k_ma == 0 and k_ar == 0:
+            method = "css"  # Always CSS when no AR or MA terms
+
+        self.method = method = method.lower()
+
+        # adjust nobs for css
+        if method == 'css':
+            self.nobs = len(self.endog) - k_ar
+        return method
+
     def fit(self, order=None, start_params=None, trend='c', method="css-mle",
             transparams=True, solver='lbfgs', maxiter=50, full_output=1,
             disp=5, callback=None, **kwargs):
@@ -899,43 +991,8 @@ class ARMA(tsbase.TimeSeriesModel):
         k_ar = self.k_ar
         k_ma = self.k_ma
 
-        # enforce invertibility
-        self.transparams = transparams
-
-        endog, exog = self.endog, self.exog
-        k_exog = self.k_exog
-        self.nobs = len(endog)  # this is overwritten if method is 'css'
-
-        # (re)set trend and handle exogenous variables
-        # always pass original exog
-        k_trend, exog = _make_arma_exog(endog, self.exog, trend)
-
-        # Check has something to estimate
-        if k_ar == 0 and k_ma == 0 and k_trend == 0 and k_exog == 0:
-            raise ValueError("Estimation requires the inclusion of least one "
-                         "AR term, MA term, a constant or an exogenous "
-                         "variable.")
-
-        # check again now that we know the trend
-        _check_estimable(len(endog), k_ar + k_ma + k_exog + k_trend)
-
-        self.k_trend = k_trend
-        self.exog = exog    # overwrites original exog from __init__
-
-        # (re)set names for this model
-        self.exog_names = _make_arma_names(self.data, k_trend, (k_ar, k_ma),
-                                           self.exog_names)
-        k = k_trend + k_exog
-
-        # choose objective function
-        if k_ma == 0 and k_ar == 0:
-            method = "css"  # Always CSS when no AR or MA terms
-
-        self.method = method = method.lower()
-
-        # adjust nobs for css
-        if method == 'css':
-            self.nobs = len(self.endog) - k_ar
+        method = self._setup_fit(trend, method, transparams)
+        k = self.k_trend + self.k_exog
 
         if start_params is not None:
             start_params = np.asarray(start_params)
@@ -950,7 +1007,8 @@ class ARMA(tsbase.TimeSeriesModel):
             kwargs.setdefault('pgtol', 1e-8)
             kwargs.setdefault('factr', 1e2)
             kwargs.setdefault('m', 12)
-            kwargs.setdefault('approx_grad', True)
+            if method == 'css':
+                kwargs.setdefault('approx_grad', True)
         mlefit = super(ARMA, self).fit(start_params, method=solver,
                                        maxiter=maxiter,
                                        full_output=full_output, disp=disp,
@@ -1128,9 +1186,13 @@ class ARIMA(ARMA):
                                            maxiter, full_output, disp,
                                            callback, **kwargs)
         normalized_cov_params = None  # TODO: fix this?
-        arima_fit = ARIMAResults(self, arima_fit._results.params,
+        mlefit = arima_fit._results
+        arima_fit = ARIMAResults(self, mlefit.params,
                                  normalized_cov_params)
         arima_fit.k_diff = self.k_diff
+        arima_fit.mle_retvals = mlefit.mle_retvals
+        arima_fit.mle_settings = mlefit.mle_settings
+        arima_fit.mlefit = mlefit.mlefit
         return ARIMAResultsWrapper(arima_fit)
 
     def predict(self, params, start=None, end=None, exog=None, typ='linear',
@@ -1901,6 +1963,320 @@ class ARIMAResultsWrapper(ARMAResultsWrapper):
 wrap.populate_wrapper(ARIMAResultsWrapper, ARIMAResults)
 
 
+def _arma_results_from_params(mod, params, trend, method):
+    """
+    Results of an unfitted ARMA or ARIMA model at given params.
+
+    The model is put in the same state as after fit, without estimation.
+    """
+    mod._setup_fit(trend, method, transparams=False)
+    mod.loglike(params)  # sets sigma2
+
+    if isinstance(mod, ARIMA):
+        res = ARIMAResults(mod, params)
+        res.k_diff = mod.k_diff
+        return ARIMAResultsWrapper(res)
+    return ARMAResultsWrapper(ARMAResults(mod, params))
+
+
+class _ARMAArrays(ARMA):
+    """
+    ARMA model on plain arrays without the data handling of the model.
+
+    Used to fit many series, it has no names, dates or missing value
+    handling.
+    """
+    def __init__(self, endog, order, exog=None):
+        _check_estimable(len(endog), sum(order))
+        if exog is not None and exog.ndim == 1:
+            exog = exog[:, None]
+        self.endog = endog
+        self.exog = exog
+        self.data = None
+        self.exog_names = None
+        self.k_ar = k_ar = order[0]
+        self.k_ma = k_ma = order[1]
+        self.k_lags = max(k_ar, k_ma + 1)
+        self.k_exog = 0 if exog is None else exog.shape[1]
+
+
+def _fit_arma_arrays(endog, exog, order, trend, method, fit_kw):
+    """
+    Estimate an ARMA or ARIMA model from arrays.
+
+    This follows ARMA.fit with the same start params, loglikelihood and
+    optimizer, but without the data handling and without results instances.
+    Returns params, llf, sigma2, nobs and converged.
+    """
+    k_ar, k_diff, k_ma = order
+    fit_kw = dict(fit_kw)
+    start_params = fit_kw.pop('start_params', None)
+    transparams = fit_kw.pop('transparams', True)
+    solver = fit_kw.pop('solver', 'lbfgs')
+    maxiter = fit_kw.pop('maxiter', 50)
+    full_output = fit_kw.pop('full_output', 1)
+    disp = fit_kw.pop('disp', 5)
+    callback = fit_kw.pop('callback', None)
+    fit_kw.pop('skip_hessian', None)
+    fit_kw.pop('warn_convergence', None)
+
+    if k_diff:
+        endog = np.diff(endog, n=k_diff)
+        if exog is not None:
+            exog = exog[k_diff:]
+    mod = _ARMAArrays(endog, (k_ar, k_ma), exog)
+    method = mod._setup_fit(trend, method, transparams)
+    k = mod.k_trend + mod.k_exog
+
+    if start_params is not None:
+        start_params = np.asarray(start_params)
+    else:
+        start_params = mod._fit_start_params((k_ar, k_ma, k), method)
+    if transparams:
+        start_params = mod._invtransparams(start_params)
+
+    if solver == 'lbfgs':
+        fit_kw.setdefault('pgtol', 1e-8)
+        fit_kw.setdefault('factr', 1e2)
+        fit_kw.setdefault('m', 12)
+        if method == 'css':
+            fit_kw.setdefault('approx_grad', True)
+
+    # objective as in LikelihoodModel.fit
+    nobs = len(endog)
+    f = lambda params: -mod.loglike(params) / nobs
+    score = lambda params: -mod.score(params) / nobs
+    hess = lambda params: -mod.hessian(params) / nobs
+    if solver == 'newton':
+        score = lambda params: mod.score(params) / nobs
+        hess = lambda params: mod.hessian(params) / nobs
+    xopt, retvals, _ = Optimizer()._fit(f, score, start_params, (), fit_kw,
+                                        hessian=hess, method=solver,
+                                        disp=disp, maxiter=maxiter,
+                                        callback=callback,
+                                        full_output=full_output)
+    if transparams:
+        xopt = mod._transparams(xopt)
+    mod.transparams = False
+    llf = mod.loglike(xopt)  # sets sigma2
+    converged = True
+    if isinstance(retvals, dict):
+        converged = retvals.get('converged', True)
+    return xopt, llf, mod.sigma2, mod.nobs, converged
+
+
+def _fit_arma_chunk(series, order, trend, method, fit_kw):
+    """
+    Fit the model to each (endog, exog) pair in series.
+
+    Returns a list with params, llf, sigma2, nobs and converged for each
+    series, or None if the estimation failed.
+    """
+    fits = []
+    for endog, exog in series:
+        try:
+            fits.append(_fit_arma_arrays(endog, exog, order, trend, method,
+                                         fit_kw))
+        except (ValueError, LinAlgError):
+            fits.append(None)
+    return fits
+
+
+def _batch_series(endog, exog):
+    # list of (endog, exog) with the missing values at the beginning and the
+    # end of each series removed
+    if isinstance(endog, (list, tuple)):
+        endog = [np.asarray(y, dtype=float) for y in endog]
+    else:
+        endog = np.asarray(endog, dtype=float)
+        if endog.ndim == 1:
+            endog = endog[:, None]
+        endog = [endog[:, i] for i in range(endog.shape[1])]
+    if exog is None:
+        exog = [None] * len(endog)
+    elif len(exog) != len(endog):
+        raise ValueError("exog needs one array for each series")
+
+    series = []
+    for i, (y, x) in enumerate(zip(endog, exog)):
+        valid = np.nonzero(~np.isnan(y))[0]
+        if len(valid) == 0:
+            raise ValueError("series %d has no observations" % i)
+        start, end = valid[0], valid[-1] + 1
+        if end - start != len(valid):
+            raise ValueError("series %d has missing values within the "
+                             "sample" % i)
+        if x is not None:
+            x = np.asarray(x, dtype=float)
+            if len(x) != len(y):
+                raise ValueError("exog for series %d does not have the same "
+                                 "length as the series" % i)
+            x = x[start:end]
+        series.append((y[start:end], x))
+    return series
+
+
+def fit_arma_batch(endog, order, exog=None, trend='c', method='css-mle',
+                   n_jobs=1, **fit_kw):
+    """
+    Fit the same ARMA or ARIMA model to many series.
+
+    Parameters
+    ----------
+    endog : array-like or list
+        A 2d array with one series in each column, or a list of 1d arrays.
+        Missing values, nan, at the beginning and at the end of a column are
+        dropped, so that the series can have different lengths.
+    order : iterable
+        The (p, q) order of an ARMA model or the (p, d, q) order of an ARIMA
+        model.
+    exog : list, optional
+        One array of exogenous variables for each series, with the same
+        number of rows as the series before missing values are dropped.
+    trend : str {'c','nc'}
+        Whether to include a constant or not.
+    method : str {'css-mle','mle','css'}
+        The loglikelihood to maximize, see ARMA.fit.
+    n_jobs : int
+        Number of processes used to fit the series. -1 uses all CPU cores.
+        Default is 1. Requires joblib, the series are fit serially if it is
+        not available.
+    fit_kw
+        Keyword arguments passed to ARMA.fit. By default, there is no output
+        and the Hessian is not computed after the optimization.
+
+    Returns
+    -------
+    ARMABatchResults
+
+    Notes
+    -----
+    Only the parameters, the loglikelihood and sigma2 are kept for each
+    series. The full results for a series are created on demand by
+    `ARMABatchResults.get_results`, without estimating the model again.
+
+    Series for which the estimation fails, for example because the starting
+    parameters are not stationary, have nan for all results.
+    """
+    order = tuple(order)
+    if len(order) == 2:
+        order = (order[0], 0, order[1])
+    fit_kw.setdefault('disp', -1 if fit_kw.get('solver', 'lbfgs') == 'lbfgs'
+                              else 0)
+    fit_kw.setdefault('skip_hessian', True)
+
+    names = getattr(endog, 'columns', None)
+    series = _batch_series(endog, exog)
+    n_series = len(series)
+
+    if n_jobs != 1:
+        parallel, p_func, n_jobs = parallel_func(_fit_arma_chunk, n_jobs,
+                                                 verbose=0)
+    if n_jobs == 1:
+        fits = _fit_arma_chunk(series, order, trend, method, fit_kw)
+    else:
+        chunks = np.array_split(np.arange(n_series), min(n_jobs, n_series))
+        fits = parallel(p_func([series[i] for i in chunk], order, trend,
+                               method, fit_kw) for chunk in chunks)
+        fits = [fit for chunk_fits in fits for fit in chunk_fits]
+
+    estimated = [i for i, fit in enumerate(fits) if fit is not None]
+    if not estimated:
+        raise ValueError("The model could not be estimated for any series")
+    # the names are the same for all series, they need the data handling
+    endog_i, exog_i = series[estimated[0]]
+    mod = ARIMA(endog_i, order, exog=exog_i)
+    mod._setup_fit(trend, method, transparams=False)
+    param_names = mod.exog_names
+
+    params = np.nan * np.ones((n_series, len(param_names)))
+    llf = np.nan * np.ones(n_series)
+    sigma2 = np.nan * np.ones(n_series)
+    nobs = np.zeros(n_series, dtype=int)
+    converged = np.zeros(n_series, dtype=bool)
+    for i in estimated:
+        params[i], llf[i], sigma2[i], nobs[i], converged[i] = fits[i]
+
+    return ARMABatchResults(series, order, trend, method, params, llf,
+                            sigma2, nobs, converged, param_names, names)
+
+
+class ARMABatchResults(object):
+    """
+    Results of fitting the same ARMA or ARIMA model to many series.
+
+    Attributes
+    ----------
+    params : ndarray
+        n_series x k_params array of the estimated parameters.
+    llf : ndarray
+        The loglikelihood of each series.
+    sigma2 : ndarray
+        The variance of the innovations of each series.
+    nobs : ndarray
+        The number of observations used in the estimation.
+    converged : ndarray
+        Whether the optimizer converged for each series.
+    param_names : list
+        The names of the parameters.
+
+    Notes
+    -----
+    Use `get_results` for the full results of a single series.
+    """
+    def __init__(self, series, order, trend, method, params, llf, sigma2,
+                 nobs, converged, param_names, names=None):
+        self._series = series
+        self.order = order
+        self.trend = trend
+        self.method = method
+        self.params = params
+        self.llf = llf
+        self.sigma2 = sigma2
+        self.nobs = nobs
+        self.converged = converged
+        self.param_names = param_names
+        if names is None:
+            names = lrange(len(series))
+        self.names = list(names)
+        self._results = {}
+
+    def get_results(self, i):
+        """
+        Full results for series i.
+
+        Returns
+        -------
+        ARMAResults or ARIMAResults instance at the estimated parameters.
+        The instance is created once, without estimating the model again,
+        and it does not contain the optimizer output.
+        """
+        if i not in self._results:
+            if np.isnan(self.llf[i]):
+                raise ValueError("The model could not be estimated for "
+                                 "series %d" % i)
+            endog, exog = self._series[i]
+            mod = ARIMA(endog, self.order, exog=exog)
+            self._results[i] = _arma_results_from_params(mod, self.params[i],
+                                                         self.trend,
+                                                         self.method)
+        return self._results[i]
+
+    def summary_frame(self):
+        """
+        DataFrame with the parameters, llf, sigma2, nobs and converged with
+        one row for each series.
+        """
+        from pandas import DataFrame
+        frame = DataFrame(self.params, index=self.names,
+                          columns=self.param_names)
+        frame['llf'] = self.llf
+        frame['sigma2'] = self.sigma2
+        frame['nobs'] = self.nobs
+        frame['converged'] = self.converged
+        return frame
+
+
 if __name__ == "__main__":
     import statsmodels.api as sm
 
@@ -2,7 +2,7 @@ import scipy.linalg.blas
 from numpy cimport float64_t, ndarray, complex128_t, complex64_t
 from numpy import log as nplog
 from numpy import (identity, dot, kron, pi, sum, zeros_like, ones, asarray,
-                   complex128, float64, asfortranarray)
+                   complex128, float64, asfortranarray, zeros)
 from numpy.linalg import pinv
 cimport cython
 cimport numpy as cnp
@@ -19,6 +19,10 @@ cdef int FORTRAN = 1
 
 cdef extern from "math.h":
     double log(double x)
+    double fabs(double x)
+
+# tolerance for the convergence of the state covariance to the steady state
+STEADY_TOL = 1e-13
 
 cdef extern from "capsule.h":
     void* SMCapsule_AsVoidPtr(object ptr)
@@ -41,9 +45,14 @@ def kalman_filter_double(double[:] y not None,
                   int r, unsigned int nobs,
                          double[::1,:] Z_mat,
                          double[::1,:] R_mat,
-                         double[::1,:] T_mat):
+                         double[::1,:] T_mat,
+                         double tol=STEADY_TOL):
     """
     Cython version of the Kalman filter recursions for an ARMA process.
+
+    Once the largest absolute change in the state covariance P is at most
+    tol, the gain K and the variance F are kept fixed at their steady state
+    values and only the state and the forecast errors are updated.
     """
     cdef cnp.npy_intp yshape[2]
     yshape[0] = <cnp.npy_intp> nobs
@@ -96,12 +105,15 @@ def kalman_filter_double(double[:] y not None,
         # T_mat rows x P cols
         double[::1,:] tmp3 = PyArray_ZEROS(2, r2shape, cnp.NPY_DOUBLE, FORTRAN)
         int ldt3 = tmp3.strides[1]/sizeof(DOUBLE)
+        # previous P to check convergence
+        double[::1,:] P_prev = PyArray_ZEROS(2, r2shape, cnp.NPY_DOUBLE,
+                                             FORTRAN)
+        bint steady = 0
 
         double alph = 1.0
         double beta = 0.0
 
-    #NOTE: not sure about just checking F_mat[0,0], didn't appear to work
-    while not F_mat == 1. and i < nobs:
+    while not steady and i < nobs:
         #print i
         # Predict
         #v_mat = ddot(&r, &Z_mat[0,0], &one, &alpha[0,0], &one)
@@ -158,6 +170,7 @@ def kalman_filter_double(double[:] y not None,
         # tmp5 = dot(R_mat, R_mat.T)
         # tmp3 = dot(T_mat, P)
         # P = dot(tmp3, L.T) + tmp5
+        P_prev[:, :] = P
         dgemm("N", "N", &r, &r, &r, &alph, &T_mat[0,0], &ldt, &P[0,0],
               &ldp, &beta, &tmp3[0,0], &ldt3)
         dgemm("N", "T", &r, &r, &one, &alph, &R_mat[0,0], &ldr, &R_mat[0,0],
@@ -169,14 +182,24 @@ def kalman_filter_double(double[:] y not None,
         #dsyrk(101, 122, "N", r, 1, 1.0, &R_mat[0,0],
         #      &ldr, 1.0, &P[0,0], &ldp )
 
+        # steady state if P did not change
+        steady = 1
+        for jj in range(r):
+            for kk in range(r):
+                if fabs(P[jj,kk] - P_prev[jj,kk]) > tol:
+                    steady = 0
+
         loglikelihood += log(F_mat)
         i+=1
 
+    # steady state, F and K are fixed
+    loglikelihood += (<int> nobs - i) * log(F_mat)
     for i in xrange(i,nobs):
         #v_mat = ddot(&r, &Z_mat[0,0], &one, &alpha[0,0], &one)
         #v_mat = y[i] - v_mat
         v_mat = y[i] - alpha[0,0]
         v[i, 0] = v_mat
+        F[i,0] = F_mat
         #alpha = dot(T_mat, alpha) + dot(K, v_mat)
         dgemm("N", "N", &r, &one, &r, &alph, &T_mat[0,0], &ldt, &alpha[0,0],
               &lda, &beta, &tmp2[0,0], &ldt2)
@@ -193,9 +216,14 @@ def kalman_filter_complex(dcomplex[:] y,
                   int r, unsigned int nobs,
                           dcomplex[::1,:] Z_mat,
                           dcomplex[::1,:] R_mat,
-                          dcomplex[::1,:] T_mat):
+                          dcomplex[::1,:] T_mat,
+                          double tol=STEADY_TOL):
     """
     Cython version of the Kalman filter recursions for an ARMA process.
+
+    The switch to the steady state uses the real part of the change in P,
+    so that the complex-step derivatives follow the same recursions as
+    `kalman_filter_double`.
     """
     cdef cnp.npy_intp yshape[2]
     yshape[0] = <cnp.npy_intp> nobs
@@ -245,11 +273,15 @@ def kalman_filter_complex(dcomplex[:] y,
         # T_mat rows x P cols
         dcomplex[::1,:] tmp3 = PyArray_ZEROS(2, r2shape, cnp.NPY_CDOUBLE, FORTRAN)
         int ldt3 = tmp3.strides[1]/sizeof(dcomplex)
+        # previous P to check convergence
+        dcomplex[::1,:] P_prev = PyArray_ZEROS(2, r2shape, cnp.NPY_CDOUBLE,
+                                               FORTRAN)
+        bint steady = 0
 
         dcomplex alph = 1+0j
         dcomplex beta = 0
 
-    while not F_mat == 1 and i < nobs:
+    while not steady and i < nobs:
         #v_mat = zdotu(&r, &Z_mat[0,0], &one, &alpha[0,0], &one)
         # Z_mat is just a selector matrix
         v_mat = y[i] - alpha[0,0]
@@ -303,6 +335,7 @@ def kalman_filter_complex(dcomplex[:] y,
         # tmp5 = dot(R_mat, R_mat.T)
         # tmp3 = dot(T_mat, P)
         # P = dot(tmp3, L.T) + tmp5
+        P_prev[:, :] = P
         zgemm("N", "N", &r, &r, &r, &alph, &T_mat[0,0], &ldt, &P[0,0], &ldp,
               &beta, &tmp3[0,0], &ldt3)
         zgemm("N", "T", &r, &r, &one, &alph, &R_mat[0,0], &ldr, &R_mat[0,0],
@@ -310,14 +343,24 @@ def kalman_filter_complex(dcomplex[:] y,
         zgemm("N", "T", &r, &r, &r, &alph, &tmp3[0,0], &ldt3, &L[0,0], &ldl, &alph,
               &P[0,0], &ldp)
 
+        # steady state if the real part of P did not change
+        steady = 1
+        for jj in range(r):
+            for kk in range(r):
+                if fabs((P[jj,kk] - P_prev[jj,kk]).real) > tol:
+                    steady = 0
+
         loglikelihood += nplog(F_mat)
         i+=1
 
+    # steady state, F and K are fixed
+    loglikelihood += (<int> nobs - i) * nplog(F_mat)
     for i in xrange(i,nobs):
         #v_mat = zdotu(&r, &Z_mat[0,0], &one, &alpha[0,0], &one)
         #Z_mat is just a selector
         v_mat = y[i] - alpha[0,0]
         v[i, 0] = v_mat
+        F[i,0] = F_mat
         #alpha = dot(T_mat, alpha) + dot(K, v_mat)
         zgemm("N", "N", &r, &one, &r, &alph, &T_mat[0,0], &ldt, &alpha[0,0], &lda,
               &beta, &tmp2[0,0], &ldt2)
@@ -335,11 +378,13 @@ def kalman_loglike_double(double[:] y, unsigned int k, unsigned int p,
                           unsigned int q, int r, unsigned int nobs,
                           double[::1,:] Z_mat,
                           double[::1,:] R_mat,
-                          double[::1,:] T_mat):
+                          double[::1,:] T_mat,
+                          double tol=STEADY_TOL):
     """
     Cython version of the Kalman filter recursions for an ARMA process.
     """
-    v, F, loglikelihood = kalman_filter_double(y,k,p,q,r,nobs,Z_mat,R_mat,T_mat)
+    v, F, loglikelihood = kalman_filter_double(y,k,p,q,r,nobs,Z_mat,R_mat,T_mat,
+                                               tol)
     sigma2 = 1./nobs * sum(v**2 / F)
     loglike = -.5 *(loglikelihood + nobs*log(sigma2))
     loglike -= nobs/2. * (log(2*pi) + 1)
@@ -352,12 +397,231 @@ def kalman_loglike_complex(dcomplex[:] y, unsigned int k, unsigned int p,
                            unsigned int q, int r, unsigned int nobs,
                            dcomplex[::1,:] Z_mat,
                            dcomplex[::1,:] R_mat,
-                           dcomplex[::1,:] T_mat):
+                           dcomplex[::1,:] T_mat,
+                           double tol=STEADY_TOL):
     """
     Cython version of the Kalman filter recursions for an ARMA process.
     """
-    v, F, loglikelihood = kalman_filter_complex(y,k,p,q,r,nobs,Z_mat,R_mat,T_mat)
+    v, F, loglikelihood = kalman_filter_complex(y,k,p,q,r,nobs,Z_mat,R_mat,T_mat,
+                                                tol)
     sigma2 = 1./nobs * sum(v**2 / F)
     loglike = -.5 *(loglikelihood + nobs*nplog(sigma2))
     loglike -= nobs/2. * (log(2*pi) + 1)
     return loglike, sigma2
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def kalman_filter_deriv_double(double[:] y not None,
+                               double[::1,:] dy not None,
+                               int r, unsigned int nobs,
+                               double[::1,:] R_mat,
+                               double[::1,:] T_mat,
+                               double[::1,:] dR,
+                               double[::1,:,:] dT,
+                               double tol=STEADY_TOL):
+    """
+    Kalman filter recursions for an ARMA process together with the
+    derivatives of the forecast errors and their variances.
+
+    dy, dR and dT hold the derivatives of y, R_mat and T_mat with respect to
+    each of the m parameters in their last axis.  Returns v, F, their
+    derivatives dv and dF, nobs x m, and the sum of log(F).  The recursions
+    switch to the steady state as in `kalman_filter_double` once neither P
+    nor its derivatives change by more than tol.
+
+    References
+    ----------
+    Harvey, A.C. (1989). Forecasting, structural time series models and the
+    Kalman filter. Section 3.4.6.
+    """
+    cdef:
+        int m = dy.shape[1]
+        int i = 0, ii, jj, kk, j
+        double[::1] v = zeros(nobs)
+        double[::1] F = ones(nobs)
+        double[::1,:] dv = zeros((nobs, m), order='F')
+        double[::1,:] dF = zeros((nobs, m), order='F')
+        double loglikelihood = 0
+        double v_mat = 0, F_mat = 0., dv_mat, dF_mat, tmp
+        bint steady = 0
+        double[::1] alpha = zeros(r)
+        double[::1,:] dalpha = zeros((r, m), order='F')
+        double[::1] K = zeros(r)
+        double[::1,:] dK = zeros((r, m), order='F')
+        double[::1] tmp2 = zeros(r)
+        double[::1,:] TP = zeros((r, r), order='F')
+        double[::1,:] dTP = zeros((r, r), order='F')
+        double[::1,:] P
+        double[::1,:,:] dP
+
+    # initial variance and its derivatives, each solves the Lyapunov equation
+    # P = T P T' + Q
+    T_arr = asarray(T_mat)
+    R_arr = asarray(R_mat)
+    Tinv = pinv(identity(r**2) - kron(T_arr, T_arr))
+    P_arr = dot(Tinv, dot(R_arr, R_arr.T).ravel('F')).reshape(r, r, order='F')
+    P = asfortranarray(P_arr)
+    dP_arr = zeros((r, r, m), order='F')
+    for j in range(m):
+        Q = (dot(dot(asarray(dT[:, :, j]), P_arr), T_arr.T) +
+             dot(asarray(dR[:, j:j+1]), R_arr.T))
+        dP_arr[:, :, j] = dot(Tinv, (Q + Q.T).ravel('F')).reshape(r, r,
+                                                                 order='F')
+    dP = dP_arr
+
+    while not steady and i < nobs:
+        steady = 1
+        # Z_mat is just a selector matrix
+        v_mat = y[i] - alpha[0]
+        F_mat = P[0,0]
+        v[i] = v_mat
+        F[i] = F_mat
+
+        # TP = dot(T_mat, P), K = dot(TP, Z_mat.T) / F
+        for ii in range(r):
+            for jj in range(r):
+                tmp = 0
+                for kk in range(r):
+                    tmp = tmp + T_mat[ii,kk] * P[kk,jj]
+                TP[ii,jj] = tmp
+        for ii in range(r):
+            K[ii] = TP[ii,0] / F_mat
+
+        for j in range(m):
+            dv_mat = dy[i,j] - dalpha[0,j]
+            dF_mat = dP[0,0,j]
+            dv[i,j] = dv_mat
+            dF[i,j] = dF_mat
+
+            # dTP = dT P + T dP
+            for ii in range(r):
+                for jj in range(r):
+                    tmp = 0
+                    for kk in range(r):
+                        tmp = tmp + (dT[ii,kk,j] * P[kk,jj] +
+                                     T_mat[ii,kk] * dP[kk,jj,j])
+                    dTP[ii,jj] = tmp
+            for ii in range(r):
+                dK[ii,j] = (dTP[ii,0] - K[ii] * dF_mat) / F_mat
+
+            # dalpha = dT alpha + T dalpha + dK v + K dv
+            for ii in range(r):
+                tmp = dK[ii,j] * v_mat + K[ii] * dv_mat
+                for kk in range(r):
+                    tmp = tmp + (dT[ii,kk,j] * alpha[kk] +
+                                 T_mat[ii,kk] * dalpha[kk,j])
+                tmp2[ii] = tmp
+            for ii in range(r):
+                dalpha[ii,j] = tmp2[ii]
+
+            # P = T P T' - F K K' + R R', so that
+            # dP = dTP T' + TP dT' - d(F K K') + dR R' + R dR'
+            for ii in range(r):
+                for jj in range(r):
+                    tmp = (dR[ii,j] * R_mat[jj,0] + R_mat[ii,0] * dR[jj,j] -
+                           dF_mat * K[ii] * K[jj] -
+                           F_mat * (dK[ii,j] * K[jj] + K[ii] * dK[jj,j]))
+                    for kk in range(r):
+                        tmp = tmp + (dTP[ii,kk] * T_mat[jj,kk] +
+                                     TP[ii,kk] * dT[jj,kk,j])
+                    if fabs(tmp - dP[ii,jj,j]) > tol:
+                        steady = 0
+                    dP[ii,jj,j] = tmp
+
+        # update state, alpha = T alpha + K v
+        for ii in range(r):
+            tmp = K[ii] * v_mat
+            for kk in range(r):
+                tmp = tmp + T_mat[ii,kk] * alpha[kk]
+            tmp2[ii] = tmp
+        for ii in range(r):
+            alpha[ii] = tmp2[ii]
+
+        # P = dot(TP, T.T) - F K K' + R R'
+        for ii in range(r):
+            for jj in range(r):
+                tmp = R_mat[ii,0] * R_mat[jj,0] - F_mat * K[ii] * K[jj]
+                for kk in range(r):
+                    tmp = tmp + TP[ii,kk] * T_mat[jj,kk]
+                if fabs(tmp - P[ii,jj]) > tol:
+                    steady = 0
+                P[ii,jj] = tmp
+
+        loglikelihood += log(F_mat)
+        i += 1
+
+    # steady state, K, dK and F are fixed
+    loglikelihood += (<int> nobs - i) * log(F_mat)
+    for i in range(i, nobs):
+        v_mat = y[i] - alpha[0]
+        v[i] = v_mat
+        F[i] = F_mat
+        for j in range(m):
+            dv_mat = dy[i,j] - dalpha[0,j]
+            dv[i,j] = dv_mat
+            for ii in range(r):
+                tmp = dK[ii,j] * v_mat + K[ii] * dv_mat
+                for kk in range(r):
+                    tmp = tmp + (dT[ii,kk,j] * alpha[kk] +
+                                 T_mat[ii,kk] * dalpha[kk,j])
+                tmp2[ii] = tmp
+            for ii in range(r):
+                dalpha[ii,j] = tmp2[ii]
+        for ii in range(r):
+            tmp = K[ii] * v_mat
+            for kk in range(r):
+                tmp = tmp + T_mat[ii,kk] * alpha[kk]
+            tmp2[ii] = tmp
+        for ii in range(r):
+            alpha[ii] = tmp2[ii]
+
+    return (asarray(v), asarray(F), asarray(dv), asarray(dF),
+            loglikelihood)
+
+def kalman_score_double(double[:] y not None,
+                        double[::1,:] dy not None,
+                        int r, unsigned int nobs,
+                        double[::1,:] R_mat,
+                        double[::1,:] T_mat,
+                        double[::1,:] dR,
+                        double[::1,:,:] dT):
+    """
+    Loglikelihood, score and information of an ARMA process from a single
+    pass of the Kalman filter derivative recursions.
+
+    The derivatives are with respect to the m parameters described by dy,
+    dR and dT, see `kalman_filter_deriv_double`.  sigma2 is concentrated
+    out of the loglikelihood.
+
+    Returns
+    -------
+    loglike : float
+        The concentrated loglikelihood.
+    sigma2 : float
+        The estimate of the variance of the innovations.
+    score_obs : ndarray
+        nobs x m contributions of each observation to the score.  Their sum
+        is the score of the concentrated loglikelihood, and their outer
+        product is the OPG estimate of the information matrix.
+    information : ndarray
+        m x m expected information matrix of the concentrated
+        loglikelihood, Harvey (1989) equation 3.4.69 with the expectation
+        of the outer product of dv replaced by its observed value.
+    """
+    v, F, dv, dF, loglikelihood = kalman_filter_deriv_double(y, dy, r, nobs,
+                                                             R_mat, T_mat,
+                                                             dR, dT)
+    sigma2 = 1./nobs * sum(v**2 / F)
+    loglike = -.5 *(loglikelihood + nobs*log(sigma2))
+    loglike -= nobs/2. * (log(2*pi) + 1)
+
+    dF_F = dF / F[:,None]
+    vF = v / (sigma2 * F)
+    score_obs = -.5 * dF_F * (1 - v * vF)[:,None] - vF[:,None] * dv
+    # information of the parameters and sigma2 with sigma2 partialled out
+    dF_sum = dF_F.sum(0)
+    information = (dot(dv.T, dv / (sigma2 * F)[:,None]) +
+                   .5 * dot(dF_F.T, dF_F) -
+                   .5 / nobs * dF_sum[:,None] * dF_sum)
+    return loglike, sigma2, score_obs, information
@@ -30,6 +30,7 @@ import numpy as np
 from numpy import dot, identity, kron, log, zeros, pi, exp, eye, issubdtype, ones
 from numpy.linalg import inv, pinv
 from statsmodels.tools.tools import chain_dot
+from statsmodels.tools.numdiff import approx_fprime_cs
 from . import kalman_loglike
 
 #Fast filtering and smoothing for multivariate state space models
@@ -638,8 +639,6 @@ class KalmanFilter(object):
         complex values being used to compute the numerical derivative. If
         available will use a Cython version of the Kalman Filter.
         """
-        #TODO: see section 3.4.6 in Harvey for computing the derivatives in the
-        # recursion itself.
         #TODO: this won't work for time-varying parameters
         (y, k, nobs, k_ar, k_ma, k_lags, newparams, Z_mat, m, R_mat, T_mat,
                 paramsdtype) = cls._init_kalman_state(params, arma_model)
@@ -660,11 +659,69 @@ class KalmanFilter(object):
 
         return loglike
 
+    @classmethod
+    def loglike_score(cls, params, arma_model, set_sigma2=True):
+        """
+        The loglikelihood, score and information for an ARMA model.
+
+        Parameters
+        ----------
+        params : array
+            The coefficients of the ARMA model, assumed to be in the order of
+            trend variables and `k` exogenous coefficients, the `p` AR
+            coefficients, then the `q` MA coefficients.
+        arma_model : `statsmodels.tsa.arima.ARMA` instance
+            A reference to the ARMA model instance.
+        set_sigma2 : bool, optional
+            True if arma_model.sigma2 should be set.
+
+        Returns
+        -------
+        loglike : float
+            The loglikelihood at params.
+        score_obs : array
+            nobs x k_params contributions of each observation to the score.
+        information : array
+            The expected information matrix.
+
+        Notes
+        -----
+        The derivatives are computed analytically by the derivative
+        recursions of the Kalman filter in a single pass, see section 3.4.6
+        in Harvey. If arma_model.transparams is True, they are with respect to
+        the transformed parameters. Only real valued parameters are
+        supported.
+        """
+        (y, k, nobs, k_ar, k_ma, k_lags, newparams, Z_mat, m, R_mat, T_mat,
+                paramsdtype) = cls._init_kalman_state(params, arma_model)
+        k_params = len(params)
+        nobs = int(nobs)
+
+        # derivatives of y and the system matrices w.r.t. newparams
+        dy = zeros((nobs, k_params), order="F")
+        if k > 0:
+            dy[:, :k] = -arma_model.exog
+        dT = zeros((m, m, k_params), order="F")
+        dT[np.arange(k_ar), 0, k + np.arange(k_ar)] = 1.
+        dR = zeros((m, k_params), order="F")
+        dR[1 + np.arange(k_ma), k + k_ar + np.arange(k_ma)] = 1.
+
+        loglike, sigma2, score_obs, information = \
+                kalman_loglike.kalman_score_double(y, dy, k_lags, nobs,
+                                                   R_mat, T_mat, dR, dT)
+        if arma_model.transparams:
+            # chain rule, jac[i, j] is d newparams[i] / d params[j]
+            jac = approx_fprime_cs(params, arma_model._transparams)
+            score_obs = dot(score_obs, jac)
+            information = chain_dot(jac.T, information, jac)
+        if set_sigma2:
+            arma_model.sigma2 = sigma2
+
+        return loglike, score_obs, information
+
 
 if __name__ == "__main__":
-    import numpy as np
     from scipy.linalg import block_diag
-    import numpy as np
     # Make our observations as in 13.1.13
     np.random.seed(54321)
     nobs = 600
@@ -6,11 +6,13 @@ from statsmodels.compat.python import (iteritems, range, lrange, string_types, l
 import numpy as np
 from numpy.linalg import LinAlgError
 from scipy import stats
-from statsmodels.regression.linear_model import OLS, yule_walker
+from scipy.linalg import toeplitz
+from statsmodels.regression.linear_model import OLS
 from statsmodels.tools.tools import add_constant, Bunch
 from .tsatools import lagmat, lagmat2ds, add_trend
 from .adfvalues import mackinnonp, mackinnoncrit
-from statsmodels.tsa.arima_model import ARMA
+from statsmodels.tsa.arima_model import ARMA, ARMAResults
+from statsmodels.tools.parallel import parallel_func
 from statsmodels.compat.scipy import _next_regular
 
 __all__ = ['acovf', 'acf', 'pacf', 'pacf_yw', 'pacf_ols', 'ccovf', 'ccf',
@@ -283,7 +285,32 @@ def adfuller(x, maxlag=None, regression="c", autolag='AIC',
             return adfstat, pvalue, usedlag, nobs, critvalues, icbest
 
 
-def acovf(x, unbiased=False, demean=True, fft=False):
+def _crosscorr_lags(x, y, nlag, fft=False):
+    '''
+    Sum of products x[t + k] * y[t] for lags k = 0, ..., nlag
+
+    x and y are 1d arrays of the same length and nlag is at most
+    len(x) - 1.  The FFT is zero-padded only as far as needed to avoid
+    wrap-around up to lag nlag.
+    '''
+    n = len(x)
+    if fft:
+        # circular correlation of length nfft is exact for lags
+        # k <= nfft - n
+        nfft = _next_regular(n + nlag)
+        Fx = np.fft.rfft(x, n=nfft)
+        if y is x:
+            Fy = Fx
+        else:
+            Fy = np.fft.rfft(y, n=nfft)
+        return np.fft.irfft(Fx * np.conjugate(Fy), n=nfft)[:nlag + 1]
+    elif nlag < n - 1:
+        return np.array([np.dot(x[k:], y[:n - k]) for k in range(nlag + 1)])
+    else:
+        return np.correlate(x, y, 'full')[n - 1:]
+
+
+def acovf(x, unbiased=False, demean=True, fft=False, nlag=None):
     '''
     Autocovariance for 1D
 
@@ -298,33 +325,37 @@ def acovf(x, unbiased=False, demean=True, fft=False):
     fft : bool
         If True, use FFT convolution.  This method should be preferred
         for long time series.
+    nlag : int, optional
+        Largest lag for which the autocovariance is computed.  The
+        default, None, returns all lags up to len(x) - 1.
 
     Returns
     -------
     acovf : array
-        autocovariance function
+        autocovariance function, nlag + 1 elements including lag zero
+
+    Notes
+    -----
+    The direct method, fft=False, costs O(n * nlag) if nlag is smaller
+    than len(x) - 1, and O(n**2) for all lags.
     '''
     x = np.squeeze(np.asarray(x))
     if x.ndim > 1:
         raise ValueError("x must be 1d. Got %d dims." % x.ndim)
     n = len(x)
+    if nlag is None or nlag > n - 1:
+        nlag = n - 1
 
     if demean:
         xo = x - x.mean()
     else:
         xo = x
     if unbiased:
-        xi = np.arange(1, n + 1)
-        d = np.hstack((xi, xi[:-1][::-1]))
-    else:
-        d = n * np.ones(2 * n - 1)
-    if fft:
-        nobs = len(xo)
-        Frf = np.fft.fft(xo, n=nobs * 2)
-        acov = np.fft.ifft(Frf * np.conjugate(Frf))[:nobs] / d[n - 1:]
-        return acov.real
+        d = n - np.arange(nlag + 1)
     else:
-        return (np.correlate(xo, xo, 'full') / d)[n - 1:]
+        d = n
+
+    return _crosscorr_lags(xo, xo, nlag, fft=fft) / d
 
 
 def q_stat(x, nobs, type="ljungbox"):
@@ -405,32 +436,16 @@ def acf(x, unbiased=False, nlags=40, confint=None, qstat=False, fft=False,
     -----
     The acf at lag 0 (ie., 1) is returned.
 
-    This is based np.correlate which does full convolution. For very long time
-    series it is recommended to use fft convolution instead.
+    Only the autocovariances up to lag `nlags` are computed, see `acovf`.
+    For very long time series with many lags it is recommended to use fft
+    convolution instead.
 
     If unbiased is true, the denominator for the autocovariance is adjusted
     but the autocorrelation is not an unbiased estimtor.
     '''
     nobs = len(x)
-    d = nobs  # changes if unbiased
-    if not fft:
-        avf = acovf(x, unbiased=unbiased, demean=True)
-        #acf = np.take(avf/avf[0], range(1,nlags+1))
-        acf = avf[:nlags + 1] / avf[0]
-    else:
-        x = np.squeeze(np.asarray(x))
-        #JP: move to acovf
-        x0 = x - x.mean()
-        # ensure that we always use a power of 2 or 3 for zero-padding,
-        # this way we'll ensure O(n log n) runtime of the fft.
-        n = _next_regular(2 * nobs + 1)
-        Frf = np.fft.fft(x0, n=n)  # zero-pad for separability
-        if unbiased:
-            d = nobs - np.arange(nobs)
-        acf = np.fft.ifft(Frf * np.conjugate(Frf))[:nobs] / d
-        acf /= acf[0]
-        #acf = np.take(np.real(acf), range(1,nlags+1))
-        acf = np.real(acf[:nlags + 1])   # keep lag 0
+    avf = acovf(x, unbiased=unbiased, demean=True, fft=fft, nlag=nlags)
+    acf = avf / avf[0]
     if not (confint or qstat or alpha):
         return acf
     if not confint is None:
@@ -481,12 +496,17 @@ def pacf_yw(x, nlags=40, method='unbiased'):
 
     Notes
     -----
-    This solves yule_walker for each desired lag and contains
-    currently duplicate calculations.
+    This solves the yule_walker equations for each desired lag.  The
+    autocovariances are computed only once, for all lags.
     '''
+    method = str(method).lower()
+    if method not in ["unbiased", "mle"]:
+        raise ValueError("ACF estimation method must be 'unbiased' or 'MLE'")
+    r = acovf(np.asarray(x, dtype=np.float64), unbiased=(method == "unbiased"),
+              demean=True, nlag=nlags)
     pacf = [1.]
     for k in range(1, nlags + 1):
-        pacf.append(yule_walker(x, k, method=method)[0][-1])
+        pacf.append(np.linalg.solve(toeplitz(r[:k]), r[1:k + 1])[-1])
     return np.array(pacf)
 
 
@@ -571,13 +591,13 @@ def pacf(x, nlags=40, method='ywunbiased', alpha=None):
     elif method in ['ywm', 'ywmle', 'yw_mle']:
         ret = pacf_yw(x, nlags=nlags, method='mle')
     elif method in ['ld', 'ldu', 'ldunbiase', 'ld_unbiased']:
-        acv = acovf(x, unbiased=True)
+        acv = acovf(x, unbiased=True, nlag=nlags)
         ld_ = levinson_durbin(acv, nlags=nlags, isacov=True)
         #print 'ld', ld_
         ret = ld_[2]
     # inconsistent naming with ywmle
     elif method in ['ldb', 'ldbiased', 'ld_biased']:
-        acv = acovf(x, unbiased=False)
+        acv = acovf(x, unbiased=False, nlag=nlags)
         ld_ = levinson_durbin(acv, nlags=nlags, isacov=True)
         ret = ld_[2]
     else:
@@ -592,7 +612,7 @@ def pacf(x, nlags=40, method='ywunbiased', alpha=None):
         return ret
 
 
-def ccovf(x, y, unbiased=True, demean=True):
+def ccovf(x, y, unbiased=True, demean=True, fft=False, nlag=None):
     ''' crosscovariance for 1D
 
     Parameters
@@ -601,18 +621,31 @@ def ccovf(x, y, unbiased=True, demean=True):
        time series data
     unbiased : boolean
        if True, then denominators is n-k, otherwise n
+    demean : boolean
+       if True, then subtract the mean from x and y
+    fft : boolean
+       if True, use FFT convolution.  This method should be preferred
+       for long time series.
+    nlag : int, optional
+       Largest lag for which the crosscovariance is computed.  The
+       default, None, returns all lags up to len(x) - 1.
 
     Returns
     -------
     ccovf : array
-        autocovariance function
+        crosscovariance function, cov(x[t + k], y[t]) for k = 0, ...,
+        nlag
 
     Notes
     -----
-    This uses np.correlate which does full convolution. For very long time
-    series it is recommended to use fft convolution instead.
+    The direct method, fft=False, costs O(n * nlag) if nlag is smaller
+    than len(x) - 1, and O(n**2) for all lags.
     '''
+    x = np.asarray(x)
+    y = np.asarray(y)
     n = len(x)
+    if nlag is None or nlag > n - 1:
+        nlag = n - 1
     if demean:
         xo = x - x.mean()
         yo = y - y.mean()
@@ -620,14 +653,13 @@ def ccovf(x, y, unbiased=True, demean=True):
         xo = x
         yo = y
     if unbiased:
-        xi = np.ones(n)
-        d = np.correlate(xi, xi, 'full')
+        d = n - np.arange(nlag + 1)
     else:
         d = n
-    return (np.correlate(xo, yo, 'full') / d)[n - 1:]
+    return _crosscorr_lags(xo, yo, nlag, fft=fft) / d
 
 
-def ccf(x, y, unbiased=True):
+def ccf(x, y, unbiased=True, fft=False, nlag=None):
     '''cross-correlation function for 1d
 
     Parameters
@@ -636,6 +668,12 @@ def ccf(x, y, unbiased=True):
        time series data
     unbiased : boolean
        if True, then denominators for autocovariance is n-k, otherwise n
+    fft : boolean
+       if True, use FFT convolution.  This method should be preferred
+       for long time series.
+    nlag : int, optional
+       Largest lag for which the cross-correlation is computed.  The
+       default, None, returns all lags up to len(x) - 1.
 
     Returns
     -------
@@ -644,14 +682,13 @@ def ccf(x, y, unbiased=True):
 
     Notes
     -----
-    This is based np.correlate which does full convolution. For very long time
-    series it is recommended to use fft convolution instead.
+    This is based on `ccovf`, see there for the computational cost.
 
     If unbiased is true, the denominator for the autocovariance is adjusted
     but the autocorrelation is not an unbiased estimtor.
 
     '''
-    cvf = ccovf(x, y, unbiased=unbiased, demean=True)
+    cvf = ccovf(x, y, unbiased=unbiased, demean=True, fft=fft, nlag=nlag)
     return cvf / (np.std(x) * np.std(y))
 
 
@@ -978,8 +1015,58 @@ def _safe_arma_fit(y, order, model_kw, trend, fit_kw, start_params=None):
         return
 
 
+def _arma_hr_results(y, order, model_kw, trend):
+    """
+    ARMA results at the Hannan-Rissanen estimates without any
+    optimization.  The loglikelihood is the conditional sum of squares
+    loglikelihood.
+    """
+    try:
+        mod = ARMA(y, order=order, **model_kw)
+        mod._setup_fit(trend, 'css', transparams=False)
+        params = mod._fit_start_params_hr((order[0], order[1],
+                                           mod.k_trend + mod.k_exog))
+        mod.loglike_css(params)  # sets sigma2
+        return ARMAResults(mod, params)
+    except (LinAlgError, ValueError):
+        return
+
+
+def _arma_order_ic(y, order, ic, model_kw, trend, fit_kw, screen=None):
+    """
+    Information criteria for one ARMA order, nan if estimation fails.
+
+    screen is None for the estimation with `fit_kw`, 'css' for the
+    conditional sum of squares estimate or 'hr' for the Hannan-Rissanen
+    estimates.
+    """
+    if screen == 'hr':
+        mod = _arma_hr_results(y, order, model_kw, trend)
+    elif screen == 'css':
+        css_kw = dict(fit_kw)
+        css_kw['method'] = 'css'
+        mod = _safe_arma_fit(y, order, model_kw, trend, css_kw)
+    else:
+        mod = _safe_arma_fit(y, order, model_kw, trend, fit_kw)
+    if mod is None:
+        return np.nan * np.ones(len(ic))
+    if screen is None:
+        return np.array([getattr(mod, criteria) for criteria in ic])
+
+    # The conditional likelihood drops the first k_ar observations.
+    # For a comparison across orders, the criteria are computed with
+    # the residual variance for the full sample.
+    nobs = len(mod.model.endog)
+    llf = -nobs / 2. * (np.log(2 * np.pi) + np.log(mod.sigma2) + 1)
+    penalty = {'aic': 2., 'bic': np.log(nobs),
+               'hqic': 2 * np.log(np.log(nobs))}
+    return np.array([-2 * llf + penalty[criteria] * mod._ic_df_model
+                     for criteria in ic])
+
+
 def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
-                         model_kw={}, fit_kw={}):
+                         model_kw={}, fit_kw={}, n_jobs=1, screen=None,
+                         n_screen=5):
     """
     Returns information criteria for many ARMA models
 
@@ -1000,13 +1087,32 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
         Keyword arguments to be passed to the ``ARMA`` model
     fit_kw : dict
         Keyword arguments to be passed to ``ARMA.fit``.
+    n_jobs : int
+        Number of processes used to estimate the models for the different
+        orders. -1 uses all CPU cores. Default is 1. Requires joblib, the
+        models are estimated serially if it is not available.
+    screen : None, 'css' or 'hr'
+        If not None, all orders are first ranked by information criteria
+        computed from cheap estimates, and only the `n_screen` best orders
+        for each criterion are estimated with `fit_kw`.
+
+        - 'css' uses conditional sum of squares estimates
+        - 'hr' uses the Hannan-Rissanen estimates, which require only
+          least squares regressions, with the conditional sum of squares
+          loglikelihood
+    n_screen : int
+        Number of orders for each criterion that are kept after the
+        screening stage. Ignored if `screen` is None.
 
     Returns
     -------
     obj : Results object
         Each ic is an attribute with a DataFrame for the results. The AR order
         used is the row index. The ma order used is the column index. The
-        minimum orders are available as ``ic_min_order``.
+        minimum orders are available as ``ic_min_order``. If `screen` is
+        used, the criteria of the screening stage are available as
+        ``ic_screen``, and the orders that were not kept are nan in the
+        final results.
 
     Examples
     --------
@@ -1031,9 +1137,8 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
     This method can be used to tentatively identify the order of an ARMA
     process, provided that the time series is stationary and invertible. This
     function computes the full exact MLE estimate of each model and can be,
-    therefore a little slow. An implementation using approximate estimates
-    will be provided in the future. In the meantime, consider passing
-    {method : 'css'} to fit_kw.
+    therefore a little slow. Use `screen` to estimate only the most promising
+    orders by exact MLE, or consider passing {method : 'css'} to fit_kw.
     """
     from pandas import DataFrame
 
@@ -1043,30 +1148,60 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
         ic = [ic]
     elif not isinstance(ic, (list, tuple)):
         raise ValueError("Need a list or a tuple for ic if not a string.")
-
-    results = np.zeros((len(ic), max_ar + 1, max_ma + 1))
-
-    for ar in ar_range:
-        for ma in ma_range:
-            if ar == 0 and ma == 0 and trend == 'nc':
-                results[:, ar, ma] = np.nan
-                continue
-
-            mod = _safe_arma_fit(y, (ar, ma), model_kw, trend, fit_kw)
-            if mod is None:
-                results[:, ar, ma] = np.nan
-                continue
-
-            for i, criteria in enumerate(ic):
-                results[i, ar, ma] = getattr(mod, criteria)
-
+    if screen not in (None, 'css', 'hr'):
+        raise ValueError("screen must be None, 'css' or 'hr'")
+    if screen is not None and not set(ic) <= set(['aic', 'bic', 'hqic']):
+        raise ValueError("screen requires ic in 'aic', 'bic', 'hqic'")
+
+    orders = [(ar, ma) for ar in ar_range for ma in ma_range
+              if not (ar == 0 and ma == 0 and trend == 'nc')]
+
+    if n_jobs != 1:
+        parallel, p_func, n_jobs = parallel_func(_arma_order_ic, n_jobs,
+                                                 verbose=0)
+
+    def order_ic(orders, screen=None):
+        # ic for a list of orders, n_orders x n_ic array
+        if not orders:
+            return np.zeros((0, len(ic)))
+        if n_jobs == 1:
+            res = [_arma_order_ic(y, order, ic, model_kw, trend, fit_kw,
+                                  screen) for order in orders]
+        else:
+            res = parallel(p_func(y, order, ic, model_kw, trend, fit_kw,
+                                  screen) for order in orders)
+        return np.array(res)
+
+    def to_array(orders, values):
+        results = np.nan * np.ones((len(ic), max_ar + 1, max_ma + 1))
+        for (ar, ma), value in zip(orders, values):
+            results[:, ar, ma] = value
+        return results
+
+    res = {}
+    if screen is not None:
+        screen_ic = order_ic(orders, screen)
+        keep = np.zeros(len(orders), dtype=bool)
+        for i, criteria in enumerate(ic):
+            values = screen_ic[:, i]
+            rank = np.argsort(np.where(np.isnan(values), np.inf, values),
+                              kind='mergesort')
+            rank = rank[np.isfinite(values[rank])][:n_screen]
+            keep[rank] = True
+            res[criteria + '_screen'] = DataFrame(
+                to_array(orders, screen_ic)[i], columns=ma_range,
+                index=ar_range)
+        orders = [order for order, k in zip(orders, keep) if k]
+
+    results = to_array(orders, order_ic(orders))
     dfs = [DataFrame(res, columns=ma_range, index=ar_range) for res in results]
 
-    res = dict(zip(ic, dfs))
+    res.update(zip(ic, dfs))
 
     # add the minimums to the results dict
     min_res = {}
-    for i, result in iteritems(res):
+    for i in ic:
+        result = res[i]
         mins = np.where(result.min().min() == result)
         min_res.update({i + '_min_order' : (mins[0][0], mins[1][0])})
     res.update(min_res)
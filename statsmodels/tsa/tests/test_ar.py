@@ -256,6 +256,34 @@ class TestAutolagAR(object):
 
         npt.assert_almost_equal(self.res1, self.res2, DECIMAL_6)
 
+def test_select_order_nested():
+    # single QR path agrees with refitting each lag on the same sample
+    endog = sm.datasets.sunspots.load().endog
+    maxlag = 12
+    for trend in ['c', 'nc']:
+        for ic in ['aic', 'bic', 'hqic', 't-stat']:
+            bestlag, ics = AR(endog).select_order(maxlag, ic, trend, 'cmle',
+                                                  full_output=True)
+            assert_(sorted(ics) == list(range(1, maxlag + 1)))
+            for lag in range(1, maxlag + 1):
+                r = AR(endog[maxlag - lag:]).fit(maxlag=lag, trend=trend)
+                if ic == 't-stat':
+                    assert_allclose(ics[lag], r.tvalues[-1], rtol=1e-10)
+                else:
+                    assert_allclose(ics[lag], getattr(r, ic), rtol=1e-10)
+            assert_(bestlag == 9)
+
+def test_select_order_short_series():
+    # maxlag design with more columns than observations falls back to
+    # fitting each lag
+    np.random.seed(12345)
+    endog = np.random.randn(8)
+    bestlag, ics = AR(endog).select_order(5, 'bic', 'nc', 'cmle',
+                                          full_output=True)
+    assert_(sorted(ics) == list(range(1, 6)))
+    res = AR(endog).fit(ic='bic', trend='nc', maxlag=5)
+    assert_(res.k_ar == bestlag)
+
 def test_ar_dates():
     # just make sure they work
     data = sm.datasets.sunspots.load()
@@ -1988,6 +1988,114 @@ def test_arma_missing():
     assert_raises(MissingDataError, ARMA, y, (1, 0), missing='raise')
 
 
+def test_arma_score_analytic():
+    from statsmodels.tools.numdiff import approx_fprime_cs
+    np.random.seed(54321)
+    nobs = 300
+    exog = np.random.randn(nobs, 2)
+    endog = (arma_generate_sample([1, -.5, .2], [1, .4], nobs) +
+             np.dot(exog, [1., -.5]))
+    mod = ARMA(endog, (2, 1), exog=exog)
+    res = mod.fit(trend='c', disp=-1)
+    params = res.params + .02
+    for transparams in [False, True]:
+        mod.transparams = transparams
+        score = mod.score(params)
+        score_cs = approx_fprime_cs(params, mod.loglike, args=(False,))
+        assert_almost_equal(score, score_cs, 8)
+        assert_almost_equal(mod.score_obs(params).sum(0), score, 8)
+    mod.transparams = False
+
+    # expected information at the estimate, close to the Hessian
+    info = mod.information(res.params)
+    assert_(info.shape == (6, 6))
+    assert_almost_equal(info, info.T, 8)
+    assert_almost_equal(np.sqrt(np.diag(np.linalg.inv(info)))[:3], res.bse[:3],
+                        3)
+
+    # css has no analytic score
+    res_css = ARMA(endog, (2, 1), exog=exog).fit(method='css', disp=-1)
+    assert_raises(ValueError, res_css.model.score_obs, res_css.params)
+
+
+def test_kalman_steady_state():
+    from statsmodels.tsa.kalmanf.kalmanfilter import KalmanFilter
+    from statsmodels.tsa.kalmanf import kalman_loglike
+    np.random.seed(12345)
+    nobs = 2000
+    # slowly converging and non-invertible MA
+    for ma in [.99, 1.5]:
+        y = arma_generate_sample([1, -.5], [1, ma], nobs)
+        params = np.array([.5, ma])
+        T_mat = KalmanFilter.T(params, 2, 0, 1)
+        R_mat = KalmanFilter.R(params, 2, 0, 1, 1)
+        Z_mat = KalmanFilter.Z(2)
+        args = (y, 0, 1, 1, 2, nobs, Z_mat, R_mat, T_mat)
+        # tol=0 runs the full recursions until P does not change at all
+        v0, F0, llf0 = kalman_loglike.kalman_filter_double(*args, tol=0)
+        v, F, llf = kalman_loglike.kalman_filter_double(*args)
+        assert_almost_equal(v, v0, 8)
+        assert_almost_equal(np.asarray(F), np.asarray(F0), 8)
+        assert_almost_equal(llf, llf0, 8)
+        assert_almost_equal(kalman_loglike.kalman_loglike_double(*args),
+                            kalman_loglike.kalman_loglike_double(*args,
+                                                                 tol=0), 8)
+        # the complex filter for complex-step derivatives switches to the
+        # steady state at the same observation
+        args_c = (y.astype(complex), 0, 1, 1, 2, nobs,
+                  np.asfortranarray(Z_mat, dtype=complex),
+                  np.asfortranarray(R_mat, dtype=complex),
+                  np.asfortranarray(T_mat, dtype=complex))
+        vc, Fc, llfc = kalman_loglike.kalman_filter_complex(*args_c)
+        assert_almost_equal(np.asarray(vc).real, v, 10)
+        assert_almost_equal(np.asarray(Fc).real, np.asarray(F), 10)
+        assert_almost_equal(llfc.real, llf, 10)
+
+
+def test_fit_arma_batch():
+    from statsmodels.tsa.arima_model import fit_arma_batch
+    np.random.seed(98765)
+    nobs = 150
+    endog = np.column_stack([arma_generate_sample([1, -.5], [1, .3], nobs)
+                             for _ in range(4)]) + 2.
+    # ragged panel
+    endog[:10, 1] = np.nan
+    endog[-20:, 2] = np.nan
+    res = fit_arma_batch(endog, (1, 1))
+    assert_(res.params.shape == (4, 3))
+    assert_equal(res.nobs, [150, 140, 130, 150])
+    assert_(res.converged.all())
+
+    for i in range(4):
+        y = endog[:, i][~np.isnan(endog[:, i])]
+        res1 = ARMA(y, (1, 1)).fit(disp=-1)
+        assert_almost_equal(res.params[i], res1.params, 8)
+        assert_almost_equal(res.llf[i], res1.llf, 8)
+        assert_almost_equal(res.sigma2[i], res1.sigma2, 8)
+
+        # lazy results at the estimated params
+        res_i = res.get_results(i)
+        assert_almost_equal(res_i.bse, res1.bse, 6)
+        assert_almost_equal(res_i.forecast(5)[0], res1.forecast(5)[0], 8)
+
+    frame = res.summary_frame()
+    assert_equal(list(frame.columns), ['const', 'ar.L1.y', 'ma.L1.y', 'llf',
+                                       'sigma2', 'nobs', 'converged'])
+
+    # ARIMA with exog for a list of series
+    exog = [np.random.randn(nobs, 1), np.random.randn(nobs - 10, 1)]
+    series = [endog[:, 0], endog[10:, 1]]
+    res = fit_arma_batch(series, (1, 1, 0), exog=exog, method='css')
+    res1 = ARIMA(series[1], (1, 1, 0), exog=exog[1]).fit(method='css',
+                                                          disp=-1)
+    assert_almost_equal(res.params[1], res1.params, 8)
+    assert_almost_equal(res.get_results(1).llf, res1.llf, 8)
+    assert_(res.get_results(1).k_diff == 1)
+
+    endog[50, 3] = np.nan
+    assert_raises(ValueError, fit_arma_batch, endog, (1, 1))
+
+
 @dec.skipif(not have_matplotlib)
 def test_plot_predict():
     from statsmodels.datasets.sunspots import load_pandas
@@ -1,7 +1,7 @@
 from statsmodels.compat.python import lrange
 from statsmodels.tsa.stattools import (adfuller, acf, pacf_ols, pacf_yw,
                                                pacf, grangercausalitytests,
-                                               coint, acovf,
+                                               coint, acovf, ccovf, ccf,
                                                arma_order_select_ic)
 from statsmodels.tsa.base.datetools import dates_from_range
 import numpy as np
@@ -268,6 +268,34 @@ def test_acovf_fft_vs_convolution():
             F2 = acovf(q, demean=demean, unbiased=unbiased, fft=False)
             assert_almost_equal(F1, F2, decimal=7)
 
+def test_acovf_nlag():
+    np.random.seed(1)
+    q = np.random.normal(size=101).cumsum()
+
+    for unbiased in [True, False]:
+        full = acovf(q, unbiased=unbiased)
+        assert_equal(len(full), 101)
+        for fft in [True, False]:
+            for nlag in [0, 1, 10, 100, 150]:
+                res = acovf(q, unbiased=unbiased, fft=fft, nlag=nlag)
+                assert_equal(len(res), min(nlag, 100) + 1)
+                assert_almost_equal(res, full[:len(res)], decimal=8)
+
+def test_ccovf_nlag():
+    np.random.seed(1)
+    x = np.random.normal(size=50)
+    y = np.roll(x, 2) + np.random.normal(size=50)
+    # direct evaluation of the definition
+    xo, yo = x - x.mean(), y - y.mean()
+    expected = np.array([np.dot(xo[k:], yo[:50 - k]) / (50. - k)
+                         for k in range(50)])
+    assert_almost_equal(ccovf(x, y), expected, decimal=10)
+    for fft in [True, False]:
+        assert_almost_equal(ccovf(x, y, fft=fft, nlag=5), expected[:6],
+                            decimal=10)
+        assert_almost_equal(ccf(x, y, fft=fft, nlag=5),
+                            expected[:6] / (x.std() * y.std()), decimal=10)
+
 @dec.slow
 def test_arma_order_select_ic():
     # smoke test, assumes info-criteria are right
@@ -310,6 +338,39 @@ def test_arma_order_select_ic():
     assert_(res.aic.columns.equals(aic.columns))
     assert_equal(res.aic_min_order, (1, 2))
 
+    # exact MLE only for the best orders of the css screening
+    res = arma_order_select_ic(y, ic=['aic', 'bic'], trend='nc',
+                               screen='css', n_screen=4)
+    for res_ic, res_screen, ic in [(res.aic, res.aic_screen, aic),
+                                   (res.bic, res.bic_screen, bic)]:
+        kept = np.isfinite(res_ic.values)
+        assert_(kept.sum() >= 4)
+        assert_almost_equal(res_ic.values[kept], ic.values[kept], 5)
+        assert_equal(np.isfinite(res_screen.values).sum(), 14)
+    assert_equal(res.aic_min_order, (1, 2))
+    assert_equal(res.bic_min_order, (1, 2))
+
+    res = arma_order_select_ic(y, ic='bic', trend='nc', screen='hr',
+                               n_screen=3, n_jobs=2)
+    kept = np.isfinite(res.bic.values)
+    assert_equal(kept.sum(), 3)
+    assert_almost_equal(res.bic.values[kept], bic.values[kept], 5)
+
+def test_arma_hr_results():
+    # the model is in the same state as after a css fit
+    from statsmodels.tsa.arima_process import arma_generate_sample
+    from statsmodels.tsa.arima_model import ARMA
+    from statsmodels.tsa.stattools import _arma_hr_results
+    np.random.seed(2014)
+    y = arma_generate_sample([1, -.75], [1, .35], 250)
+    res = _arma_hr_results(y, (1, 1), {}, 'c')
+    res_css = ARMA(y, (1, 1)).fit(method='css', disp=0)
+    assert_equal(res.model.exog_names, res_css.model.exog_names)
+    assert_equal(res.model.nobs, res_css.model.nobs)
+    assert_equal(res.model.k_trend, 1)
+    assert_equal(len(res.params), 4)
+    assert_(_arma_hr_results(y, (0, 0), {}, 'nc') is None)
+
 def test_arma_order_select_ic_failure():
     # this should trigger an SVD convergence failure, smoke test that it
     # returns, likely platform dependent failure...
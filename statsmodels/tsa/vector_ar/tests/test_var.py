@@ -557,6 +557,76 @@ def test_get_trendorder():
     for t, trendorder in iteritems(results):
         assert(util.get_trendorder(t) == trendorder)
 
+def test_irf_resim():
+    mdata = sm.datasets.macrodata.load().data
+    data = np.column_stack([mdata[name] for name in
+                            ['realgdp', 'realcons', 'realinv']])
+    data = np.diff(np.log(data), axis=0)
+    res = VAR(data).fit(maxlags=2)
+
+    # compare with a VAR fit to each simulated sample
+    seeds = [12345, 678]
+    nobs, burn = res.nobs, 50
+    chol_u = np.linalg.cholesky(res.sigma_u)
+    for orth in [False, True]:
+        irfs = model._simulate_irfs(seeds, res.coefs, res.intercept,
+                                    res.sigma_u, nobs, 8, burn=burn,
+                                    orth=orth, cum=True)
+        for i, seed in enumerate(seeds):
+            rs = np.random.RandomState(seed)
+            ugen = np.dot(rs.standard_normal((nobs + burn, 3)), chol_u.T)
+            sim = np.zeros((nobs + burn, 3))
+            sim[2:] = res.intercept + ugen[2:]
+            for t in range(2, nobs + burn):
+                sim[t] += (np.dot(res.coefs[0], sim[t-1]) +
+                           np.dot(res.coefs[1], sim[t-2]))
+            res_sim = VAR(sim[burn:]).fit(maxlags=2)
+            if orth:
+                irf = res_sim.orth_ma_rep(maxn=8)
+            else:
+                irf = res_sim.ma_rep(maxn=8)
+            assert_almost_equal(irfs[i], irf.cumsum(axis=0), 10)
+
+    sims = res.irf_resim(repl=40, T=5, seed=987)
+    assert_equal(sims.shape, (40, 6, 3, 3))
+    assert_equal(res.irf_resim(repl=40, T=5, seed=987), sims)
+    lower, upper = res.irf_errband_mc(repl=40, T=5, seed=987)
+    assert_equal(lower, np.sort(sims, axis=0)[0])
+    assert_equal(upper, np.sort(sims, axis=0)[38])
+
+def test_select_order_nested():
+    mdata = sm.datasets.macrodata.load().data
+    data = np.column_stack([mdata[name] for name in
+                            ['realgdp', 'realcons', 'realinv']])
+    data = np.diff(np.log(data), axis=0)
+    maxlags = 6
+    model = VAR(data)
+    selections, ics = model.select_order(maxlags, verbose=False,
+                                         full_output=True)
+    for p in range(maxlags + 1):
+        # same sample for all lag orders
+        res = model._estimate_var(p, offset=maxlags - p)
+        for k, v in iteritems(res.info_criteria):
+            assert_almost_equal(ics[k][p], v, DECIMAL_12)
+    for k, v in iteritems(ics):
+        assert_equal(selections[k], np.argmin(v))
+
+def test_select_order_short_series():
+    # lagged design with more columns than observations falls back to
+    # estimating each lag order
+    np.random.seed(12345)
+    data = np.random.randn(30, 3)
+    maxlags = 9
+    model = VAR(data)
+    selections, ics = model.select_order(maxlags, verbose=False,
+                                         full_output=True)
+    for p in range(maxlags + 1):
+        res = model._estimate_var(p, offset=maxlags - p)
+        for k, v in iteritems(res.info_criteria):
+            assert_almost_equal(ics[k][p], v, DECIMAL_12)
+    for k, v in iteritems(ics):
+        assert_equal(selections[k], np.argmin(v))
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=[__file__,'-vvs','-x','--pdb', '--pdb-failure'],
@@ -31,12 +31,65 @@ import statsmodels.tsa.vector_ar.plotting as plotting
 import statsmodels.tsa.vector_ar.util as util
 import statsmodels.tsa.base.tsa_model as tsbase
 import statsmodels.base.wrapper as wrap
+from statsmodels.tools.parallel import parallel_func
 
 mat = np.array
 
 #-------------------------------------------------------------------------------
 # VAR process routines
 
+def _nested_var_ic(y, maxlags, trend='c'):
+    """
+    Information criteria of the VAR(p) models p = 0, ..., maxlags
+
+    All models are estimated by OLS on the observations after the first
+    `maxlags`. The regressors of the VAR(p) are the first k_trend + neqs * p
+    columns of the design for `maxlags`, so the residual cross-products of
+    all models follow from one QR decomposition.
+
+    The design needs at least as many rows as columns, otherwise the QR
+    decomposition does not identify the models with the highest lags.
+
+    Returns
+    -------
+    ics : dict {info_crit -> array}
+        Same definitions as `VARResults.info_criteria`
+    """
+    k_trend = util.get_trendorder(trend)
+    neqs = y.shape[1]
+    z = util.get_var_endog(y, maxlags, trend=trend)
+    y_sample = y[maxlags:]
+    nobs = len(y_sample)
+
+    q, r = np.linalg.qr(z)
+    b = np.dot(q.T, y_sample)
+    resid = y_sample - np.dot(q, b)
+    sse = np.dot(resid.T, resid)
+
+    ics = defaultdict(list)
+    # add back the contribution of the omitted lags, highest lag first
+    for p in range(maxlags, -1, -1):
+        k = k_trend + neqs * p
+        if p < maxlags:
+            b_p = b[k:k + neqs]
+            sse = sse + np.dot(b_p.T, b_p)
+
+        ld = util.get_logdet(sse / nobs)
+        free_params = p * neqs ** 2 + neqs * k_trend
+        df_model = neqs * p + k_trend
+        df_resid = nobs - df_model
+
+        # See Lutkepohl pp. 146-150
+        ics['aic'].append(ld + (2. / nobs) * free_params)
+        ics['bic'].append(ld + (np.log(nobs) / nobs) * free_params)
+        ics['hqic'].append(ld + (2. * np.log(np.log(nobs)) / nobs) *
+                           free_params)
+        ics['fpe'].append(((nobs + df_model) / df_resid) ** neqs *
+                          np.exp(ld))
+
+    return dict((k, mat(v[::-1])) for k, v in iteritems(ics))
+
+
 def ma_rep(coefs, maxn=10):
     r"""
     MA(\infty) representation of VAR(p) process
@@ -235,6 +288,79 @@ def forecast_cov(ma_coefs, sig_u, steps):
 
     return forc_covs
 
+def _simulate_irfs(seeds, coefs, intercept, sigma_u, nobs, T, burn=100,
+                   orth=False, cum=False):
+    """
+    Impulse responses of VAR(p) models estimated on simulated data
+
+    One replication is simulated for each seed. All replications are
+    simulated as one array, and the VAR(p) with a constant is estimated for
+    all replications by OLS from the stacked normal equations.
+
+    Parameters
+    ----------
+    seeds : array
+        Seed of the random number generator for each replication
+    coefs : ndarray (p x k x k)
+    intercept : ndarray (k)
+    sigma_u : ndarray (k x k)
+    nobs : int
+        Number of observations of each simulated sample after `burn`
+    T : int
+        Number of impulse response periods
+    burn : int
+        Number of initial simulated observations to discard
+    orth : bool
+        Orthogonalized impulse responses
+    cum : bool
+        Cumulative impulse responses
+
+    Returns
+    -------
+    irfs : ndarray (repl x T + 1 x k x k)
+    """
+    p, k, k = coefs.shape
+    repl = len(seeds)
+    steps = nobs + burn
+
+    # simulate as util.varsim with zero presample values
+    ugen = np.array([np.random.RandomState(seed).standard_normal((steps, k))
+                     for seed in seeds])
+    ugen = np.dot(ugen, chol(sigma_u).T)
+    sim = np.zeros((repl, steps, k))
+    sim[:, p:] = intercept + ugen[:, p:]
+    for t in range(p, steps):
+        for j in range(p):
+            sim[:, t] += np.dot(sim[:, t-j-1], coefs[j].T)
+    sim = sim[:, burn:]
+
+    # OLS for each replication, z as in util.get_var_endog
+    avobs = nobs - p
+    z = np.concatenate([np.ones((repl, avobs, 1))] +
+                       [sim[:, p-j-1:nobs-j-1] for j in range(p)], axis=2)
+    y_sample = sim[:, p:]
+    zz = np.einsum('rti,rtj->rij', z, z)
+    params = solve(zz, np.einsum('rti,rtj->rij', z, y_sample))
+    est_coefs = params[:, 1:].reshape((repl, p, k, k)).swapaxes(2, 3)
+
+    # MA representation as in ma_rep for each replication
+    irfs = np.zeros((repl, T + 1, k, k))
+    irfs[:, 0] = np.eye(k)
+    for i in range(1, T + 1):
+        for j in range(1, min(i, p) + 1):
+            irfs[:, i] += np.einsum('rij,rjl->ril', irfs[:, i-j],
+                                    est_coefs[:, j-1])
+
+    if orth:
+        resid = y_sample - np.einsum('rti,rij->rtj', z, params)
+        df_resid = avobs - (k * p + 1)
+        sigma = np.einsum('rti,rtj->rij', resid, resid) / df_resid
+        irfs = np.einsum('rtij,rjl->rtil', irfs, npl.cholesky(sigma))
+    if cum:
+        irfs = irfs.cumsum(axis=1)
+    return irfs
+
+
 def var_loglike(resid, omega, nobs):
     r"""
     Returns the value of the VAR(p) log-likelihood.
@@ -486,7 +612,7 @@ class VAR(tsbase.TimeSeriesModel):
                           trend=trend, dates=self.data.dates, model=self)
         return VARResultsWrapper(varfit)
 
-    def select_order(self, maxlags=None, verbose=True):
+    def select_order(self, maxlags=None, verbose=True, full_output=False):
         """
         Compute lag order selections based on each of the available information
         criteria
@@ -497,29 +623,50 @@ class VAR(tsbase.TimeSeriesModel):
             if None, defaults to 12 * (nobs/100.)**(1./4)
         verbose : bool, default True
             If True, print table of info criteria and selected orders
+        full_output : bool, default False
+            If True, the information criteria for all lag orders are also
+            returned.
 
         Returns
         -------
         selections : dict {info_crit -> selected_order}
+        ics : dict {info_crit -> array}
+            Only returned if `full_output` is True. The value of each
+            information criterion for the lag orders 0, ..., maxlags.
+
+        Notes
+        -----
+        All lag orders are estimated on the same sample, so the models are
+        nested in the regression on the `maxlags` lags. The residual
+        cross-products of all models are obtained from a single QR
+        decomposition of the lagged design for `maxlags`. If that design
+        has fewer observations than columns, each lag order is estimated
+        separately instead.
         """
         if maxlags is None:
             maxlags = int(round(12*(len(self.endog)/100.)**(1/4.)))
 
-        ics = defaultdict(list)
-        for p in range(maxlags + 1):
-            # exclude some periods to same amount of data used for each lag
-            # order
-            result = self._estimate_var(p, offset=maxlags-p)
+        k_trend = util.get_trendorder('c')
+        if len(self.y) - maxlags >= k_trend + self.neqs * maxlags:
+            ics = _nested_var_ic(self.y, maxlags, trend='c')
+        else:
+            ics = defaultdict(list)
+            for p in range(maxlags + 1):
+                # exclude some periods to same amount of data used for each
+                # lag order
+                result = self._estimate_var(p, offset=maxlags-p)
 
-            for k, v in iteritems(result.info_criteria):
-                ics[k].append(v)
+                for k, v in iteritems(result.info_criteria):
+                    ics[k].append(v)
+            ics = dict((k, mat(v)) for k, v in iteritems(ics))
 
-        selected_orders = dict((k, mat(v).argmin())
-                               for k, v in iteritems(ics))
+        selected_orders = dict((k, v.argmin()) for k, v in iteritems(ics))
 
         if verbose:
             output.print_ic_table(ics, selected_orders)
 
+        if full_output:
+            return selected_orders, ics
         return selected_orders
 
 class VARProcess(object):
@@ -1063,7 +1210,8 @@ class VARResults(VARProcess):
 
     #Monte Carlo irf standard errors
     def irf_errband_mc(self, orth=False, repl=1000, T=10,
-                       signif=0.05, seed=None, burn=100, cum=False):
+                       signif=0.05, seed=None, burn=100, cum=False,
+                       n_jobs=1):
         """
         Compute Monte Carlo integrated error bands assuming normally
         distributed for impulse response functions
@@ -1084,45 +1232,24 @@ class VARResults(VARProcess):
             number of initial observations to discard for simulation
         cum: bool, default False
             produce cumulative irf error bands
+        n_jobs: int
+            Number of processes for the replications. -1 uses all CPU cores.
+            Default is 1. Requires joblib.
 
         Notes
         -----
         Lutkepohl (2005) Appendix D
 
+        The VAR with a constant is estimated for all replications at once,
+        see `irf_resim`.
+
         Returns
         -------
         Tuple of lower and upper arrays of ma_rep monte carlo standard errors
 
         """
-        neqs = self.neqs
-        mean = self.mean()
-        k_ar = self.k_ar
-        coefs = self.coefs
-        sigma_u = self.sigma_u
-        intercept = self.intercept
-        df_model = self.df_model
-        nobs = self.nobs
-
-        ma_coll = np.zeros((repl, T+1, neqs, neqs))
-
-        if (orth == True and cum == True):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              orth_ma_rep(maxn=T).cumsum(axis=0)
-        elif (orth == True and cum == False):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              orth_ma_rep(maxn=T)
-        elif (orth == False and cum == True):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              ma_rep(maxn=T).cumsum(axis=0)
-        elif (orth == False and cum == False):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              ma_rep(maxn=T)
-
-        for i in range(repl):
-            #discard first hundred to eliminate correct for starting bias
-            sim = util.varsim(coefs, intercept, sigma_u, steps=nobs+burn)
-            sim = sim[burn:]
-            ma_coll[i,:,:,:] = fill_coll(sim)
+        ma_coll = self.irf_resim(orth=orth, repl=repl, T=T, seed=seed,
+                                 burn=burn, cum=cum, n_jobs=n_jobs)
 
         ma_sort = np.sort(ma_coll, axis=0) #sort to get quantiles
         index = round(signif/2*repl)-1,round((1-signif/2)*repl)-1
@@ -1131,7 +1258,7 @@ class VARResults(VARProcess):
         return lower, upper
 
     def irf_resim(self, orth=False, repl=1000, T=10,
-                      seed=None, burn=100, cum=False):
+                      seed=None, burn=100, cum=False, n_jobs=1):
 
         """
         Simulates impulse response function, returning an array of simulations.
@@ -1153,50 +1280,40 @@ class VARResults(VARProcess):
             number of initial observations to discard for simulation
         cum: bool, default False
             produce cumulative irf error bands
+        n_jobs: int
+            Number of processes for the replications. -1 uses all CPU cores.
+            Default is 1. Requires joblib.
 
         Notes
         -----
         Sims, Christoper A., and Tao Zha. 1999. "Error Bands for Impulse Response." Econometrica 67: 1113-1155.
 
+        All replications are simulated as one array and the VAR with a
+        constant is estimated for each replication by least squares on the
+        stacked data, instead of creating a VAR model for each replication.
+        Each replication draws from its own seed, so the results for a
+        given `seed` do not depend on `n_jobs`.
+
         Returns
         -------
         Array of simulated impulse response functions
 
         """
-        neqs = self.neqs
-        mean = self.mean()
-        k_ar = self.k_ar
-        coefs = self.coefs
-        sigma_u = self.sigma_u
-        intercept = self.intercept
-        df_model = self.df_model
-        nobs = self.nobs
         if seed is not None:
             np.random.seed(seed=seed)
-
-        ma_coll = np.zeros((repl, T+1, neqs, neqs))
-
-        if (orth == True and cum == True):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              orth_ma_rep(maxn=T).cumsum(axis=0)
-        elif (orth == True and cum == False):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              orth_ma_rep(maxn=T)
-        elif (orth == False and cum == True):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              ma_rep(maxn=T).cumsum(axis=0)
-        elif (orth == False and cum == False):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              ma_rep(maxn=T)
-
-        for i in range(repl):
-            #discard first hundred to eliminate correct for starting bias
-            sim = util.varsim(coefs, intercept, sigma_u, steps=nobs+burn)
-            sim = sim[burn:]
-            ma_coll[i,:,:,:] = fill_coll(sim)
-
-        return ma_coll
-
+        seeds = np.random.randint(0, np.iinfo(np.int32).max, size=repl)
+        args = (self.coefs, self.intercept, self.sigma_u, self.nobs, T, burn,
+                orth, cum)
+
+        if n_jobs != 1:
+            parallel, p_func, n_jobs = parallel_func(_simulate_irfs, n_jobs,
+                                                     verbose=0)
+        if n_jobs == 1:
+            return _simulate_irfs(seeds, *args)
+
+        chunks = np.array_split(seeds, min(n_jobs, repl))
+        return np.concatenate(parallel(p_func(chunk, *args)
+                                       for chunk in chunks))
 
     def _omega_forc_cov(self, steps):
         # Approximate MSE matrix \Omega(h) as defined in Lut p97